@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de production des aperçus des grilles.
+    Un aperçu est une image SVG ou PNG d'une grille, produite sans fenêtre ni document pdf:
+    les cases sont dessinées par des rectangles et des traits, les valeurs affichées étant celles saisies par le joueur, ou la solution.
+
+    Les aperçus sont conservés, indexés par l'empreinte de leur grille: une même grille n'est dessinée qu'une fois.
+    Seuls les TAILLE_CACHE_APERCUS derniers aperçus utilisés sont gardés en mémoire. Ils peuvent aussi être enregistrés
+    dans le dossier CHEMIN_DOSSIER_APERCUS, sous le nom de leur empreinte, pour être servis directement.
+
+    Contient les fonctions suivantes:
+        - empreinte: retourne l'empreinte d'une grille
+        - svg, png: retournent l'aperçu d'une grille
+        - enregistrer: enregistre l'aperçu d'une grille dans un fichier et retourne son chemin
+        - vider: oublie les aperçus conservés
+
+    Modules importés:
+        - io: utilisé pour écrire les images PNG en mémoire
+        - os: utilisé pour créer le dossier des aperçus
+        - hashlib: utilisé pour calculer l'empreinte des grilles
+        - collections: utilisé pour conserver les aperçus dans l'ordre de leur dernière utilisation
+        - threading: utilisé pour protéger le cache lorsque les aperçus sont produits par plusieurs fils d'exécution
+        - pygame: utilisé pour dessiner les images PNG, sans créer de fenêtre
+        - cases: utilisé pour déterminer le type des cases à dessiner
+        - serialisation: utilisé pour calculer l'empreinte des grilles
+        - ressources: utilisé pour obtenir les polices sans les recharger
+        - constantes: utilisé dans toutes les fonctions
+"""
+
+import io
+import os
+import hashlib
+import collections
+import threading
+import pygame
+import cases
+import serialisation
+import ressources
+from constantes import *
+
+# Aperçus déjà produits, indexés par format et empreinte
+_apercus = collections.OrderedDict()
+_verrou = threading.RLock()
+
+
+def empreinte(grille, solution=False, cote=COTE_CASE_APERCU):
+    """ Retourne l'empreinte hexadécimale de la grille passée en paramètre, et des options de son aperçu """
+    donnees = serialisation.encoder(grille._grid, grille.nb_colonne, grille.nb_ligne)
+    return hashlib.sha1(donnees + b"%d %d" % (solution, cote)).hexdigest()
+
+
+def svg(grille, solution=False, cote=COTE_CASE_APERCU):
+    """ Retourne le texte de l'aperçu SVG de la grille passée en paramètre, chaque case ayant un côté de cote pixels.
+        Si solution vaut True, les cases vides contiennent leur solution, sinon la valeur saisie par le joueur.
+    """
+    return _apercu("svg", _dessiner_svg, grille, solution, cote)
+
+
+def png(grille, solution=False, cote=COTE_CASE_APERCU):
+    """ Retourne le contenu de l'aperçu PNG de la grille passée en paramètre, chaque case ayant un côté de cote pixels.
+        Si solution vaut True, les cases vides contiennent leur solution, sinon la valeur saisie par le joueur.
+    """
+    return _apercu("png", _dessiner_png, grille, solution, cote)
+
+
+def enregistrer(grille, format="svg", solution=False, cote=COTE_CASE_APERCU, dossier=CHEMIN_DOSSIER_APERCUS):
+    """ Retourne le chemin du fichier contenant l'aperçu de la grille passée en paramètre, au format donné (un format de FORMATS_APERCU).
+        Le fichier, nommé par l'empreinte de la grille, n'est écrit que s'il n'existe pas déjà.
+    """
+    chemin = os.path.join(dossier, empreinte(grille, solution, cote) + "." + format)
+    if not os.path.exists(chemin):
+        if not os.path.isdir(dossier):
+            os.makedirs(dossier)
+        contenu = svg(grille, solution, cote).encode("utf-8") if format == "svg" else png(grille, solution, cote)
+        with open(chemin, "wb") as fichier:
+            fichier.write(contenu)
+    return chemin
+
+
+def vider():
+    """ Oublie l'ensemble des aperçus conservés en mémoire """
+    with _verrou:
+        _apercus.clear()
+
+
+def _apercu(format, dessiner, grille, solution, cote):
+    """ Retourne l'aperçu conservé pour la grille au format passé en paramètre, en le dessinant avec la fonction dessiner s'il n'existe pas.
+        Lorsque plus de TAILLE_CACHE_APERCUS aperçus sont conservés, le moins récemment utilisé est oublié.
+    """
+    cle = (format, empreinte(grille, solution, cote))
+    with _verrou:
+        if cle in _apercus:
+            _apercus.move_to_end(cle)
+            return _apercus[cle]
+
+    contenu = dessiner(grille, solution, cote)
+    with _verrou:
+        _apercus[cle] = contenu
+        if len(_apercus) > TAILLE_CACHE_APERCUS:
+            _apercus.popitem(last=False)
+    return contenu
+
+
+def _valeur(case, solution):
+    """ Retourne le texte de la valeur affichée dans la case vide passée en paramètre, ou une chaine vide """
+    valeur = case._solution_case if solution else case.valeur_saisie
+    return str(valeur) if VALEUR_MIN <= valeur <= VALEUR_MAX else ""
+
+
+def _couleur_svg(couleur):
+    """ Retourne la couleur (r, g, b) passée en paramètre au format SVG """
+    return "rgb({},{},{})".format(*couleur)
+
+
+def _dessiner_svg(grille, solution, cote):
+    """ Retourne le texte SVG de la grille passée en paramètre """
+    largeur, hauteur = grille.nb_colonne * cote, grille.nb_ligne * cote
+    taille_indicatrice, taille_valeur = cote * PROPORTION_INDICATRICE_APERCU, cote * PROPORTION_VALEUR_APERCU
+
+    elements = ['<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="{1}" viewBox="0 0 {0} {1}">'.format(largeur, hauteur),
+                '<rect width="{}" height="{}" fill="{}"/>'.format(largeur, hauteur, _couleur_svg(COULEUR_CASE_VIDE_APERCU)),
+                '<g font-family="sans-serif" stroke="{}" stroke-width="{}">'.format(_couleur_svg(COULEUR_TRAIT_APERCU), EPAISSEUR_TRAIT_APERCU)]
+
+    for (i, j), case in grille.items():
+        x, y = i * cote, j * cote
+        if type(case) is cases.Indicatrice:
+            elements.append('<rect x="{}" y="{}" width="{}" height="{}" fill="{}"/>'.format(x, y, cote, cote, _couleur_svg(COULEUR_INDICATRICE_APERCU)))
+            elements.append('<line x1="{}" y1="{}" x2="{}" y2="{}"/>'.format(x, y, x + cote, y + cote))
+            if case.valeur_droite:
+                elements.append('<text x="{:g}" y="{:g}" font-size="{:g}" stroke="none">{}</text>'.format(
+                    x + cote * 0.55, y + cote * 0.4, taille_indicatrice, case.valeur_droite))
+            if case.valeur_bas:
+                elements.append('<text x="{:g}" y="{:g}" font-size="{:g}" stroke="none">{}</text>'.format(
+                    x + cote * 0.1, y + cote * 0.9, taille_indicatrice, case.valeur_bas))
+        elif type(case) is cases.CaseVide:
+            valeur = _valeur(case, solution)
+            elements.append('<rect x="{}" y="{}" width="{}" height="{}" fill="none"/>'.format(x, y, cote, cote))
+            if valeur:
+                elements.append('<text x="{:g}" y="{:g}" font-size="{:g}" text-anchor="middle" stroke="none">{}</text>'.format(
+                    x + cote / 2, y + cote * 0.75, taille_valeur, valeur))
+        else:
+            elements.append('<rect x="{}" y="{}" width="{}" height="{}" fill="{}"/>'.format(x, y, cote, cote, _couleur_svg(COULEUR_CASE_NOIRE_APERCU)))
+
+    elements.append("</g></svg>")
+    return "\n".join(elements)
+
+
+def _dessiner_png(grille, solution, cote):
+    """ Retourne le contenu PNG de la grille passée en paramètre, dessinée sur une surface pygame sans fenêtre """
+    surface = pygame.Surface((grille.nb_colonne * cote, grille.nb_ligne * cote))
+    surface.fill(COULEUR_CASE_VIDE_APERCU)
+    font_indicatrice = ressources.police(max(1, round(cote * PROPORTION_INDICATRICE_APERCU)))
+    font_valeur = ressources.police(max(1, round(cote * PROPORTION_VALEUR_APERCU)))
+
+    for (i, j), case in grille.items():
+        rect = pygame.Rect(i * cote, j * cote, cote, cote)
+        if type(case) is cases.Indicatrice:
+            surface.fill(COULEUR_INDICATRICE_APERCU, rect)
+            pygame.draw.line(surface, COULEUR_TRAIT_APERCU, rect.topleft, rect.bottomright, EPAISSEUR_TRAIT_APERCU)
+            if case.valeur_droite:
+                font_indicatrice.render_to(surface, (rect.x + cote * 0.55, rect.y + cote * 0.1), str(case.valeur_droite), COULEUR_TRAIT_APERCU)
+            if case.valeur_bas:
+                font_indicatrice.render_to(surface, (rect.x + cote * 0.1, rect.y + cote * 0.55), str(case.valeur_bas), COULEUR_TRAIT_APERCU)
+        elif type(case) is cases.CaseVide:
+            valeur = _valeur(case, solution)
+            if valeur:
+                zone = font_valeur.get_rect(valeur)
+                zone.center = rect.center
+                font_valeur.render_to(surface, zone, valeur, COULEUR_TRAIT_APERCU)
+        else:
+            surface.fill(COULEUR_CASE_NOIRE_APERCU, rect)
+
+    for j in range(grille.nb_ligne + 1):
+        pygame.draw.line(surface, COULEUR_TRAIT_APERCU, (0, j * cote), (grille.nb_colonne * cote, j * cote), EPAISSEUR_TRAIT_APERCU)
+    for i in range(grille.nb_colonne + 1):
+        pygame.draw.line(surface, COULEUR_TRAIT_APERCU, (i * cote, 0), (i * cote, grille.nb_ligne * cote), EPAISSEUR_TRAIT_APERCU)
+
+    contenu = io.BytesIO()
+    pygame.image.save(surface, contenu, "apercu.png")
+    return contenu.getvalue()
@@ -0,0 +1,266 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de mesure des performances des modes de résolution.
+    Les modes "SLOW" (baseSolver), "MEDIUM" et "FAST" (solver et postTreatment) du Resolveur sont exécutés sur un corpus fixe de grilles,
+    enregistré dans le dossier CHEMIN_DOSSIER_CORPUS_BENCHMARK au format du module texte, un fichier par difficulté.
+
+    Chaque grille est résolue plusieurs fois dans chaque mode, le hasard étant initialisé par une graine fixe avant chaque exécution.
+    La durée allouée à une résolution dépend du mode (DELAIS_BENCHMARK), les modes lents demandant plus de temps sur les mêmes grilles.
+    Les mesures sont regroupées par mode, difficulté et dimensions de la grille: nombre d'exécutions, de grilles résolues, d'exécutions arrêtées
+    faute de temps et d'erreurs, durée médiane et au 95e centile, nombre médian de noeuds explorés et pic de mémoire allouée (mesuré lors d'une
+    exécution supplémentaire, tracemalloc ralentissant le calcul). Les durées et les noeuds ne portent que sur les exécutions terminées dans
+    la durée allouée: une exécution arrêtée ne mesure que l'échéance. Le 95e centile n'est donné qu'à partir de ECHANTILLONS_CENTILE_BENCHMARK
+    exécutions terminées, en deçà il ne serait que le maximum. Une exception levée par le calcul est comptée comme une erreur et écrite dans le journal.
+    Les mesures sont écrites dans un fichier JSON, et peuvent être comparées à une référence enregistrée: une durée médiane augmentant de plus de
+    SEUIL_REGRESSION_BENCHMARK, ou un groupe dont plus aucune exécution ne se termine, est signalé comme une régression.
+
+    La durée d'import des modules de MODULES_DEMARRAGE_BENCHMARK est aussi mesurée, dans un nouveau processus avec l'option -X importtime:
+    celle de menu correspond au chargement du jeu avant l'ouverture de sa fenêtre. Les imports les plus lents de chaque module sont rapportés,
+    et la durée médiane est comparée à la référence comme celle des résolutions.
+
+    Le module se lance en ligne de commande depuis le dossier bin: python3 benchmark.py --help
+
+    Contient les fonctions suivantes:
+        - generer_corpus, lire_corpus
+        - mesurer, executer
+        - mesurer_demarrage, executer_demarrage
+        - centile, comparer
+        - main
+
+    Modules importés:
+        - os, io, json, argparse: utilisés pour les fichiers du corpus et des résultats, et les options de lancement
+        - time, random, tracemalloc, contextlib: utilisés pour les mesures
+        - sys, subprocess: utilisés pour mesurer les imports dans un nouveau processus
+        - grille, resolveur, texte, service: utilisés pour générer, lire et résoudre les grilles dans la durée allouée
+        - diagnostic: utilisé pour profiler les résolutions sur demande et journaliser les erreurs des calculs
+        - constantes: utilisé par toutes les fonctions
+"""
+
+import os
+import io
+import json
+import argparse
+import time
+import random
+import tracemalloc
+import contextlib
+import sys
+import subprocess
+import grille
+import resolveur
+import texte
+import service
+import diagnostic
+from constantes import *
+
+
+def generer_corpus(nombre=GRILLES_PAR_DIFFICULTE_BENCHMARK, graine=GRAINE_BENCHMARK, dossier=CHEMIN_DOSSIER_CORPUS_BENCHMARK):
+    """ Génère nombre grilles par difficulté et les écrit dans le dossier du corpus, en remplaçant le corpus existant.
+        Le corpus étant enregistré avec le code, cette fonction n'est utilisée que pour le renouveler.
+    """
+    if not os.path.isdir(dossier):
+        os.makedirs(dossier)
+
+    random.seed(graine)
+    for difficulte in DIFFICULTES:
+        grilles = []
+        for k in range(nombre):
+            grilles.append(grille.Grille())
+            grilles[-1].generer_grille(difficulte)
+        texte.sauvegarder(grilles, os.path.join(dossier, difficulte + EXTENSION_CORPUS_BENCHMARK))
+
+
+def lire_corpus(difficultes=DIFFICULTES, dossier=CHEMIN_DOSSIER_CORPUS_BENCHMARK):
+    """ Retourne la liste des grilles du corpus, sous la forme de couples (difficulté, grille), pour les difficultés passées en paramètre """
+    corpus = []
+    for difficulte in difficultes:
+        chemin = os.path.join(dossier, difficulte + EXTENSION_CORPUS_BENCHMARK)
+        if os.path.exists(chemin):
+            corpus.extend((difficulte, lue) for lue in texte.charger(chemin))
+    return corpus
+
+
+def mesurer(grille_mesuree, mode, graine, delai=None, memoire=False):
+    """ Résout une copie de la grille passée en paramètre dans le mode donné, après avoir initialisé le hasard avec la graine.
+        La durée allouée est delai secondes, ou celle du mode dans DELAIS_BENCHMARK si delai vaut None.
+        Retourne un dictionnaire contenant la durée (en secondes), le nombre de noeuds explorés, si la grille a été résolue, si le calcul a été
+        arrêté faute de temps (hors_delai), l'éventuelle exception levée par le calcul (erreur, None sinon)
+        et, si memoire vaut True, le pic de mémoire allouée pendant le calcul (en octets).
+    """
+    if delai is None:
+        delai = DELAIS_BENCHMARK[mode]
+    calcul = resolveur.Resolveur(grille.Grille(grid=grille_mesuree._grid), arret=service.Echeance(delai))
+    random.seed(graine)
+    if memoire:
+        tracemalloc.start()
+
+    debut = time.perf_counter()
+    erreur = None
+    try:
+        # Les messages de diagnostic du calcul ne sont pas mesurés
+        with contextlib.redirect_stdout(io.StringIO()):
+            resolue = calcul.calculate_solution(mode)
+    except Exception as e:
+        resolue, erreur = False, repr(e)
+        diagnostic.journal.exception("Erreur de la résolution %s (graine %d)", mode, graine)
+    mesure = {"duree": time.perf_counter() - debut, "noeuds": calcul.noeuds, "resolue": bool(resolue) and not calcul.arrete(),
+              "hors_delai": erreur is None and calcul.arrete(), "erreur": erreur}
+
+    if memoire:
+        mesure["memoire"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return mesure
+
+
+def executer(modes=MODES_BENCHMARK, difficultes=DIFFICULTES, repetitions=REPETITIONS_BENCHMARK, graine=GRAINE_BENCHMARK,
+             delai=None, progression=None):
+    """ Mesure chaque mode sur chaque grille du corpus, repetitions fois, et retourne les résultats sous la forme d'un dictionnaire:
+            - parametres: les paramètres de la mesure, dont la durée allouée à chaque mode (delai pour tous les modes, ou DELAIS_BENCHMARK si delai vaut None)
+            - mesures: pour chaque groupe "mode/difficulté/colonnes x lignes", le nombre d'exécutions, de résolutions, d'exécutions hors délai et d'erreurs,
+              les durées médiane et au 95e centile (en millisecondes) et le nombre médian de noeuds des exécutions terminées (None s'il n'y en a pas,
+              ou pour le centile s'il y en a moins de ECHANTILLONS_CENTILE_BENCHMARK), et le pic de mémoire maximal (en kilo-octets)
+        Si une fonction progression est passée en paramètre, elle est appelée avec le nom du groupe après chaque exécution.
+    """
+    delais = {mode: DELAIS_BENCHMARK[mode] if delai is None else delai for mode in modes}
+    executions = {}
+    for difficulte, grille_mesuree in lire_corpus(difficultes):
+        for mode in modes:
+            groupe = "{}/{}/{}x{}".format(mode, difficulte, grille_mesuree.nb_colonne, grille_mesuree.nb_ligne)
+            for repetition in range(repetitions):
+                executions.setdefault(groupe, []).append(mesurer(grille_mesuree, mode, graine + repetition, delais[mode]))
+                if progression is not None:
+                    progression(groupe)
+            executions[groupe][-1]["memoire"] = mesurer(grille_mesuree, mode, graine, delais[mode], True)["memoire"]
+
+    mesures = {}
+    for groupe, liste in executions.items():
+        terminees = [mesure for mesure in liste if not mesure["hors_delai"] and mesure["erreur"] is None]
+        durees = [mesure["duree"] for mesure in terminees]
+        mesures[groupe] = {"executions": len(liste),
+                           "resolues": sum(mesure["resolue"] for mesure in liste),
+                           "hors_delai": sum(mesure["hors_delai"] for mesure in liste),
+                           "erreurs": sum(mesure["erreur"] is not None for mesure in liste),
+                           "mediane_ms": 1000 * centile(durees, 0.5) if durees else None,
+                           "p95_ms": 1000 * centile(durees, 0.95) if len(durees) >= ECHANTILLONS_CENTILE_BENCHMARK else None,
+                           "noeuds_median": centile([mesure["noeuds"] for mesure in terminees], 0.5) if terminees else None,
+                           "memoire_max_ko": max(mesure.get("memoire", 0) for mesure in liste) / 1024}
+
+    return {"parametres": {"modes": list(modes), "difficultes": list(difficultes), "repetitions": repetitions, "graine": graine, "delais": delais},
+            "mesures": mesures}
+
+
+def mesurer_demarrage(module):
+    """ Importe le module passé en paramètre dans un nouveau processus, et retourne la durée de l'import (en millisecondes)
+        ainsi que la liste des IMPORTS_SIGNALES_BENCHMARK imports les plus longs, sous la forme de couples (nom, durée en millisecondes).
+        La durée d'un import comprend celle des modules qu'il importe.
+    """
+    environnement = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    processus = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module], cwd=os.path.dirname(os.path.abspath(__file__)),
+                               env=environnement, capture_output=True, text=True, check=True)
+
+    # Chaque ligne est de la forme "import time: propre | cumulé | nom", en microsecondes, le nom étant indenté selon la profondeur
+    imports = []
+    for ligne in processus.stderr.splitlines():
+        if ligne.startswith("import time:") and not ligne.endswith("| imported package"):
+            propre, cumule, nom = ligne[len("import time:"):].split("|")
+            imports.append((nom.strip(), int(cumule) / 1000))
+    total = next(duree for nom, duree in reversed(imports) if nom == module)
+    imports = sorted((importe for importe in imports if importe[0] != module), key=lambda importe: importe[1], reverse=True)
+    return total, imports[:IMPORTS_SIGNALES_BENCHMARK]
+
+
+def executer_demarrage(modules=MODULES_DEMARRAGE_BENCHMARK, repetitions=REPETITIONS_BENCHMARK):
+    """ Mesure repetitions fois la durée d'import de chaque module, et retourne un dictionnaire associant à chaque groupe "import/module"
+        la durée médiane (en millisecondes) et les imports les plus longs de la dernière mesure.
+    """
+    demarrage = {}
+    for module in modules:
+        mesures = [mesurer_demarrage(module) for repetition in range(repetitions)]
+        demarrage["import/" + module] = {"mediane_ms": centile([total for total, imports in mesures], 0.5),
+                                         "plus_lents": [list(importe) for importe in mesures[-1][1]]}
+    return demarrage
+
+
+def centile(valeurs, proportion):
+    """ Retourne le centile des valeurs passées en paramètre correspondant à la proportion donnée (0.5 pour la médiane), par la méthode du rang le plus proche """
+    triees = sorted(valeurs)
+    return triees[min(len(triees) - 1, max(0, int(round(proportion * len(triees) + 0.5)) - 1))]
+
+
+def comparer(resultats, reference, seuil=SEUIL_REGRESSION_BENCHMARK):
+    """ Retourne la liste des régressions des résultats par rapport à la référence, sous la forme de triplets (groupe, médiane de référence, médiane mesurée).
+        Les résolutions et les imports sont comparés. Seuls les groupes présents dans les deux mesures, et terminés au moins une fois
+        dans la référence, sont comparés. Un groupe dont aucune exécution ne s'est terminée a une médiane mesurée None, et est toujours une régression.
+    """
+    regressions = []
+    for partie in ("mesures", "demarrage"):
+        precedentes = reference.get(partie, {})
+        for groupe, mesure in sorted(resultats.get(partie, {}).items()):
+            if groupe in precedentes and precedentes[groupe]["mediane_ms"] is not None:
+                avant = precedentes[groupe]["mediane_ms"]
+                if mesure["mediane_ms"] is None or mesure["mediane_ms"] > avant * (1 + seuil):
+                    regressions.append((groupe, avant, mesure["mediane_ms"]))
+    return regressions
+
+
+def main(arguments=None):
+    """ Lance la mesure selon les options de la ligne de commande, écrit les résultats et les compare à la référence.
+        Retourne 1 si une régression est détectée, 0 sinon.
+    """
+    options = argparse.ArgumentParser(description="Mesure des performances des modes de résolution sur le corpus de grilles")
+    options.add_argument("--modes", nargs="+", default=MODES_BENCHMARK, choices=MODES_BENCHMARK)
+    options.add_argument("--difficultes", nargs="+", default=DIFFICULTES, choices=DIFFICULTES)
+    options.add_argument("--repetitions", type=int, default=REPETITIONS_BENCHMARK)
+    options.add_argument("--graine", type=int, default=GRAINE_BENCHMARK)
+    options.add_argument("--delai", type=float, help="durée allouée à chaque résolution, en secondes (par défaut, celle du mode dans DELAIS_BENCHMARK)")
+    options.add_argument("--resultats", default=CHEMIN_RESULTATS_BENCHMARK)
+    options.add_argument("--reference", default=CHEMIN_REFERENCE_BENCHMARK)
+    options.add_argument("--seuil", type=float, default=SEUIL_REGRESSION_BENCHMARK)
+    options.add_argument("--modules", nargs="*", default=MODULES_DEMARRAGE_BENCHMARK, help="modules dont l'import est mesuré (aucun pour ne pas mesurer)")
+    options.add_argument("--enregistrer-reference", action="store_true", help="enregistre les résultats comme nouvelle référence")
+    options.add_argument("--profil", metavar="DOSSIER", help="profile les résolutions et écrit les profils dans DOSSIER")
+    options.add_argument("--generer-corpus", type=int, metavar="NOMBRE", help="renouvelle le corpus avec NOMBRE grilles par difficulté, sans mesurer")
+    options = options.parse_args(arguments)
+
+    if options.generer_corpus:
+        generer_corpus(options.generer_corpus, options.graine)
+        return 0
+
+    if options.profil:
+        diagnostic.activer_profilage(options.profil)
+    resultats = executer(options.modes, options.difficultes, options.repetitions, options.graine, options.delai)
+    diagnostic.desactiver_profilage()
+    resultats["demarrage"] = executer_demarrage(options.modules, options.repetitions)
+    for chemin in [options.resultats] + ([options.reference] if options.enregistrer_reference else []):
+        with open(chemin, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2, sort_keys=True)
+
+    print("{:<28} {:>9} {:>10} {:>7} {:>11} {:>11} {:>9} {:>11}".format("groupe", "resolues", "hors_delai", "erreurs", "mediane_ms", "p95_ms",
+                                                                         "noeuds", "memoire_ko"))
+    for groupe, mesure in sorted(resultats["mesures"].items()):
+        print("{:<28} {:>4}/{:<4} {:>10} {:>7} {:>11} {:>11} {:>9} {:>11.1f}".format(groupe, mesure["resolues"], mesure["executions"], mesure["hors_delai"],
+                                                                                     mesure["erreurs"], _afficher(mesure["mediane_ms"]),
+                                                                                     _afficher(mesure["p95_ms"]), _afficher(mesure["noeuds_median"]),
+                                                                                     mesure["memoire_max_ko"]))
+    for groupe, mesure in sorted(resultats["demarrage"].items()):
+        print("{:<28} {:>52.1f}   {}".format(groupe, mesure["mediane_ms"], ", ".join("{} {:.0f}".format(nom, duree) for nom, duree in mesure["plus_lents"])))
+
+    if options.enregistrer_reference or not os.path.exists(options.reference):
+        return 0
+    with open(options.reference, encoding="utf-8") as fichier:
+        regressions = comparer(resultats, json.load(fichier), options.seuil)
+    for groupe, avant, apres in regressions:
+        print("Régression {}: {:.1f} ms -> {} ms".format(groupe, avant, _afficher(apres)))
+    return 1 if regressions else 0
+
+
+def _afficher(valeur):
+    """ Retourne le texte d'une mesure du tableau des résultats: "-" pour une mesure absente, une décimale pour une durée """
+    if valeur is None:
+        return "-"
+    return "{:.1f}".format(valeur) if isinstance(valeur, float) else str(valeur)
+
+
+if __name__ == "__main__":
+    exit(main())
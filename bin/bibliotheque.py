@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de bibliothèque des grilles sauvegardées.
+    Les grilles sauvegardées sont enregistrées dans une base SQLite du dossier CHEMIN_DOSSIER_SAUVEGARDE, au format du module serialisation.
+    Chaque grille est associée à des métadonnées indexées (dimensions, difficulté, état de résolution, date de création, statistiques de résolution),
+    ce qui permet à l'écran de chargement de lister les grilles page par page sans parcourir le dossier.
+    Ce module possède une unique classe Bibliotheque.
+
+    Modules importés:
+        - os: utilisé pour créer le dossier de la bibliothèque et parcourir les anciennes sauvegardes
+        - time: utilisé pour dater les grilles enregistrées
+        - sqlite3: utilisé pour la base de données de la bibliothèque
+        - cases: utilisé pour déterminer si une grille est résolue
+        - serialisation: utilisé pour encoder et décoder les grilles
+        - constantes: utilisé par toutes les méthodes
+"""
+
+import os
+import time
+import sqlite3
+import cases
+import serialisation
+from constantes import *
+
+
+class Bibliotheque:
+    """ Classe modélisant la bibliothèque des grilles sauvegardées.
+        Les grilles sont identifiées par leur nom, en minuscules.
+        Les métadonnées d'une grille sont retournées sous la forme d'un dictionnaire dont les clés sont les colonnes de COLONNES_BIBLIOTHEQUE.
+        Cette classe possède 1 attribut:
+            - _connexion: la connexion à la base de données
+    """
+
+    def __init__(self, chemin=CHEMIN_BIBLIOTHEQUE):
+        """ Ouvre la base de données dont le chemin est passé en paramètre, en la créant si nécessaire """
+        dossier = os.path.dirname(chemin)
+        if dossier and not os.path.isdir(dossier):
+            os.makedirs(dossier)
+
+        self._connexion = sqlite3.connect(chemin)
+        with self._connexion:
+            self._connexion.execute("CREATE TABLE IF NOT EXISTS grilles ("
+                                    "nom TEXT PRIMARY KEY, nb_colonne INTEGER NOT NULL, nb_ligne INTEGER NOT NULL, difficulte TEXT, "
+                                    "resolue INTEGER NOT NULL DEFAULT 0, creation REAL NOT NULL, "
+                                    "resolutions INTEGER NOT NULL DEFAULT 0, meilleur_temps REAL, donnees BLOB NOT NULL)")
+            self._connexion.execute("CREATE INDEX IF NOT EXISTS grilles_creation ON grilles (creation)")
+            self._connexion.execute("CREATE INDEX IF NOT EXISTS grilles_difficulte ON grilles (difficulte, creation)")
+            self._connexion.execute("CREATE INDEX IF NOT EXISTS grilles_resolue ON grilles (resolue, creation)")
+
+    def fermer(self):
+        """ Ferme la connexion à la base de données """
+        self._connexion.close()
+
+    def enregistrer(self, nom, grille):
+        """ Enregistre la grille passée en paramètre sous le nom donné, en remplaçant une éventuelle grille du même nom.
+            La date de création et les statistiques de résolution d'une grille remplacée sont conservées: elle garde sa place dans la liste.
+        """
+        with self._connexion:
+            self._connexion.execute("INSERT INTO grilles (nom, nb_colonne, nb_ligne, difficulte, resolue, creation, donnees) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                                    "ON CONFLICT (nom) DO UPDATE SET nb_colonne = excluded.nb_colonne, nb_ligne = excluded.nb_ligne, "
+                                    "difficulte = excluded.difficulte, resolue = excluded.resolue, donnees = excluded.donnees",
+                                    (nom.lower(), grille.nb_colonne, grille.nb_ligne, grille.difficulte, Bibliotheque.resolue(grille._grid), time.time(),
+                                     serialisation.encoder(grille._grid, grille.nb_colonne, grille.nb_ligne)))
+
+    def charger(self, nom, grille):
+        """ Charge dans la grille passée en paramètre la grille enregistrée sous le nom donné.
+            Retourne True si la grille existe, False sinon.
+        """
+        ligne = self._connexion.execute("SELECT difficulte, donnees FROM grilles WHERE nom = ?", (nom.lower(),)).fetchone()
+        if ligne is None:
+            return False
+
+        grille._grid = serialisation.decoder(ligne[1])
+        grille.difficulte = ligne[0]
+        grille.nom = nom.lower()
+        return True
+
+    def lister(self, page=0, taille=TAILLE_PAGE_BIBLIOTHEQUE, difficulte=None, resolue=None):
+        """ Retourne les métadonnées des grilles de la page demandée, de la plus récente à la plus ancienne.
+            Les grilles peuvent être filtrées par difficulté et par état de résolution.
+        """
+        condition, parametres = Bibliotheque._filtre(difficulte, resolue)
+        requete = "SELECT " + ", ".join(COLONNES_BIBLIOTHEQUE) + " FROM grilles" + condition + " ORDER BY creation DESC, nom LIMIT ? OFFSET ?"
+        lignes = self._connexion.execute(requete, parametres + (taille, page * taille)).fetchall()
+        return [dict(zip(COLONNES_BIBLIOTHEQUE, ligne)) for ligne in lignes]
+
+    def compter(self, difficulte=None, resolue=None):
+        """ Retourne le nombre de grilles de la bibliothèque, filtrées par difficulté et par état de résolution """
+        condition, parametres = Bibliotheque._filtre(difficulte, resolue)
+        return self._connexion.execute("SELECT COUNT(*) FROM grilles" + condition, parametres).fetchone()[0]
+
+    def noter_resolution(self, nom, duree):
+        """ Met à jour les statistiques de résolution de la grille enregistrée sous le nom donné, résolue en duree secondes """
+        with self._connexion:
+            self._connexion.execute("UPDATE grilles SET resolue = 1, resolutions = resolutions + 1, "
+                                    "meilleur_temps = MIN(COALESCE(meilleur_temps, ?), ?) WHERE nom = ?", (duree, duree, nom.lower()))
+
+    def importer(self, dossier=CHEMIN_DOSSIER_SAUVEGARDE):
+        """ Importe dans la bibliothèque les fichiers de sauvegarde du dossier passé en paramètre, en une seule transaction.
+            Les fichiers des anciennes versions sont convertis. Les fichiers illisibles et les grilles déjà présentes sont ignorés.
+            Retourne le nombre de grilles importées.
+        """
+        if not os.path.isdir(dossier):
+            return 0
+
+        enregistrements = []
+        for fichier in os.scandir(dossier):
+            if not fichier.name.endswith(EXTENSION_FICHIER_SAUVEGARDE) or not fichier.is_file():
+                continue
+            try:
+                grid = serialisation.charger(fichier.path)
+            except Exception:
+                continue
+
+            nb_colonne, nb_ligne = serialisation.dimensions(grid)
+            nom = fichier.name[:-len(EXTENSION_FICHIER_SAUVEGARDE)].lower()
+            enregistrements.append((nom, nb_colonne, nb_ligne, Bibliotheque.resolue(grid), fichier.stat().st_mtime,
+                                    serialisation.encoder(grid, nb_colonne, nb_ligne)))
+
+        with self._connexion:
+            avant = self._connexion.total_changes
+            self._connexion.executemany("INSERT OR IGNORE INTO grilles (nom, nb_colonne, nb_ligne, resolue, creation, donnees) VALUES (?, ?, ?, ?, ?, ?)",
+                                        enregistrements)
+            return self._connexion.total_changes - avant
+
+    @staticmethod
+    def resolue(grid):
+        """ Retourne True si le dictionnaire de cases a des cases vides, et si elles contiennent toutes leur solution """
+        vides = [case for case in grid.values() if type(case) is cases.CaseVide]
+        return len(vides) > 0 and all(case.valeur_saisie == case._solution_case for case in vides)
+
+    @staticmethod
+    def _filtre(difficulte, resolue):
+        """ Retourne la clause WHERE et ses paramètres correspondant aux filtres passés en paramètre """
+        conditions, parametres = [], ()
+        if difficulte is not None:
+            conditions.append("difficulte = ?")
+            parametres += (difficulte,)
+        if resolue is not None:
+            conditions.append("resolue = ?")
+            parametres += (int(resolue),)
+
+        if conditions:
+            return " WHERE " + " AND ".join(conditions), parametres
+        return "", parametres
@@ -0,0 +1,38 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant la boucle d'événements partagée par les écrans du produit.
+
+    Plutôt que d'interroger en continu la file d'événements de pygame, un écran attend qu'un événement arrive.
+    L'attente est limitée à DELAI_ATTENTE_EVENEMENT millisecondes, pour que l'écran soit redessiné même sans action du joueur,
+    et le nombre d'images par seconde est plafonné à IMAGES_PAR_SECONDE_MAX, pour les flots d'événements comme les déplacements de souris.
+    Le temps processeur ainsi libéré profite à la génération et à la résolution des grilles en arrière-plan.
+
+    Contient la fonction suivante:
+        - evenements: attend puis retourne les événements à traiter
+
+    Modules importés:
+        - pygame: utilisé pour l'attente des événements et la limitation du nombre d'images par seconde
+        - constantes: utilisé pour les délais d'attente
+"""
+
+import pygame
+from pygame.locals import *
+from constantes import *
+
+# Horloge partagée par tous les écrans, un seul écran étant actif à la fois
+_horloge = pygame.time.Clock()
+
+
+def evenements(delai=DELAI_ATTENTE_EVENEMENT, images_par_seconde=IMAGES_PAR_SECONDE_MAX):
+    """ Retourne la liste des événements à traiter par l'écran courant.
+        La fonction attend au plus delai millisecondes l'arrivée d'un premier événement, puis y ajoute les événements déjà en file.
+        Si aucun événement n'est arrivé, la liste retournée est vide.
+        Deux appels successifs sont espacés d'au moins 1 / images_par_seconde secondes.
+    """
+    _horloge.tick(images_par_seconde)
+
+    premier = pygame.event.wait(delai)
+    if premier.type == NOEVENT:
+        return []
+    return [premier] + pygame.event.get()
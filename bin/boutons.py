@@ -8,6 +8,8 @@
     Modules importés:
        - constantes: utilisé dans chaque méthode
        - pygame: utilisé pour l'affichage du bouton, de son titre est des erreurs
+       - boucle: utilisé pour attendre les événements lors d'une saisie
+       - ressources: utilisé pour ne rendre qu'une fois les titres et les messages
 
     La classe Bouton est utilisée pour afficher un bouton cliquable sur un écran d'affichage.
     La classe BarreErreur sera utilisé dans les écrans d'éditions et de jeu pour implémenter les entraves aux règles et les erreurs de saisie.
@@ -16,6 +18,8 @@
 from constantes import *
 import pygame
 from pygame.locals import *
+import boucle
+import ressources
 
 
 class Widget:
@@ -50,16 +54,18 @@ class Bouton(Widget):
         self.titre = texte
 
     def afficher(self, fenetre, image, font_titre, position):
-        """ Affichage de l'image sur la fenetre passée en paramètre à la position spécifiée """
+        """ Affichage de l'image sur la fenetre passée en paramètre à la position spécifiée.
+            Retourne le rect de la zone dessinée.
+        """
         fenetre.blit(image, position)
         self.rect = pygame.Rect(position, (image.get_rect().width, image.get_rect().height))
-        texte = font_titre.render(self.titre, COULEUR_POLICE)[0]
+        texte = ressources.texte(font_titre, self.titre, COULEUR_POLICE)
 
         if len(self.titre) > TAILLE_TITRE_COURT:
             self.rect_texte = self.rect.move(DECALAGE_TITRE_BOUTON_LONG)
         else:
             self.rect_texte = self.rect.move(DECALAGE_TITRE_BOUTON_COURT)
-        fenetre.blit(texte, self.rect_texte)
+        return self.rect.union(fenetre.blit(texte, self.rect_texte))
 
 
 class BarreErreur:
@@ -78,10 +84,11 @@ class BarreErreur:
             Les erreurs sont affichées selon leur longueur en partant de ERREUR_POSITION_DEPART.
             On soustrait à cette valeur la longueur de l'erreur multiplié par FACTEUR_DECALAGE_ERREUR.
             L'erreur est alors correctement positionnée.
+            Retourne le rect de la zone dessinée.
         """
-        erreur = self.font_erreur.render(texte, couleur, style=pygame.freetype.STYLE_STRONG)[0]
+        erreur = ressources.texte(self.font_erreur, texte, couleur, pygame.freetype.STYLE_STRONG)
         position_x = ERREUR_POSITION_DEPART - (len(texte) * FACTEUR_DECALAGE_ERREUR)
-        fenetre.blit(erreur, (position_x, ERREUR_POSITION_Y))
+        return fenetre.blit(erreur, (position_x, ERREUR_POSITION_Y))
 
 
 class OptionEditeur(Widget):
@@ -98,7 +105,9 @@ class OptionEditeur(Widget):
         self.skew = 0
 
     def afficher(self, fenetre, image, position):
-        """ Affichage de l'image sur la fenetre passée en paramètre à la position spécifiée """
+        """ Affichage de l'image sur la fenetre passée en paramètre à la position spécifiée.
+            Retourne le rect de la zone dessinée.
+        """
         if self.is_enlarged:
             # on elargit et rote l'image
             image = pygame.transform.rotozoom(image, self.skew, 1.2)
@@ -110,6 +119,7 @@ class OptionEditeur(Widget):
 
         fenetre.blit(image, position)
         self.rect = pygame.Rect(position, (image.get_rect().width, image.get_rect().height))
+        return self.rect
 
 
 class ZoneSaisie(Widget):
@@ -131,7 +141,7 @@ class ZoneSaisie(Widget):
         if (self.rect == 0, 0):
             self.rect = pygame.Rect(position, (image.get_rect().width, image.get_rect().height))
             self.rect_saisie = self.init_rect_saisie()
-        affichage_val = font_saisie.render(self.valeur, COULEUR_POLICE)[0]
+        affichage_val = ressources.texte(font_saisie, self.valeur, COULEUR_POLICE)
         fenetre.blit(affichage_val, self.rect_saisie)
 
     def saisie(self, fenetre, font_saisie):
@@ -139,7 +149,7 @@ class ZoneSaisie(Widget):
 
         continuer = True
         while continuer:
-            for event in pygame.event.get():
+            for event in boucle.evenements():
 
                 if event.type == QUIT:
                     pygame.quit()
@@ -156,7 +166,7 @@ class ZoneSaisie(Widget):
                         continuer = False
 
                 fenetre.fill(COULEUR_FOND_CASE, self.rect_saisie)
-                affichage_val = font_saisie.render(self.valeur, COULEUR_SAISIE)[0]
+                affichage_val = ressources.texte(font_saisie, self.valeur, COULEUR_SAISIE)
                 fenetre.blit(affichage_val, self.rect_saisie)
                 pygame.display.flip()
 
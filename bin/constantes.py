@@ -15,6 +15,7 @@ import math
          - les informations sur la fenêtre principale
          - les informations sur la police du jeu
          - les informations sur les images fréquemment utilisé au cours du jeu
+         - les informations sur l'attente des événements
 """
 
 # Fenêtre principale
@@ -28,6 +29,12 @@ CHEMIN_IMAGE_ICONE = "../images/icone.png"
 CHEMIN_FICHIER_POLICE = "./calvin-regular.ttf"
 COULEUR_POLICE = (0, 0, 0)
 COULEUR_ERREUR = (255, 0, 0)
+# Nombre maximal de textes rendus conservés en mémoire par le gestionnaire de ressources
+TAILLE_CACHE_TEXTES = 512
+
+# Attente des événements: nombre maximal d'images par seconde, et délai (en millisecondes) au-delà duquel un écran est redessiné sans événement
+IMAGES_PAR_SECONDE_MAX = 60
+DELAI_ATTENTE_EVENEMENT = 250
 
 # Image
 CHEMIN_IMAGE_BOUTON = "../images/bouton.png"
@@ -154,6 +161,23 @@ TAILLE_POLICE_CASEVIDE = 45
 NB_LIGNE_GRILLE = 10
 NB_COLONNE_GRILLE = 10
 
+# Difficultés proposées au joueur
+DIFFICULTES = ("facile", "moyen", "difficile", "mdft")
+
+# Modèles de structure
+CHEMIN_FICHIER_MODELES = "../modeles/structures.txt"
+NB_MODELES_PAR_DIFFICULTE = 150
+CASE_MODELE_BLANCHE = "."
+CASE_MODELE_PLEINE = "#"
+NB_CASES_VIDES_MIN_FACILE = 30
+NB_CASES_VIDES_MIN_MOYEN = 40
+NB_CASES_VIDES_MIN_DIFFICILE = 50
+NB_CASES_VIDES_MIN_MDFT = 58
+
+# Placement des valeurs
+NB_RETOURS_MAX_PLACEMENT = 200
+NB_ESSAIS_PLACEMENT = 20
+
 
 ################ SOLUTIONS ####################
 """ La partie Solution contient:
@@ -198,6 +222,64 @@ TAILLE_POLICE_SAISIE = 35
 EXTENSION_FICHIER_SAUVEGARDE = ".rawr"
 CHEMIN_DOSSIER_SAUVEGARDE = "../Sauvegarde/"
 
+# Bibliothèque des grilles sauvegardées: base de données, nombre de grilles par page de l'écran de chargement, métadonnées listées
+CHEMIN_BIBLIOTHEQUE = CHEMIN_DOSSIER_SAUVEGARDE + "bibliotheque.db"
+TAILLE_PAGE_BIBLIOTHEQUE = 5
+COLONNES_BIBLIOTHEQUE = ("nom", "nb_colonne", "nb_ligne", "difficulte", "resolue", "creation", "resolutions", "meilleur_temps")
+
+# Pages de grilles de l'écran de chargement
+TITRE_BOUTON_PRECEDENT = "Précédent"
+TITRE_BOUTON_SUIVANT = "Suivant"
+POSITION_BOUTON_PRECEDENT = (15, 115)
+POSITION_BOUTON_SUIVANT = (15, 215)
+POSITIONS_GRILLES_BIBLIOTHEQUE = tuple((1035, 15 + 100 * k) for k in range(TAILLE_PAGE_BIBLIOTHEQUE))
+
+# Format des fichiers de sauvegarde: en-tête et numéro de la version écrite
+ENTETE_SAUVEGARDE = b"KKRO"
+VERSION_SAUVEGARDE = 1
+
+# Types de case des fichiers de sauvegarde et du corpus de grilles
+TYPE_CASE_ABSENTE = 0
+TYPE_CASE_NOIRE = 1
+TYPE_CASE_VIDE = 2
+TYPE_CASE_INDICATRICE = 3
+
+# Corpus de grilles: en-tête, version, taille de l'en-tête en octets, et nombre de grilles validées à la fois
+ENTETE_CORPUS = b"KKRC"
+VERSION_CORPUS = 1
+TAILLE_ENTETE_CORPUS = 8
+TAILLE_LOT_CORPUS = 65536
+
+# Format texte des grilles: une ligne de texte par ligne de la grille, les grilles étant séparées par une ligne vide
+# Les indicatrices sont écrites sous la forme bas\droite, les cases vides par leur valeur saisie ou leur solution
+SEPARATEUR_TEXTE = "\t"
+SEPARATEUR_INDICATRICE_TEXTE = "\\"
+CASE_NOIRE_TEXTE = "Noire"
+CASE_VIDE_TEXTE = "-1"
+JETONS_CASE_NOIRE_TEXTE = ("noire", "x", "#")
+JETONS_CASE_VIDE_TEXTE = ("-1", "0", ".", "_")
+CONTENU_SAISIE = "saisie"
+CONTENU_SOLUTION = "solution"
+
+
+############# RESERVE DE GRILLES ########################
+""" La partie réserve de grilles contient:
+        - les informations sur les fichiers de la réserve
+        - le nombre de grilles conservées pour chaque difficulté
+        - les informations sur les threads de remplissage et de préchargement
+"""
+
+CHEMIN_DOSSIER_RESERVE = "../Reserve/"
+EXTENSION_FICHIER_RESERVE = ".reserve"
+# Nombre d'octets donnant la longueur de chaque grille encodée dans un fichier de la réserve
+OCTETS_LONGUEUR_RESERVE = 4
+TAILLE_RESERVE = 10
+NB_THREADS_RESERVE = 1
+DELAI_ATTENTE_RESERVE = 1.0
+
+# Préchargement des grilles pendant l'affichage des menus
+DELAI_ATTENTE_PRECHARGEMENT = 0.5
+
 
 ################ EDITEUR ####################
 """ La partie Editeur contient les informations sur:
@@ -255,6 +337,8 @@ VALEUR_MAX = 9
         - Les messages affichées à l'écran
         - Le titre des boutons
         - La valeur du compteur de changement de message
+        - La fréquence d'affichage pendant le calcul
+        - La communication avec le calcul exécuté en arrière-plan
 """
 
 TABLEAU_MESSAGE = ["Honnêtement, allez vous chercher un café.",
@@ -274,6 +358,7 @@ TABLEAU_MESSAGE = ["Honnêtement, allez vous chercher un café.",
 
 MESSAGE_CALCUL = "Début du calcul de la grille"
 MESSAGE_SOLVABILITE = "Verification de la solvabilité de la grille"
+MESSAGE_COMPTAGE = "Comptage des solutions de la grille"
 MESSAGE_ENSEMBLES_POSSIBLES = "Calcul des ensembles de valeurs possibles"
 MESSAGE_CORRECTION_GRILLE = "Verification de la forme de la grille."
 MESSAGE_GRILLE_RESOLUE = "La grille a été résolue"
@@ -291,6 +376,20 @@ POSITION_BOUTON_SOLVEUR_COMPLEXE = (1035, 215)
 
 VAL_CHANGEMENT_MESSAGE = 750
 
+# Echantillonnage de l'affichage pendant le calcul: nombre d'images par seconde, et nombre de noeuds explorés entre deux images (0 pour désactiver l'un ou l'autre)
+IMAGES_PAR_SECONDE_SOLVEUR = 30
+NOEUDS_PAR_IMAGE_SOLVEUR = 0
+
+# Nature des messages publiés par le calcul de la solution
+CALCUL_PROGRESSION = "progression"
+CALCUL_RESULTAT = "resultat"
+CALCUL_ERREUR = "erreur"
+CALCUL_ABANDON = "abandon"
+
+# Affichage de l'avancement du calcul
+FORMAT_PROGRESSION_SOLVEUR = "{noeuds} noeuds - {noeuds_par_seconde}/s - prof. {profondeur}"
+POSITION_PROGRESSION_SOLVEUR = (15, 520)
+
 
 ################# EXCEPTIONS ###################
 """ La partie exception contient les informations sur l'ensemble des messages d'erreurs pouvant être affiché à l'écran """
@@ -307,6 +406,8 @@ MESSAGE_ERREUR_MIXTE_SAISIE = "Vous avez des valeurs incorrectes et des indicatr
 
 # Erreur de fichier
 MESSAGE_ERREUR_NOM_INCORRECT = "Le nom saisi est incorrect"
+MESSAGE_ERREUR_FORMAT_SAUVEGARDE = "Le fichier de sauvegarde est illisible"
+MESSAGE_ERREUR_FORMAT_TEXTE = "La grille texte est illisible à la ligne {}"
 
 # Erreur de solveur
 MESSAGE_ERREUR_NOSOLUTION = "la grille ne peut être résolue!"
@@ -322,3 +423,147 @@ DECALAGE_X_DROIT = 10
 DECALAGE_Y_DROIT = 6
 DECALAGE_X_BAS = 4
 DECALAGE_Y_BAS = 15
+
+# Livret: titres, disposition des grilles sur une page A4 et dimensions en millimètres
+TITRE_LIVRET = "Kakurawwr"
+TITRE_SOLUTIONS_LIVRET = "Solutions"
+FORMAT_NUMERO_GRILLE_LIVRET = "Grille {}"
+POLICE_LIVRET = "Arial"
+COLONNES_LIVRET = 2
+LIGNES_LIVRET = 3
+MARGE_LIVRET = 10
+ESPACE_LIVRET = 8
+HAUTEUR_TITRE_LIVRET = 12
+HAUTEUR_NUMERO_LIVRET = 5
+EPAISSEUR_TRAIT_LIVRET = 0.3
+COULEUR_CASE_NOIRE_LIVRET = (60, 60, 60)
+COULEUR_INDICATRICE_LIVRET = (210, 210, 210)
+# Taille des textes, en proportion du côté d'une case
+PROPORTION_INDICATRICE_LIVRET = 0.3
+PROPORTION_SOLUTION_LIVRET = 0.6
+# Livrets découpés en volumes rendus en parallèle: nombre de grilles par volume, et nom des fichiers à partir du nom du livret et du numéro
+GRILLES_PAR_VOLUME_LIVRET = 120
+FORMAT_VOLUME_LIVRET = "{}_{:03d}" + EXTENSION_FICHIER_IMPRESSION
+
+
+################## APERCUS #######################
+""" La partie aperçus contient les informations sur les images des grilles produites sans fenêtre (SVG et PNG):
+        - les dimensions et les couleurs des cases
+        - le cache des aperçus déjà produits
+"""
+
+# Dimensions en pixels, et taille des textes en proportion du côté d'une case
+COTE_CASE_APERCU = 24
+EPAISSEUR_TRAIT_APERCU = 1
+PROPORTION_INDICATRICE_APERCU = 0.35
+PROPORTION_VALEUR_APERCU = 0.7
+
+# Couleurs
+COULEUR_TRAIT_APERCU = (0, 0, 0)
+COULEUR_CASE_NOIRE_APERCU = (60, 60, 60)
+COULEUR_INDICATRICE_APERCU = (210, 210, 210)
+COULEUR_CASE_VIDE_APERCU = (255, 255, 255)
+
+# Cache: nombre d'aperçus conservés en mémoire, et dossier des aperçus enregistrés, nommés par l'empreinte de leur grille
+TAILLE_CACHE_APERCUS = 256
+CHEMIN_DOSSIER_APERCUS = "../Apercus/"
+FORMATS_APERCU = ("svg", "png")
+
+
+################## SERVICE #######################
+""" La partie service contient les informations sur le service HTTP local de génération, de résolution et de validation:
+        - l'adresse d'écoute
+        - le groupe de processus et les limites des requêtes
+        - les messages d'erreur retournés
+"""
+
+# Adresse d'écoute: le service n'est accessible que depuis la machine locale
+HOTE_SERVICE = "127.0.0.1"
+PORT_SERVICE = 8765
+
+# Groupe de processus, requêtes traitées simultanément (au-delà, les requêtes sont refusées) et taille maximale d'une requête en octets
+PROCESSUS_SERVICE = 2
+REQUETES_SIMULTANEES_SERVICE = 8
+TAILLE_REQUETE_MAX_SERVICE = 65536
+
+# Durée allouée à une requête, en secondes, par défaut et au maximum, et marge laissée au processus pour retourner son résultat
+DELAI_SERVICE = 5
+DELAI_MAX_SERVICE = 30
+MARGE_DELAI_SERVICE = 2
+
+# Comptage des solutions: nombre de solutions recherchées par défaut (2 suffit pour savoir si la solution est unique) et au maximum
+LIMITE_SOLUTIONS_SERVICE = 2
+LIMITE_SOLUTIONS_MAX_SERVICE = 10000
+
+# Nombre de durées de requête conservées par point d'accès pour le calcul des percentiles
+TAILLE_HISTORIQUE_SERVICE = 1000
+
+# Messages d'erreur
+MESSAGE_SERVICE_INCONNU = "Point d'accès inconnu"
+MESSAGE_SERVICE_REQUETE = "Requête JSON invalide"
+MESSAGE_SERVICE_TAILLE = "Requête trop volumineuse"
+MESSAGE_SERVICE_OCCUPE = "Trop de requêtes simultanées"
+MESSAGE_SERVICE_DELAI = "Durée allouée dépassée"
+MESSAGE_SERVICE_PARAMETRE = "Paramètre invalide: {}"
+MESSAGE_SERVICE_INTERNE = "Erreur interne du calcul: {}"
+
+
+################## BENCHMARK #######################
+""" La partie benchmark contient les informations sur la mesure des performances des modes de résolution:
+        - les fichiers du corpus de grilles, des résultats et de la référence
+        - les paramètres des mesures
+        - les modules dont la durée d'import est mesurée
+"""
+
+# Fichiers: un fichier texte de grilles par difficulté dans le dossier du corpus, résultats de la dernière mesure et référence
+CHEMIN_DOSSIER_CORPUS_BENCHMARK = "../benchmark/corpus/"
+CHEMIN_RESULTATS_BENCHMARK = "../benchmark/resultats.json"
+CHEMIN_REFERENCE_BENCHMARK = "../benchmark/reference.json"
+EXTENSION_CORPUS_BENCHMARK = ".txt"
+
+# Mesures: modes de résolution comparés, nombre d'exécutions par grille, graine du hasard, nombre de grilles du corpus par difficulté
+MODES_BENCHMARK = ("SLOW", "MEDIUM", "FAST")
+REPETITIONS_BENCHMARK = 3
+GRAINE_BENCHMARK = 2024
+GRILLES_PAR_DIFFICULTE_BENCHMARK = 7
+
+# Durée maximale d'une résolution, en secondes, pour chaque mode: SLOW résout les grilles du corpus en quelques dizaines de secondes,
+# MEDIUM dépasse le plus souvent toute durée raisonnable, ses exécutions hors délai étant comptées à part
+DELAIS_BENCHMARK = {"SLOW": 60, "MEDIUM": 10, "FAST": 5}
+
+# Nombre minimal d'exécutions terminées d'un groupe pour en donner le 95e centile (en deçà, le centile ne serait que le maximum)
+ECHANTILLONS_CENTILE_BENCHMARK = 20
+
+# Augmentation relative de la durée médiane au-delà de laquelle une mesure est signalée comme une régression
+SEUIL_REGRESSION_BENCHMARK = 0.2
+
+# Démarrage: modules dont la durée d'import est mesurée (menu pour le lancement du jeu), nombre d'imports les plus lents rapportés
+MODULES_DEMARRAGE_BENCHMARK = ("menu", "grille", "resolveur", "service")
+IMPORTS_SIGNALES_BENCHMARK = 5
+
+
+################## DIAGNOSTIC #######################
+""" La partie diagnostic contient les informations sur le journal de débogage et le profilage des phases coûteuses:
+        - les variables d'environnement activant le journal et le profilage
+        - le format du journal
+        - les noms des phases profilées et les fichiers produits
+"""
+
+# Variables d'environnement: niveau du journal (DEBUG, INFO...) et dossier des profils
+VARIABLE_JOURNAL_DIAGNOSTIC = "KAKURO_JOURNAL"
+VARIABLE_PROFIL_DIAGNOSTIC = "KAKURO_PROFIL"
+
+# Journal
+NOM_JOURNAL_DIAGNOSTIC = "kakuro"
+FORMAT_JOURNAL_DIAGNOSTIC = "%(asctime)s %(levelname)s [%(threadName)s] %(module)s: %(message)s"
+
+# Phases profilées
+PHASE_RESOLUTION = "resolution"
+PHASE_GENERATION = "generation"
+PHASE_RENDU = "rendu"
+
+# Profils: dossier par défaut, extensions des profils cProfile et des piles agrégées (flame graphs), intervalle d'échantillonnage des piles (en secondes)
+CHEMIN_DOSSIER_PROFILS = "../profils/"
+EXTENSION_PROFIL = ".prof"
+EXTENSION_PILES_PROFIL = ".folded"
+INTERVALLE_ECHANTILLONNAGE_PROFIL = 0.002
@@ -0,0 +1,265 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de corpus de grilles.
+    Un corpus est un fichier contenant un grand nombre de grilles, sous forme d'enregistrements de taille fixe.
+    Il est projeté en mémoire par mmap: la Nième grille est lue sans copie, sous la forme d'une vue légère,
+    convertie en Grille uniquement à la demande.
+
+    Le fichier commence par un en-tête de 8 octets: ENTETE_CORPUS, le numéro de version, le nombre de colonnes, le nombre de lignes et un octet nul.
+    Suit un enregistrement par grille, contenant deux octets par case, ligne par ligne:
+        - le premier octet contient le type de la case (2 bits de poids fort) et une première valeur (6 bits de poids faible)
+        - le second octet contient une seconde valeur
+    Pour une case vide, les valeurs sont la solution et la valeur saisie. Pour une indicatrice, la somme droite et la somme bas.
+    La valeur 0 signifie l'absence de valeur.
+
+    Si numpy est installé, les grilles d'un corpus peuvent être validées par lots. Sinon, elles sont validées une à une.
+
+    Contient les classes suivantes:
+        - Corpus
+        - VueCorpus
+
+    Modules importés:
+        - os, mmap: utilisés pour la projection en mémoire du fichier
+        - numpy: utilisé, s'il est installé, pour la validation des grilles par lots
+        - cases, grille: utilisés pour convertir les vues en grilles
+        - exceptions: utilisé pour signaler un fichier illisible
+        - constantes: utilisé par toutes les méthodes
+"""
+
+import os
+import mmap
+import cases
+import grille
+from exceptions import *
+from constantes import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Corpus:
+    """ Classe modélisant un corpus de grilles projeté en mémoire.
+        Un corpus s'utilise comme une séquence: len(corpus), corpus[n] et la boucle for retournent des objets VueCorpus.
+        Cette classe possède 5 attributs:
+            - _fichier: le fichier du corpus, ouvert en lecture
+            - _memoire: la projection en mémoire du fichier
+            - nb_colonne: le nombre de colonnes des grilles du corpus
+            - nb_ligne: le nombre de lignes des grilles du corpus
+            - taille_enregistrement: le nombre d'octets d'une grille
+    """
+
+    def __init__(self, chemin):
+        """ Ouvre et projette en mémoire le corpus dont le chemin est passé en paramètre.
+            Lève FormatSauvegardeException si le fichier n'est pas un corpus.
+        """
+        self._fichier = open(chemin, "rb")
+        entete = self._fichier.read(TAILLE_ENTETE_CORPUS)
+        if len(entete) != TAILLE_ENTETE_CORPUS or not entete.startswith(ENTETE_CORPUS) or entete[len(ENTETE_CORPUS)] != VERSION_CORPUS:
+            self._fichier.close()
+            raise FormatSauvegardeException()
+
+        self.nb_colonne = entete[len(ENTETE_CORPUS) + 1]
+        self.nb_ligne = entete[len(ENTETE_CORPUS) + 2]
+        self.taille_enregistrement = 2 * self.nb_colonne * self.nb_ligne
+        self._memoire = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def fermer(self):
+        """ Ferme la projection en mémoire et le fichier du corpus. Les vues retournées doivent avoir été libérées au préalable. """
+        self._memoire.close()
+        self._fichier.close()
+
+    def __len__(self):
+        """ Retourne le nombre de grilles du corpus """
+        if self.taille_enregistrement == 0:
+            return 0
+        return (len(self._memoire) - TAILLE_ENTETE_CORPUS) // self.taille_enregistrement
+
+    def __getitem__(self, indice):
+        """ Retourne une vue, sans copie, sur la grille d'indice passé en paramètre. Les indices négatifs sont comptés depuis la fin. """
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+
+        debut = TAILLE_ENTETE_CORPUS + indice * self.taille_enregistrement
+        return VueCorpus(memoryview(self._memoire)[debut:debut + self.taille_enregistrement], self.nb_colonne, self.nb_ligne)
+
+    def __iter__(self):
+        """ Parcourt les vues de toutes les grilles du corpus """
+        for indice in range(len(self)):
+            yield self[indice]
+
+    def tableau(self, debut=0, fin=None):
+        """ Retourne, sans copie, un tableau numpy de dimensions (grilles, lignes, colonnes, 2) contenant les grilles d'indices debut à fin exclu.
+            Nécessite numpy.
+        """
+        fin = len(self) if fin is None else min(fin, len(self))
+        return numpy.frombuffer(self._memoire, numpy.uint8, (fin - debut) * self.taille_enregistrement,
+                                TAILLE_ENTETE_CORPUS + debut * self.taille_enregistrement).reshape(fin - debut, self.nb_ligne, self.nb_colonne, 2)
+
+    def valider_lot(self, debut=0, fin=None):
+        """ Retourne la liste des résultats de validation (voir VueCorpus.valider) des grilles d'indices debut à fin exclu.
+            Si numpy est installé, les grilles sont validées par lots de TAILLE_LOT_CORPUS, sinon une à une.
+        """
+        fin = len(self) if fin is None else min(fin, len(self))
+        if numpy is None:
+            return [self[indice].valider() for indice in range(debut, fin)]
+
+        resultat = []
+        for lot in range(debut, fin, TAILLE_LOT_CORPUS):
+            resultat.extend(Corpus._valider_tableau(self.tableau(lot, min(lot + TAILLE_LOT_CORPUS, fin))).tolist())
+        return resultat
+
+    @staticmethod
+    def ajouter(chemin, grilles, nb_colonne=NB_COLONNE_GRILLE, nb_ligne=NB_LIGNE_GRILLE):
+        """ Ajoute les grilles passées en paramètre à la fin du corpus dont le chemin est donné, en le créant si nécessaire.
+            Retourne le nombre de grilles ajoutées. Lève FormatSauvegardeException si les dimensions ne correspondent pas à celles du corpus.
+        """
+        entete = ENTETE_CORPUS + bytes((VERSION_CORPUS, nb_colonne, nb_ligne, 0))
+        if os.path.exists(chemin):
+            with open(chemin, "rb") as fichier:
+                if fichier.read(TAILLE_ENTETE_CORPUS) != entete:
+                    raise FormatSauvegardeException()
+
+        nombre = 0
+        with open(chemin, "ab") as fichier:
+            if fichier.tell() == 0:
+                fichier.write(entete)
+            for grille_corpus in grilles:
+                fichier.write(Corpus.encoder(grille_corpus._grid, nb_colonne, nb_ligne))
+                nombre += 1
+        return nombre
+
+    @staticmethod
+    def encoder(grid, nb_colonne=NB_COLONNE_GRILLE, nb_ligne=NB_LIGNE_GRILLE):
+        """ Retourne l'enregistrement de taille fixe du dictionnaire de cases passé en paramètre """
+        donnees = bytearray(2 * nb_colonne * nb_ligne)
+        position = 0
+        for j in range(nb_ligne):
+            for i in range(nb_colonne):
+                case = grid.get((i, j))
+                if type(case) is cases.CaseVide:
+                    donnees[position] = TYPE_CASE_VIDE << 6 | max(case._solution_case, 0)
+                    donnees[position + 1] = max(case.valeur_saisie, 0)
+                elif type(case) is cases.Indicatrice:
+                    donnees[position] = TYPE_CASE_INDICATRICE << 6 | case.valeur_droite
+                    donnees[position + 1] = case.valeur_bas
+                elif type(case) is cases.CaseNoire:
+                    donnees[position] = TYPE_CASE_NOIRE << 6
+                position += 2
+        return bytes(donnees)
+
+    @staticmethod
+    def _valider_tableau(tableau):
+        """ Valide en une seule fois les grilles d'un tableau numpy de dimensions (grilles, lignes, colonnes, 2).
+            Retourne un tableau de booléens, un par grille.
+        """
+        nature = tableau[..., 0] >> 6
+        vide = nature == TYPE_CASE_VIDE
+        solution = numpy.where(vide, tableau[..., 0] & 0x3F, 0).astype(numpy.int32)
+
+        valide = numpy.all(~vide | ((solution >= VALEUR_MIN) & (solution <= VALEUR_MAX)), axis=(1, 2))
+        valide &= Corpus._valider_plages(nature, vide, solution, (tableau[..., 0] & 0x3F).astype(numpy.int32))
+        valide &= Corpus._valider_plages(nature.swapaxes(1, 2), vide.swapaxes(1, 2), solution.swapaxes(1, 2), tableau[..., 1].swapaxes(1, 2).astype(numpy.int32))
+        return valide
+
+    @staticmethod
+    def _valider_plages(nature, vide, solution, somme):
+        """ Vérifie les plages de cases vides de chaque ligne des tableaux passés en paramètre, pour un lot de grilles.
+            Chaque plage doit suivre une indicatrice dont la somme est celle des solutions de la plage, sans doublon.
+            Une indicatrice sans plage doit avoir une somme nulle. Retourne un tableau de booléens, un par grille.
+        """
+        longueur = nature.shape[-1]
+        indices = numpy.arange(longueur)
+
+        # Pour chaque case, indice de la dernière case non vide la précédant (tête de plage), et de la première case non vide la suivant
+        tete = numpy.maximum.accumulate(numpy.where(vide, -1, indices), axis=-1)
+        suivante = numpy.minimum.accumulate(numpy.where(vide, longueur, indices)[..., ::-1], axis=-1)[..., ::-1]
+        suivante = numpy.concatenate((suivante[..., 1:], numpy.full(suivante.shape[:-1] + (1,), longueur)), axis=-1)
+
+        # Une case vide doit appartenir à une plage suivant une indicatrice
+        nature_tete = numpy.take_along_axis(nature, numpy.maximum(tete, 0), axis=-1)
+        orpheline = vide & ((tete < 0) | (nature_tete != TYPE_CASE_INDICATRICE))
+
+        # Somme et doublons des plages, calculés sur les têtes de plage à l'aide de sommes cumulées
+        fin = suivante - 1
+        cumul = numpy.cumsum(solution, axis=-1)
+        total = numpy.take_along_axis(cumul, fin, axis=-1) - cumul
+        indicatrice = nature == TYPE_CASE_INDICATRICE
+        incorrecte = indicatrice & (total != somme)
+
+        doublon = numpy.zeros(nature.shape, dtype=bool)
+        for valeur in range(VALEUR_MIN, VALEUR_MAX + 1):
+            cumul = numpy.cumsum(solution == valeur, axis=-1)
+            doublon |= indicatrice & (numpy.take_along_axis(cumul, fin, axis=-1) - cumul > 1)
+
+        return ~numpy.any(orpheline | incorrecte | doublon, axis=(1, 2))
+
+
+class VueCorpus:
+    """ Classe modélisant une vue légère, sans copie, sur une grille d'un corpus.
+        Cette classe possède 3 attributs:
+            - _donnees: la vue mémoire sur l'enregistrement de la grille
+            - nb_colonne: le nombre de colonnes de la grille
+            - nb_ligne: le nombre de lignes de la grille
+    """
+
+    def __init__(self, donnees, nb_colonne, nb_ligne):
+        """ Initialise les attributs de la classe avec les paramètres """
+        self._donnees = donnees
+        self.nb_colonne = nb_colonne
+        self.nb_ligne = nb_ligne
+
+    def case(self, i, j):
+        """ Retourne le type et les deux valeurs de la case (i, j) """
+        position = 2 * (j * self.nb_colonne + i)
+        return (self._donnees[position] >> 6, self._donnees[position] & 0x3F, self._donnees[position + 1])
+
+    def grille(self):
+        """ Retourne la grille correspondant à la vue. Les cases sont créées à cet appel. """
+        resultat = grille.Grille()
+        resultat.nb_colonne, resultat.nb_ligne = self.nb_colonne, self.nb_ligne
+        for j in range(self.nb_ligne):
+            for i in range(self.nb_colonne):
+                nature, premiere, seconde = self.case(i, j)
+                if nature == TYPE_CASE_VIDE:
+                    resultat[i, j] = cases.CaseVide(premiere or -1)
+                    resultat[i, j].valeur_saisie = seconde or -1
+                elif nature == TYPE_CASE_INDICATRICE:
+                    resultat[i, j] = cases.Indicatrice()
+                    resultat[i, j].valeur_droite = premiere
+                    resultat[i, j].valeur_bas = seconde
+                elif nature == TYPE_CASE_NOIRE:
+                    resultat[i, j] = cases.CaseNoire()
+        return resultat
+
+    def valider(self):
+        """ Retourne True si la solution de la grille est correcte:
+            chaque case vide a une solution entre VALEUR_MIN et VALEUR_MAX, et appartient à une plage horizontale et une plage verticale
+            suivant chacune une indicatrice dont la somme est celle des solutions de la plage, sans doublon.
+            Une indicatrice sans plage doit avoir une somme nulle.
+        """
+        lignes = [([self.case(i, j) for i in range(self.nb_colonne)], 1) for j in range(self.nb_ligne)]
+        lignes += [([self.case(i, j) for j in range(self.nb_ligne)], 2) for i in range(self.nb_colonne)]
+
+        for contenu, indice_somme in lignes:
+            somme, valeurs = None, []
+
+            # Une case noire est ajoutée à la fin de la ligne pour vérifier la dernière plage
+            for case in contenu + [(TYPE_CASE_NOIRE, 0, 0)]:
+                nature, premiere = case[0], case[1]
+                if nature == TYPE_CASE_VIDE:
+                    if somme is None or not VALEUR_MIN <= premiere <= VALEUR_MAX or premiere in valeurs:
+                        return False
+                    valeurs.append(premiere)
+                    continue
+
+                if somme is not None and somme != sum(valeurs):
+                    return False
+                somme = case[indice_somme] if nature == TYPE_CASE_INDICATRICE else None
+                valeurs = []
+
+        return True
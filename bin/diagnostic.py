@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant les outils de diagnostic des performances: le journal de débogage et le profilage des phases coûteuses.
+
+    Le journal remplace les affichages de mise au point des algorithmes. Il est désactivé par défaut:
+    la variable d'environnement KAKURO_JOURNAL (ou la fonction activer_journal) fixe son niveau, par exemple DEBUG.
+    Dans les boucles coûteuses, les messages ne sont construits qu'après avoir vérifié journal.isEnabledFor(logging.DEBUG).
+
+    Le profilage est lui aussi désactivé par défaut: la variable d'environnement KAKURO_PROFIL (ou la fonction activer_profilage) donne le dossier
+    dans lequel les profils sont écrits. Les fonctions décorées par profiler sont alors exécutées sous cProfile, un profil étant tenu par phase
+    (résolution, génération, rendu d'une image), et un fil d'exécution échantillonne les piles d'appels des phases en cours.
+    À la désactivation du profilage, ou à la fin du programme, chaque phase produit deux fichiers:
+        - <phase>.prof: le profil cProfile, lisible par pstats ou snakeviz
+        - <phase>.folded: les piles échantillonnées au format "f1;f2;f3 nombre", lisible par flamegraph.pl ou speedscope
+
+    Contient les fonctions suivantes:
+        - activer_journal
+        - activer_profilage, desactiver_profilage, profilage_actif
+        - profiler: décorateur rattachant une fonction à une phase
+
+    Modules importés:
+        - os, sys, atexit: utilisés pour lire les variables d'environnement, les piles d'appels et écrire les profils à la fin du programme
+        - logging: utilisé pour le journal
+        - cProfile, pstats: utilisés pour profiler les phases et écrire leurs profils, importés uniquement lorsque le profilage est activé
+        - collections, functools, threading: utilisés pour l'échantillonnage des piles et le décorateur
+        - constantes: utilisé pour les noms des variables d'environnement et des fichiers
+"""
+
+import os
+import sys
+import atexit
+import logging
+import collections
+import functools
+import threading
+from constantes import *
+
+journal = logging.getLogger(NOM_JOURNAL_DIAGNOSTIC)
+
+# Dossier des profils, ou None si le profilage est désactivé
+_dossier = None
+# Profils cProfile indexés par (phase, fil d'exécution) et piles échantillonnées par phase
+_profils = {}
+_piles = collections.defaultdict(collections.Counter)
+# Phase en cours dans chaque fil d'exécution, lue par l'échantillonneur, et pile des phases (phase, profil) commencées par le fil courant
+_phases = {}
+_locale = threading.local()
+_verrou = threading.Lock()
+# Fil d'exécution échantillonnant les piles, et événement demandant son arrêt
+_echantillonneur = None
+_arret = threading.Event()
+
+
+def activer_journal(niveau=logging.DEBUG, flux=None):
+    """ Active le journal au niveau passé en paramètre (un niveau de logging ou son nom), les messages étant écrits dans flux (sys.stderr par défaut) """
+    if not journal.handlers:
+        gestionnaire = logging.StreamHandler(flux)
+        gestionnaire.setFormatter(logging.Formatter(FORMAT_JOURNAL_DIAGNOSTIC))
+        journal.addHandler(gestionnaire)
+    journal.setLevel(niveau.upper() if isinstance(niveau, str) else niveau)
+
+
+def profilage_actif():
+    """ Retourne True si le profilage est activé """
+    return _dossier is not None
+
+
+def activer_profilage(dossier=CHEMIN_DOSSIER_PROFILS, intervalle=INTERVALLE_ECHANTILLONNAGE_PROFIL):
+    """ Active le profilage des phases, les profils étant écrits dans dossier à la désactivation.
+        Les piles d'appels des phases en cours sont échantillonnées toutes les intervalle secondes.
+    """
+    global _dossier, _echantillonneur
+    if _dossier is not None:
+        return
+    _dossier = dossier
+    _profils.clear()
+    _piles.clear()
+    _arret.clear()
+    _echantillonneur = threading.Thread(target=_echantillonner, args=(intervalle,), name="Echantillonneur", daemon=True)
+    _echantillonneur.start()
+
+
+def desactiver_profilage():
+    """ Désactive le profilage et écrit les profils et les piles de chaque phase profilée dans le dossier des profils.
+        Retourne la liste des chemins des fichiers écrits.
+    """
+    global _dossier
+    if _dossier is None:
+        return []
+    dossier, _dossier = _dossier, None
+    _arret.set()
+    _echantillonneur.join()
+    if not os.path.isdir(dossier):
+        os.makedirs(dossier)
+
+    import pstats
+    chemins = []
+    with _verrou:
+        phases = {phase for phase, fil in _profils} | set(_piles)
+        for phase in sorted(phases):
+            profils = [profil for (nom, fil), profil in _profils.items() if nom == phase]
+            if profils:
+                statistiques = pstats.Stats(profils[0])
+                for profil in profils[1:]:
+                    statistiques.add(profil)
+                chemins.append(os.path.join(dossier, phase + EXTENSION_PROFIL))
+                statistiques.dump_stats(chemins[-1])
+
+            chemins.append(os.path.join(dossier, phase + EXTENSION_PILES_PROFIL))
+            with open(chemins[-1], "w", encoding="utf-8") as fichier:
+                for pile, nombre in sorted(_piles[phase].items()):
+                    fichier.write("{} {}\n".format(pile, nombre))
+    return chemins
+
+
+def profiler(phase):
+    """ Décorateur rattachant la fonction décorée à la phase passée en paramètre.
+        Lorsque le profilage est désactivé, la fonction est appelée directement. Sinon, son exécution est ajoutée au profil de la phase.
+        Une phase commencée pendant une autre, dans le même fil d'exécution, suspend le profil de la première jusqu'à sa fin.
+    """
+    def decorateur(fonction):
+        @functools.wraps(fonction)
+        def profilee(*parametres, **options):
+            if _dossier is None:
+                return fonction(*parametres, **options)
+
+            import cProfile
+            pile = _locale.__dict__.setdefault("pile", [])
+            fil = threading.get_ident()
+            with _verrou:
+                profil = _profils.setdefault((phase, fil), cProfile.Profile())
+            if pile:
+                pile[-1][1].disable()
+            pile.append((phase, profil))
+            _phases[fil] = phase
+            profil.enable()
+            try:
+                return fonction(*parametres, **options)
+            finally:
+                profil.disable()
+                pile.pop()
+                if pile:
+                    _phases[fil] = pile[-1][0]
+                    pile[-1][1].enable()
+                else:
+                    del _phases[fil]
+        return profilee
+    return decorateur
+
+
+def _echantillonner(intervalle):
+    """ Relève toutes les intervalle secondes la pile d'appels de chaque fil d'exécution en cours de phase, jusqu'à la désactivation du profilage """
+    while not _arret.wait(intervalle):
+        cadres = sys._current_frames()
+        for fil, phase in list(_phases.items()):
+            cadre = cadres.get(fil)
+            if cadre is None:
+                continue
+            appels = []
+            while cadre is not None:
+                code = cadre.f_code
+                appels.append("{}:{}".format(os.path.splitext(os.path.basename(code.co_filename))[0], code.co_name))
+                cadre = cadre.f_back
+            with _verrou:
+                _piles[phase][";".join(reversed(appels))] += 1
+
+
+if os.environ.get(VARIABLE_JOURNAL_DIAGNOSTIC):
+    activer_journal(os.environ[VARIABLE_JOURNAL_DIAGNOSTIC])
+
+if os.environ.get(VARIABLE_PROFIL_DIAGNOSTIC):
+    activer_profilage(os.environ[VARIABLE_PROFIL_DIAGNOSTIC])
+    atexit.register(desactiver_profilage)
@@ -10,9 +10,13 @@
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour manier les boutons de l'écran
         - cases, grille: utilisés pour la grille de l'editeur
-        - jeu: pour lancer le jeu directement depuis le menu d'edition
-        - solveur: pour verifier que la grille est correcte
+        - jeu: pour lancer le jeu directement depuis le menu d'edition, importé à la première ouverture de l'écran
+        - solveur: pour verifier que la grille est correcte, importé à la première ouverture de l'écran
         - exceptions: pour la gestion des erreurs
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
+        - vue_grille: utilisé pour trouver la case pointée par la souris
         - constantes: utilisé par toutes les méthodes
 """
 import random
@@ -22,16 +26,19 @@ import pygame.freetype
 import boutons
 import cases
 import grille
-import jeu
-import solveur
+import ressources
+import boucle
+import rendu
+import vue_grille
 from exceptions import *
 from constantes import *
 
 
 class Editeur:
     """ Classe Editeur, modélise l'editeur de grilles.
-        Cette classe possède 8 attributs:
+        Cette classe possède 9 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
             - _grille: la grille en cours d'edition
             - bouton_menu: bouton permettant d'acceder au menu
             - bouton_reset: bouton permettant de reinitialiser la grille
@@ -65,38 +72,39 @@ class Editeur:
         self.option_indicatrice = boutons.OptionEditeur()
         self.option_casenoire = boutons.OptionEditeur()
 
-        self.barre_erreur = boutons.BarreErreur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON))
+        self.barre_erreur = boutons.BarreErreur(ressources.police(TAILLE_POLICE_BOUTON))
         self.erreur = ""
         self.changed = False
+        self._rendu = rendu.Rendu()
 
     def afficher(self):
-        """ Affiche l'ecran d'edition.
-            La méthode afficher de la classe Bouton est utilisée pour afficher les boutons.
-            La méthode afficher_grille de la classe Grille est utilisée pour afficher la grille.
+        """ Déclare l'ecran d'edition à son rendu.
+            Les boutons, les options d'édition et chacune des cases de la grille sont déclarés.
+            Seuls les éléments modifiés depuis la dernière image seront redessinés.
             Les erreurs (ou messages) sont affichés dans la barrer_erreur.
             La couleur de la police d'affichage dépend de la nature de l'erreur (message de confirmation du solveur ou erreur de l'éditeur).
         """
 
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
-        vide_img = pygame.image.load(CHEMIN_IMAGE_MODE_CASEVIDE).convert_alpha()
-        indic_img = pygame.image.load(CHEMIN_IMAGE_MODE_INDICATRICE).convert_alpha()
-        noire_img = pygame.image.load(CHEMIN_IMAGE_MODE_CASENOIRE).convert_alpha()
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
+        vide_img = ressources.image(CHEMIN_IMAGE_MODE_CASEVIDE, True)
+        indic_img = ressources.image(CHEMIN_IMAGE_MODE_INDICATRICE, True)
+        noire_img = ressources.image(CHEMIN_IMAGE_MODE_CASENOIRE, True)
 
-        self.bouton_menu.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
-        self.bouton_facile.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_FACILE)
-        self.bouton_moyen.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_MOYEN)
-        self.bouton_difficile.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_DIFFICILE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_menu, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_facile, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_FACILE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_moyen, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_MOYEN)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_difficile, bouton_img, titre_bouton, POSITION_BOUTON_GENERER_DIFFICILE)
 
-        self.bouton_reset.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RESET)
-        self.bouton_verif.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SAUVEGARDE)
-        self.bouton_jouer.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_JOUER_EDITEUR)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_reset, bouton_img, titre_bouton, POSITION_BOUTON_RESET)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_verif, bouton_img, titre_bouton, POSITION_BOUTON_SAUVEGARDE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_jouer, bouton_img, titre_bouton, POSITION_BOUTON_JOUER_EDITEUR)
 
-        self.option_casevide.afficher(self._fenetre, vide_img, POSITION_MODE_VIDE)
-        self.option_indicatrice.afficher(self._fenetre, indic_img, POSITION_MODE_INDIC)
-        self.option_casenoire.afficher(self._fenetre, noire_img, POSITION_MODE_NOIRE)
+        self._rendu.ajouter("option_casevide", (self.option_casevide.is_enlarged, self.option_casevide.skew), self.option_casevide.afficher, self._fenetre, vide_img, POSITION_MODE_VIDE)
+        self._rendu.ajouter("option_indicatrice", (self.option_indicatrice.is_enlarged, self.option_indicatrice.skew), self.option_indicatrice.afficher, self._fenetre, indic_img, POSITION_MODE_INDIC)
+        self._rendu.ajouter("option_casenoire", (self.option_casenoire.is_enlarged, self.option_casenoire.skew), self.option_casenoire.afficher, self._fenetre, noire_img, POSITION_MODE_NOIRE)
 
-        self._grille.afficher_grille(self._fenetre)
+        self._rendu.ajouter_grille(self._fenetre, self._grille)
 
         # Choix de couleur entre erreur/message de fin de solveur
         if self.erreur == MESSAGE_GRILLE_RESOLUE:
@@ -104,7 +112,7 @@ class Editeur:
         else:
             couleur = COULEUR_ERREUR
 
-        self.barre_erreur.afficher_erreur(self._fenetre, self.erreur, couleur)
+        self._rendu.ajouter("erreur", (self.erreur, couleur), self.barre_erreur.afficher_erreur, self._fenetre, self.erreur, couleur)
 
     def edition(self):
         """ Méthode permettant de saisir une grille.
@@ -118,17 +126,22 @@ class Editeur:
         """
         # Boucle infinie
         while True:
-            self._fenetre.fill(COULEUR_FOND)
-            self.afficher()
-            pygame.display.flip()
-
             try:
                 self._grille.validate_saisie()
                 self.set_erreur("validation")
             except Exception as e:
                 self.erreur = e.message_erreur
 
-            for event in pygame.event.get():
+            self.afficher()
+            self._rendu.mettre_a_jour(self._fenetre)
+
+            # Les déplacements de souris reçus ensemble sont regroupés: chaque case survolée n'est remplie qu'une fois
+            survolees = []
+            for event in boucle.evenements():
+                if event.type != MOUSEMOTION:
+                    self.remplir_cases(survolees)
+                    survolees = []
+
                 if event.type == QUIT:
                     pygame.quit()
 
@@ -137,9 +150,9 @@ class Editeur:
                     self.set_erreur("clic")
 
                     if self.mode != MODE_SAISIE:
-                        curseur = pygame.Rect(event.pos, (0, 0))
-                        # Remplissage de la grille avec des cases en fonction du mode
-                        self.remplir_case(curseur)
+                        case = vue_grille.VueGrille.case_pointee(self._grille, event.pos)
+                        if case is not None and case not in survolees:
+                            survolees.append(case)
 
                 # Clic
                 elif event.type == MOUSEBUTTONUP and event.button == 1:
@@ -183,6 +196,7 @@ class Editeur:
                     elif self.bouton_verif.clicked(curseur):
                         if not(self.erreur):
                             try:
+                                import solveur
                                 ecran_solveur = solveur.Solveur(self._fenetre, self._grille)
                                 self._grille = ecran_solveur.loop()
                                 self._grille.confirmer_solution()
@@ -192,40 +206,53 @@ class Editeur:
                                 self.erreur = e.message_erreur
 
                             self._grille.reinitialiser()
+                            self._rendu.invalider()
 
                     elif self.bouton_jouer.clicked(curseur):
                         if not(self.erreur):
+                            import jeu
                             ecran_jeu = jeu.Jeu(self._fenetre, self._grille)
                             ecran_jeu.jouer()
                             return
 
+            # Remplissage de la grille avec des cases en fonction du mode
+            self.remplir_cases(survolees)
+
     def remplir_case(self, curseur):
         """ Cette méthode verifie si une case a été cliquée.
             Si c'est le cas elle lui affecte une case dont le type dépend du mode d'édition séléctionné.
-            Cette méthode est typiquement appelée pour des événements MOUSEMOTION.
+            La case cliquée est calculée directement à partir de la position du curseur.
         """
-        for (i, j) in self._grille.keys():
-            if self._grille[i, j].clicked(curseur):
-                self._grille[i, j] = self.get_case()
+        case = vue_grille.VueGrille.case_pointee(self._grille, curseur.topleft)
+        if case is not None:
+            self.remplir_cases([case])
+
+    def remplir_cases(self, coordonnees):
+        """ Cette méthode affecte à chacune des cases dont les coordonnées sont passées en paramètre une case dont le type dépend du mode d'édition.
+            Elle est typiquement appelée pour les cases survolées lors des événements MOUSEMOTION d'une même image.
+        """
+        for (i, j) in coordonnees:
+            self._grille[i, j] = self.get_case()
 
     def saisie_valeur(self, curseur):
         """ Cette méthode verifie si une zone de saisie d'une indicatrice a été cliquée.
             Si c'est le cas, une saisie sur cette zone est lancée et la valeur est récupérée dans l'attribut correspondant à la zone.
+            La case et sa zone sont calculées directement à partir de la position du curseur.
+            La case ayant été dessinée pendant la saisie, elle sera redessinée à l'image suivante.
         """
-        for (i, j) in self._grille.keys():
-            if type(self._grille[i, j]) is cases.Indicatrice:
-
-                if self._grille[i, j].clicked_droite(curseur):
-
-                    valeur = self._grille[i, j].saisie(self._fenetre, pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_INDICATRICE), SAISIE_DROITE)
-                    if valeur != -1:
-                        self._grille[i, j].valeur_droite = valeur
-
-                elif self._grille[i, j].clicked_bas(curseur):
-
-                    valeur = self._grille[i, j].saisie(self._fenetre, pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_INDICATRICE), SAISIE_BAS)
-                    if valeur != -1:
-                        self._grille[i, j].valeur_bas = valeur
+        case = vue_grille.VueGrille.case_pointee(self._grille, curseur.topleft)
+        if case is None or type(self._grille[case]) is not cases.Indicatrice:
+            return
+
+        indicatrice = self._grille[case]
+        zone = vue_grille.VueGrille.zone_indicatrice(curseur.topleft, *case)
+        if zone is not None:
+            valeur = vue_grille.VueGrille.saisir_indicatrice(self._fenetre, *case, zone)
+            self._rendu.invalider(("case",) + case)
+            if valeur != -1 and zone == SAISIE_DROITE:
+                indicatrice.valeur_droite = valeur
+            elif valeur != -1:
+                indicatrice.valeur_bas = valeur
 
     def set_mode(self, selected_mode):
         """ Méthode permettant de modifier le mode d'édition en fonction du mode envoyé en paramètres.
@@ -15,6 +15,9 @@
         -NoSolutionException
         -AbandonException
 
+        -FormatSauvegardeException
+        -FormatTexteException
+
     Ce module importe les modules suivant:
         - constantes: utilisé dans toutes les méthodes
 """
@@ -119,3 +122,35 @@ class AbandonException(Exception):
     def __str__(self):
         """ Chaine retournée lors de la conversion de l'exception en chaine, ou lorsqu'elle est en paramètre de la fonction print(). """
         return self.message_erreur
+
+
+class FormatSauvegardeException(Exception):
+    """ Classe d'exception utilisée lorsqu'un fichier de sauvegarde ne peut pas être lu.
+        Cette classe a un unique attribut message_erreur, initialisé dans le constructeur.
+    """
+
+    def __init__(self, message=MESSAGE_ERREUR_FORMAT_SAUVEGARDE):
+        """ Initialise le message d'erreur avec le message passé en paramètre.
+            Par défaut ce message est celui défini dans les constantes.
+        """
+        self.message_erreur = message
+
+    def __str__(self):
+        """ Chaine retournée lors de la conversion de l'exception en chaine, ou lorsqu'elle est en paramètre de la fonction print(). """
+        return self.message_erreur
+
+
+class FormatTexteException(Exception):
+    """ Classe d'exception utilisée lorsqu'une grille au format texte ne peut pas être lue.
+        Cette classe a un unique attribut message_erreur, initialisé dans le constructeur.
+    """
+
+    def __init__(self, message=MESSAGE_ERREUR_FORMAT_TEXTE):
+        """ Initialise le message d'erreur avec le message passé en paramètre.
+            Par défaut ce message est celui défini dans les constantes.
+        """
+        self.message_erreur = message
+
+    def __str__(self):
+        """ Chaine retournée lors de la conversion de l'exception en chaine, ou lorsqu'elle est en paramètre de la fonction print(). """
+        return self.message_erreur
@@ -5,14 +5,18 @@
     Ce module est l'implémentation de l'ecran de choix de difficulté.
     Ce module possède une unique classe Generation.
 
-    Celle ci possède deux méthodes:
+    Celle ci possède trois méthodes:
         - afficher(): affiche l'écran de choix de difficulté
         - choisir_difficulte(): boucle événementielle détectant la difficulté choisie par le joueur
+        - obtenir_grille(): fournit une grille de la difficulté choisie, depuis le préchargement ou la réserve de grilles si possible
 
     Modules importés:
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour manier les boutons de l'écran
-        - grille, jeu: permettent le déclenchement d'une partie de Kakuro
+        - grille, jeu: permettent le déclenchement d'une partie de Kakuro, jeu étant importé au premier lancement d'une partie
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
         - constantes: utilisé par toutes les méthodes
 """
 
@@ -21,46 +25,53 @@ from pygame.locals import *
 import pygame.freetype
 import boutons
 import grille
-import jeu
+import ressources
+import boucle
+import rendu
 from constantes import *
 
 
 class Generation:
     """ Classe Generation, modélise l'écran de choix de difficulté et génère la grille.
-        Cette classe possède 4 attributs:
+        Cette classe possède 9 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
+            - _reserve: la réserve de grilles pré-générées, ou None
+            - _prechargement: le préchargement des grilles pendant l'affichage des menus, ou None
+            - bouton_retour: bouton permettant de retourner au menu
             - bouton_facile: bouton permettant de generer une grille de difficulté facile
             - bouton_moyen: bouton permettant de generer une grille de difficulté moyenne
             - bouton_difficile: bouton permettant de générer une grille de difficulté difficile
             - bouton_mdft: bouton permettant de générer une grille de difficulté maitre des flans ténébreux
     """
 
-    def __init__(self, fenetre):
+    def __init__(self, fenetre, reserve_grilles=None, prechargement=None):
         """ Initialise les attributs de la classe.
-            La fenetre d'affichage est passée en paramètre.
+            La fenetre d'affichage est passée en paramètre, ainsi que la réserve de grilles et le préchargement éventuels.
             Les autres éléments sont des boutons, qui seront complétés dans l'affichage.
         """
 
         self._fenetre = fenetre
+        self._reserve = reserve_grilles
+        self._prechargement = prechargement
         self.bouton_retour = boutons.Bouton(TITRE_BOUTON_MENU)
         self.bouton_facile = boutons.Bouton(TITRE_BOUTON_FACILE)
         self.bouton_moyen = boutons.Bouton(TITRE_BOUTON_MOYEN)
         self.bouton_difficile = boutons.Bouton(TITRE_BOUTON_DIFFICILE)
         self.bouton_mdft = boutons.Bouton(TITRE_BOUTON_MDFT)
+        self._rendu = rendu.Rendu()
 
     def afficher(self):
-        """ Méthode permettant d'afficher le menu à l'écran.
-            Chacun des boutons du menu est affiché.
-            La grille est affichée par la suite.
+        """ Méthode permettant de déclarer l'écran de choix de difficulté à son rendu.
+            Chacun des boutons de l'écran est déclaré.
         """
-        self._fenetre.fill(COULEUR_FOND)
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
-        self.bouton_retour.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
-        self.bouton_facile.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_FACILE)
-        self.bouton_moyen.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_MOYEN)
-        self.bouton_difficile.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_DIFFICILE)
-        self.bouton_mdft.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_MDFT)
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_retour, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_facile, bouton_img, titre_bouton, POSITION_BOUTON_FACILE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_moyen, bouton_img, titre_bouton, POSITION_BOUTON_MOYEN)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_difficile, bouton_img, titre_bouton, POSITION_BOUTON_DIFFICILE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_mdft, bouton_img, titre_bouton, POSITION_BOUTON_MDFT)
 
     def choisir_difficulte(self):
         """ Méthode permettant au joueur de choisir sa difficulté par l'intermédiaire d'une boucle événementielle.
@@ -69,13 +80,13 @@ class Generation:
         # Boucle infinie
         while True:
 
-            self._fenetre.fill(COULEUR_FOND)
-            self.afficher()
-            pygame.display.flip()
+            if self._prechargement is not None:
+                self._prechargement.activer()
 
-            ecran_jeu = jeu.Jeu(self._fenetre, grille.Grille())
+            self.afficher()
+            self._rendu.mettre_a_jour(self._fenetre)
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
                 if event.type == QUIT:
                     pygame.quit()
 
@@ -87,22 +98,37 @@ class Generation:
                     if self.bouton_retour.clicked(curseur):
                         return
 
+                    difficulte = None
                     if self.bouton_facile.clicked(curseur):
-                        ecran_jeu.grille.generer_grille("facile")
-                        ecran_jeu.jouer()
-                        return
-
+                        difficulte = "facile"
                     elif self.bouton_moyen.clicked(curseur):
-                        ecran_jeu.grille.generer_grille("moyen")
-                        ecran_jeu.jouer()
-                        return
-
+                        difficulte = "moyen"
                     elif self.bouton_difficile.clicked(curseur):
-                        ecran_jeu.grille.generer_grille("difficile")
-                        ecran_jeu.jouer()
-                        return
-
+                        difficulte = "difficile"
                     elif self.bouton_mdft.clicked(curseur):
-                        ecran_jeu.grille.generer_grille("mdft")
+                        difficulte = "mdft"
+
+                    if difficulte is not None:
+                        import jeu
+                        ecran_jeu = jeu.Jeu(self._fenetre, self.obtenir_grille(difficulte))
+                        if self._prechargement is not None:
+                            self._prechargement.suspendre()
                         ecran_jeu.jouer()
                         return
+
+    def obtenir_grille(self, difficulte):
+        """ Méthode retournant une grille de la difficulté passée en paramètre.
+            La grille préchargée pendant l'affichage des menus est utilisée en priorité.
+            A défaut, la grille est piochée dans la réserve de grilles. Si aucune réserve n'est disponible, ou si elle est vide, la grille est générée immédiatement.
+        """
+        if self._prechargement is not None:
+            grille_prete = self._prechargement.prendre(difficulte)
+            if grille_prete is not None:
+                return grille_prete
+
+        if self._reserve is not None:
+            return self._reserve.obtenir(difficulte)
+
+        nouvelle_grille = grille.Grille()
+        nouvelle_grille.generer_grille(difficulte)
+        return nouvelle_grille
@@ -1,28 +1,32 @@
 #!/usr/bin/python3
 # -*- encoding:utf-8 -*
 
-""" Module contenant la classe grille permettant de generer, saisir, afficher et jouer une grille.
+""" Module contenant la classe grille permettant de generer, saisir, valider et jouer une grille.
+    La grille ne contient que le modèle du jeu: son affichage est réalisé par le module vue_grille.
+    Ce module n'importe pas pygame, et peut être chargé rapidement par les processus de calcul, la ligne de commande et les tests.
 
     Contient la classe suivante:
        - Grille
 
      Modules importés:
         - random: utilisé pour la génération de grille
-        - pickle: utilisé pour la sauvegarde et le chargement d'une grille
-        - pygame: utilisé pour l'affichage et le jeu d'une grille
         - cases: utilisé pour creer la grille (génération/édition)
+        - modeles: utilisé pour tirer la structure d'une grille générée
+        - serialisation: utilisé pour la sauvegarde et le chargement d'une grille
+        - logging, diagnostic: utilisés pour profiler la génération et journaliser la réduction des domaines
         - constantes: utilisé dans toutes les méthodes
         - exceptions: utilisé lors de la validation d'une grille (jeu/édition)
 
-    Les constantes de pygame et du produit, ainsi que les exceptions, sont importés dans l'espace de nommage du jeu, pour une utilisation simplifiée.
+    Les constantes du produit, ainsi que les exceptions, sont importés dans l'espace de nommage du jeu, pour une utilisation simplifiée.
 """
 
 import random
-import pickle
-import pygame
-from pygame.locals import *
-import pygame.freetype
 import cases
+import modeles
+import serialisation
+import logging
+import diagnostic
+from diagnostic import journal
 from constantes import *
 from exceptions import *
 
@@ -30,6 +34,7 @@ from exceptions import *
 class Grille:
     """ Classe modélisant la grille du Kakuro.
         Elle possède un attribut de type dict, une largeur et une hauteur.
+        Elle possède également la difficulté avec laquelle elle a été générée et le nom sous lequel elle a été sauvegardée, ou None.
     """
 
     def __init__(self, **kwargs):
@@ -58,6 +63,8 @@ class Grille:
         self.nb_ligne = NB_LIGNE_GRILLE
         self.nb_colonne = NB_COLONNE_GRILLE
         self.solved = False
+        self.difficulte = None
+        self.nom = None
 
     ####################################################################### Méthodes spéciales ################################################################################
 
@@ -208,6 +215,7 @@ class Grille:
 ######################################################### Génération de grille ################################################################
 
 # Méthode principale
+    @diagnostic.profiler(PHASE_GENERATION)
     def generer_grille(self, difficulte):
         """ Fonction générale permettant de creer aléatoirement une grille selon un niveau de difficulté passé en paramètre """
 
@@ -221,12 +229,18 @@ class Grille:
         else:
             nb_indicatrice = NB_INDICATRICE_MDFT
 
-        self._creer_structure(nb_indicatrice)
-        self._placer_indicatrices(nb_indicatrice)
+        # La structure est tirée de la bibliothèque de modèles, ou créée aléatoirement si la bibliothèque est vide
+        structure = modeles.Modeles.partagee().tirer(difficulte)
+        if structure is not None:
+            self._appliquer_structure(structure)
+        else:
+            self._creer_structure(nb_indicatrice)
+            self._placer_indicatrices(nb_indicatrice)
         self._placer_valeurs()
         self.noircir()
         self.somme_indicatrices()
         self.solved = True
+        self.difficulte = difficulte
 
     # Création de la structure
 
@@ -263,6 +277,22 @@ class Grille:
             nb_indicatrice -= 1
             i += 1
 
+    def _appliquer_structure(self, structure):
+        """ Cette méthode crée la structure de la grille à partir d'un modèle de la bibliothèque de modèles.
+            Chaque case pleine du modèle devient une indicatrice si une case blanche la suit à droite ou en-dessous, une case noire sinon.
+            Les cases blanches ne sont pas créées: elles seront remplies par _placer_valeurs.
+        """
+        def est_blanche(i, j):
+            return i < self.nb_colonne and j < self.nb_ligne and structure[j * self.nb_colonne + i] == CASE_MODELE_BLANCHE
+
+        for j in range(self.nb_ligne):
+            for i in range(self.nb_colonne):
+                if not est_blanche(i, j):
+                    if est_blanche(i + 1, j) or est_blanche(i, j + 1):
+                        self[i, j] = cases.Indicatrice()
+                    else:
+                        self[i, j] = cases.CaseNoire()
+
     def _placer_indicatrices(self, nb_indicatrice):
         """ Cette méthode complète la structure en ajoutant un nombre d'indicatrice a des positions aléatoires du tableau.
             Une fois que l'ensemble des indicatrices ont été placées, la méthode remplace toutes les indicatrices bloquées par un case noire.
@@ -303,16 +333,91 @@ class Grille:
     # Placement des valeurs
     def _placer_valeurs(self):
         """ Affecte toutes les valeurs solution aux cases blanches, en fonction des valeurs déja affectées aux autres cases du bloc.
-            Cette méthoe appelle choix_valeur, qui permet de selectionner une valeur n'étant ni dans la ligne, ni dans la colonne.
+            Les cases blanches sont les cases n'ayant pas encore été créées. Elles sont remplies colonne par colonne.
+
+            Chaque plage tient à jour un masque de bits des chiffres déjà utilisés: le bit v est à 1 si la valeur v est présente dans la plage.
+            Les valeurs disponibles pour une case sont donc celles absentes des masques de sa plage ligne et de sa plage colonne.
+            Lorsqu'aucune valeur n'est disponible, la méthode revient sur la case précédente et lui essaye une autre valeur.
+
+            Si le nombre de retours en arrière dépasse NB_RETOURS_MAX_PLACEMENT, le remplissage est recommencé, jusqu'à NB_ESSAIS_PLACEMENT fois.
+            En dernier recours, la méthode historique est utilisée: choix_valeur est appelée sur chaque case, et une case ne pouvant prendre aucune valeur devient une indicatrice.
         """
-        i, j = 0, 0
-        while i < self.nb_colonne:
-            while j < self.nb_ligne:
-                if (i, j) not in self.keys():
-                    self.choix_valeur(i, j)
-                j += 1
-            j = 0
-            i += 1
+        ordre = [(i, j) for i in range(self.nb_colonne) for j in range(self.nb_ligne) if (i, j) not in self.keys()]
+        plages, nb_plages = self._plages_a_remplir(ordre)
+
+        # Plusieurs essais: un remplissage qui s'enlise est recommencé depuis le début, avec d'autres tirages
+        for essai in range(NB_ESSAIS_PLACEMENT):
+            valeurs = Grille._remplir_plages(plages, nb_plages)
+            if valeurs is not None:
+                for indice, (i, j) in enumerate(ordre):
+                    self[i, j] = cases.CaseVide(valeurs[indice])
+                return
+
+        for (i, j) in ordre:
+            self.choix_valeur(i, j)
+
+    @staticmethod
+    def _remplir_plages(plages, nb_plages):
+        """ Choisit une valeur pour chaque case, décrite par le couple (plage ligne, plage colonne) auquel elle appartient.
+            Retourne la liste des valeurs choisies, ou None si le nombre de retours en arrière dépasse NB_RETOURS_MAX_PLACEMENT.
+        """
+        masques = [0] * nb_plages
+        valeurs = [0] * len(plages)
+        candidats = [None] * len(plages)
+        k, retours = 0, 0
+
+        while 0 <= k < len(plages):
+            plage_ligne, plage_colonne = plages[k]
+
+            # Retour sur cette case: sa valeur précédente est retirée des masques
+            if valeurs[k]:
+                masques[plage_ligne] ^= 1 << valeurs[k]
+                masques[plage_colonne] ^= 1 << valeurs[k]
+                valeurs[k] = 0
+
+            if candidats[k] is None:
+                utilises = masques[plage_ligne] | masques[plage_colonne]
+                candidats[k] = [valeur for valeur in range(1, 10) if not utilises & (1 << valeur)]
+                random.shuffle(candidats[k])
+
+            if candidats[k]:
+                valeurs[k] = candidats[k].pop()
+                masques[plage_ligne] |= 1 << valeurs[k]
+                masques[plage_colonne] |= 1 << valeurs[k]
+                k += 1
+            else:
+                candidats[k] = None
+                k -= 1
+                retours += 1
+                if retours > NB_RETOURS_MAX_PLACEMENT:
+                    return None
+
+        if k < 0:
+            return None
+        return valeurs
+
+    def _plages_a_remplir(self, ordre):
+        """ Numérote les plages des cases blanches passées en paramètre, dans l'ordre colonne par colonne.
+            Retourne la liste des couples (plage ligne, plage colonne) de chaque case, et le nombre de plages.
+            Une case appartient à la même plage ligne que sa voisine de gauche, et à la même plage colonne que sa voisine du haut, si elles sont blanches.
+        """
+        plage_ligne, plage_colonne = {}, {}
+        nb_plages = 0
+
+        for (i, j) in ordre:
+            if (i - 1, j) in plage_ligne:
+                plage_ligne[i, j] = plage_ligne[i - 1, j]
+            else:
+                plage_ligne[i, j] = nb_plages
+                nb_plages += 1
+
+            if (i, j - 1) in plage_colonne:
+                plage_colonne[i, j] = plage_colonne[i, j - 1]
+            else:
+                plage_colonne[i, j] = nb_plages
+                nb_plages += 1
+
+        return [(plage_ligne[case], plage_colonne[case]) for case in ordre], nb_plages
 
     def choix_valeur(self, x, y):
         """ Affecte une valeur a une case, cette valeur est unique, comprise entre 1 et 9 et ne se retrouve dans aucune
@@ -387,50 +492,7 @@ class Grille:
 
 ################################################################ Jeu d'une grille ##############################################################################
 
-## Affichage de la grille ##
-
-    def afficher_grille(self, fenetre):
-        """ Permet d'afficher la grille sur la fenêtre.
-            Son seul paramètre est la fenêtre d'affichage.
-            Il demarre l'affichage suivant la constantes POSITION_GRILLE.
-            Il parcourt l'ensemble de la grille. 
-            Pour les cases vides et indicatrices, il lance leur méthode afficher_valeur, permettant d'afficher la case et les valeurs correspondantes.
-            Il décale chaque case suivant la constante COTE_CASE.
-        """
-        pygame.freetype.init()
-
-        # Chargement des images des cases
-        img_indicatrice = pygame.image.load(CHEMIN_IMAGE_INDICATRICE).convert()
-        img_case_noire = pygame.image.load(CHEMIN_IMAGE_CASENOIRE).convert()
-        img_case_vide = pygame.image.load(CHEMIN_IMAGE_CASEVIDE).convert()
-
-        # Générateur de texte
-        font_indicatrice = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_INDICATRICE)
-        font_casevide = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_CASEVIDE)
-
-        i, j = 0, 0
-        # Positionnement de la grille
-        pos_x, pos_y = POSITION_GRILLE
-
-        while i < self.nb_colonne:
-            while j < self.nb_ligne:
-
-                if type(self[i, j]) == cases.Indicatrice:
-                    self[i, j].affichage(fenetre, font_indicatrice, (pos_x, pos_y), img_indicatrice)
-
-                elif type(self[i, j]) == cases.CaseVide:
-                    self[i, j].affichage(fenetre, font_casevide, (pos_x, pos_y), img_case_vide)
-
-                else:
-                    fenetre.blit(img_case_noire, (pos_x, pos_y))
-                    self[i, j].rect = pygame.Rect(pos_x, pos_y, COTE_IMAGE_CASE, COTE_IMAGE_CASE)
-
-                j += 1
-                pos_y += COTE_IMAGE_CASE
-            j = 0
-            pos_y = POSITION_GRILLE[1]
-            i += 1
-            pos_x += COTE_IMAGE_CASE
+## L'affichage et la saisie de la grille sont réalisés par la classe VueGrille du module vue_grille ##
 
     def validate(self, solving=False):
         """ Cette méthode Verifie si la grille a une erreur.
@@ -763,16 +825,16 @@ class Grille:
     ############################################################# SAUVEGARDE ####################################################################################################
 
     def sauvegarde(self, chemin_fichier):
-        """ Permet de sauvegarder la grille dans un fichier binaire, dont le chemin est chemin_fichier """
-        with open(chemin_fichier, "wb") as fichier:
-            pickler = pickle.Pickler(fichier)
-            pickler.dump(self._grid)
+        """ Permet de sauvegarder la grille dans un fichier binaire, dont le chemin est chemin_fichier.
+            Le format du fichier est décrit dans le module serialisation.
+        """
+        serialisation.sauvegarder(self._grid, chemin_fichier, self.nb_colonne, self.nb_ligne)
 
     def chargement(self, chemin_fichier):
-        """ Permet de charger une grille depuis un fichier binaire dont le chemin est cemin_fichier """
-        with open(chemin_fichier, "rb") as fichier:
-            depickler = pickle.Unpickler(fichier)
-            self._grid = depickler.load()
+        """ Permet de charger une grille depuis un fichier binaire dont le chemin est cemin_fichier.
+            Les fichiers des anciennes versions, sérialisés par pickle, sont également lus.
+        """
+        self._grid = serialisation.charger(chemin_fichier)
 
     def is_solved(self):
         """ Méthode permettant de verifier si une grille a une solution calculée. 
@@ -946,10 +1008,10 @@ class Grille:
         if indic_droite is not None:
             values_droite = set([nb for comb in indic_droite.domaine_droite for nb in comb])
 
-        i = 0
         for valeur in domaine:
             if valeur not in values_bas or valeur not in values_droite:
-                print(valeur)
+                if journal.isEnabledFor(logging.DEBUG):
+                    journal.debug("Valeur %d retirée du domaine de la case (%d, %d)", valeur, i, j)
                 square.domaine.remove(valeur)
 
     def checkArcConsistency(self, i, j):
@@ -10,6 +10,8 @@
     Modules importés:
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour manier les boutons de l'écran
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
         - constantes: utilisé par toutes les méthodes
 """
 import os
@@ -18,6 +20,8 @@ from pygame.locals import *
 import pygame.freetype
 import boutons
 import pdf
+import ressources
+import boucle
 from constantes import *
 
 
@@ -53,16 +57,16 @@ class Impression:
             La zone de saisie est aussi affichée au cours de cette étape.
         """
 
-        img_saisie = pygame.image.load(CHEMIN_IMAGE_ZONE_SAISIE).convert()
-        font_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        font_saisie = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        img_saisie = ressources.image(CHEMIN_IMAGE_ZONE_SAISIE)
+        font_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        font_saisie = ressources.police(TAILLE_POLICE_SAISIE)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
         self.bouton_valider.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_SOLUTION)
         self.bouton_retour.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_RETOUR)
         self.zone_saisie.afficher(self._fenetre, img_saisie, font_saisie, POSITION_ZONE_SAISIE)
 
-        self._fenetre.blit(font_saisie.render(self.indication, COULEUR_POLICE)[0], POSITION_INDICATION_SAUVEGARDE)
+        self._fenetre.blit(ressources.texte(font_saisie, self.indication, COULEUR_POLICE), POSITION_INDICATION_SAUVEGARDE)
 
     def impression(self):
         """ Méthode permettant d'imprimer la grille.
@@ -77,7 +81,7 @@ class Impression:
 
             pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
 
                 if event.type == QUIT:
                     pygame.quit()
@@ -89,7 +93,7 @@ class Impression:
                         return
 
                     if self.zone_saisie.clicked(curseur):
-                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE))
+                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, ressources.police(TAILLE_POLICE_SAISIE))
 
                     if self.bouton_valider.clicked(curseur):
                         self.valider()
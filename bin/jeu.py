@@ -12,30 +12,43 @@
     Module importé:
         - pygame: utilisé pour l'affichage de l'écran de jeu et jeu d'une grille
         - grille, cases: utilisé pour manier la grille de jeu
-        - sauvegarde: utilisé pour la sauvegarde et le chargement des grilles
+        - sauvegarde, impression: utilisés pour la sauvegarde et l'impression des grilles, importés à la première ouverture de leur écran
         - boutons: utilisé pour manier les boutons de l'écran
         - solution: utilisé pour renvoyer le joueur vers l'écran de solution de la grille
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
+        - vue_grille: utilisé pour trouver la case cliquée
+        - validation: utilisé pour ne vérifier que les plages de la case saisie
+        - time: utilisé pour mesurer la durée de résolution de la grille
+        - bibliotheque: utilisé pour noter la résolution d'une grille sauvegardée
         - constantes: utilisé par toutes les méthodes
-        - exceptions: gestion des erreurs
 """
 
 import pygame
 from pygame.locals import *
 import pygame.freetype
-import sauvegarde
-import impression
 import boutons
 import cases
 import solution
+import ressources
+import boucle
+import rendu
+import vue_grille
+import validation
+import time
+import bibliotheque
 from constantes import *
-from exceptions import *
 
 
 class Jeu:
     """ Modèle de donnée utilisé pour modéliser la phase de jeu, dans sa représentation graphique aussi bien que dans son fontionnement.
-        Cette classe possède 8 attributs:
+        Cette classe possède 11 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
+            - _debut: l'instant du début de la partie
             - grille: la grille de jeu
+            - validation: l'état des erreurs de la grille, mis à jour à chaque saisie
             - bouton_reset: bouton permettant de reinitialiser la grille
             - bouton_retour: bouton permettant de retourner au menu
             - bouton_solution: bouton permettant de demander la solution d'une grille
@@ -54,59 +67,68 @@ class Jeu:
 
         self._fenetre = fenetre
         self.grille = grille
+        self.validation = validation.Validation(grille)
         self.bouton_sauvegarde = boutons.Bouton(TITRE_BOUTON_SAUVEGARDE)
         self.bouton_impression = boutons.Bouton(TITRE_BOUTON_IMPRESSION)
         self.bouton_reset = boutons.Bouton(TITRE_BOUTON_RECOMMENCER)
         self.bouton_retour = boutons.Bouton(TITRE_BOUTON_MENU)
         self.bouton_solution = boutons.Bouton(TITRE_BOUTON_SOLUTION)
 
-        self.barre_erreur = boutons.BarreErreur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON))
+        self.barre_erreur = boutons.BarreErreur(ressources.police(TAILLE_POLICE_BOUTON))
+        self._rendu = rendu.Rendu()
+        self._debut = time.monotonic()
 
     def afficher(self):
-        """ Méthode permettant d'afficher l'écran de jeu.
-            Chacun des boutons de jeu est affiché.
-            La zone d'affichage des erreurs est créée mais aucune image n'y est associée.
-            La grille est par la suite affichée.
+        """ Méthode permettant de déclarer l'écran de jeu à son rendu.
+            Chacun des boutons de jeu est déclaré, ainsi que chacune des cases de la grille.
+            Seuls les éléments modifiés depuis la dernière image seront redessinés.
         """
 
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
-        self.bouton_sauvegarde.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SAUVEGARDE)
-        self.bouton_impression.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_IMPRESSION)
-        self.bouton_reset.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RESET)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_sauvegarde, bouton_img, titre_bouton, POSITION_BOUTON_SAUVEGARDE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_impression, bouton_img, titre_bouton, POSITION_BOUTON_IMPRESSION)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_reset, bouton_img, titre_bouton, POSITION_BOUTON_RESET)
         if self.grille.solved:
-            self.bouton_solution.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SOLUTION)
-        self.bouton_retour.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
-        self.grille.afficher_grille(self._fenetre)
+            self._rendu.ajouter_bouton(self._fenetre, self.bouton_solution, bouton_img, titre_bouton, POSITION_BOUTON_SOLUTION)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_retour, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
+        self._rendu.ajouter_grille(self._fenetre, self.grille)
+
+    def afficher_erreur(self, message):
+        """ Méthode permettant de déclarer le message d'erreur passé en paramètre au rendu de l'écran de jeu. """
+        self._rendu.ajouter("erreur", message, self.barre_erreur.afficher_erreur, self._fenetre, message, COULEUR_ERREUR)
+
+    def noter_resolution(self):
+        """ Méthode notant dans la bibliothèque la durée de résolution de la grille, si elle y a été sauvegardée. """
+        if self.grille.nom is not None:
+            bibliotheque_grilles = bibliotheque.Bibliotheque()
+            bibliotheque_grilles.noter_resolution(self.grille.nom, time.monotonic() - self._debut)
+            bibliotheque_grilles.fermer()
 
     def jouer(self):
         """ Méthode permettant de jouer la grille.
             La méthode attend un événement et lance les méthodes associées à cet evenement.
-            La méthode affiche la grille et ses éventuelles erreurs à chaque itération.
+            La méthode affiche la grille et ses éventuelles erreurs à chaque itération, en ne redessinant que ce qui a changé.
+            La grille n'est validée qu'après une saisie ou une réinitialisation: l'erreur affichée est celle conservée par la validation.
             L'utilisateur peut quitter le jeu en cours
         """
 
         while True:
 
-            self._fenetre.fill(COULEUR_FOND)
-            self.afficher()
-
-            try:
-                if self.grille.validate() and self.grille.victoire():
-                    ecran_solution = solution.Solution(self._fenetre, self.grille, True)
-                    ecran_solution.attente_evenement()
-                    return
-            except ExceptionMixte as em:
-                self.barre_erreur.afficher_erreur(self._fenetre, em.message_erreur, COULEUR_ERREUR)
-            except DoublonException as dbe:
-                self.barre_erreur.afficher_erreur(self._fenetre, dbe.message_erreur, COULEUR_ERREUR)
-            except SommeIncorrecteException as sie:
-                self.barre_erreur.afficher_erreur(self._fenetre, sie.message_erreur, COULEUR_ERREUR)
+            # La validation, faite lors de la saisie, précède l'affichage: les erreurs des cases sont dessinées dès cette image
+            if self.validation.terminee():
+                self.noter_resolution()
+                ecran_solution = solution.Solution(self._fenetre, self.grille, True)
+                ecran_solution.attente_evenement()
+                return
+            if self.validation.erreur is not None:
+                self.afficher_erreur(self.validation.erreur.message_erreur)
 
-            pygame.display.flip()
+            self.afficher()
+            self._rendu.mettre_a_jour(self._fenetre)
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
 
                 if event.type == QUIT:
                     pygame.quit()
@@ -119,6 +141,7 @@ class Jeu:
 
                     if self.bouton_reset.clicked(curseur):
                         self.grille.reinitialiser()
+                        self.validation.verifier_grille()
 
                     if self.grille.solved and self.bouton_solution.clicked(curseur):
                         self.grille.solve()
@@ -127,13 +150,20 @@ class Jeu:
                         return
 
                     if self.bouton_sauvegarde.clicked(curseur):
+                        import sauvegarde
                         ecran_sauvegarde = sauvegarde.Sauvegarde(self._fenetre, self.grille)
                         ecran_sauvegarde.sauvegarde()
+                        self._rendu.invalider()
 
                     if self.bouton_impression.clicked(curseur):
+                        import impression
                         ecran_impression = impression.Impression(self._fenetre, self.grille)
                         ecran_impression.impression()
-
-                    for(i, j) in self.grille.keys():
-                        if type(self.grille[i, j]) == cases.CaseVide and self.grille[i, j].clicked(curseur):
-                            self.grille[i, j].saisie_valeur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_CASEVIDE), self._fenetre)
+                        self._rendu.invalider()
+
+                    # La case cliquée est calculée à partir de la position du clic
+                    case = vue_grille.VueGrille.case_pointee(self.grille, event.pos)
+                    if case is not None and type(self.grille[case]) == cases.CaseVide:
+                        vue_grille.VueGrille.saisir_valeur(self._fenetre, self.grille, *case)
+                        self.validation.verifier_case(*case)
+                        self._rendu.invalider(("case",) + case)
@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module d'export des livrets de grilles.
+    Un livret est un document pdf contenant un grand nombre de grilles, disposées par COLONNES_LIVRET x LIGNES_LIVRET sur chaque page,
+    suivies si besoin des pages de solutions.
+    Contrairement au module pdf, les cases sont dessinées par des rectangles et des traits vectoriels, sans aucune image:
+    le document est plus léger et plus rapide à produire.
+
+    Les grilles sont parcourues au fil de l'eau: seules leurs solutions sont conservées, encodées par le module serialisation,
+    jusqu'à l'écriture des pages de solutions.
+
+    Un grand livret peut aussi être découpé en volumes de GRILLES_PAR_VOLUME_LIVRET grilles, chacun suivi de ses solutions,
+    rendus en parallèle par un groupe de processus et écrits dans des fichiers séparés.
+
+    Ce module possède une unique classe Livret.
+
+    Modules importés:
+        - os: utilisé pour déterminer le nombre de processus et le nom des volumes
+        - concurrent.futures: utilisé pour rendre les volumes dans un groupe de processus
+        - fpdf: utilisé pour la génération du fichier pdf
+        - cases: utilisé pour déterminer le type des cases à dessiner
+        - grille: utilisé pour recréer les grilles des pages de solutions
+        - serialisation: utilisé pour conserver les solutions sous forme compacte
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import concurrent.futures
+from fpdf import FPDF
+import cases
+import grille
+import serialisation
+from constantes import *
+
+# Conversion des tailles de police, exprimées en points, en millimètres
+POINTS_PAR_MILLIMETRE = 72 / 25.4
+
+
+class Livret(FPDF):
+    """ Classe modélisant un livret de grilles.
+        Cette classe possède 4 attributs, en plus de ceux de FPDF:
+            - solutions: True si les pages de solutions sont ajoutées à la fin du livret
+            - colonnes: le nombre de grilles par ligne d'une page
+            - lignes: le nombre de lignes de grilles d'une page
+            - titre: le titre affiché en en-tête des pages en cours d'écriture
+    """
+
+    def __init__(self, solutions=True, colonnes=COLONNES_LIVRET, lignes=LIGNES_LIVRET):
+        """ Initialise le document. Les pages sont ajoutées par le livret lui-même, sans saut de page automatique. """
+        FPDF.__init__(self)
+        self.set_auto_page_break(False)
+        self.set_line_width(EPAISSEUR_TRAIT_LIVRET)
+        self.solutions = solutions
+        self.colonnes = colonnes
+        self.lignes = lignes
+        self.titre = TITRE_LIVRET
+
+    def header(self):
+        """ Écrit en haut de chaque page le titre courant et le numéro de la page """
+        self.set_font(POLICE_LIVRET, "B", 16)
+        self.text(MARGE_LIVRET, MARGE_LIVRET + 6, self.titre)
+        numero = str(self.page_no())
+        self.set_font(POLICE_LIVRET, "", 10)
+        self.text(self.w - MARGE_LIVRET - self.get_string_width(numero), MARGE_LIVRET + 6, numero)
+
+    def generer(self, grilles, nom_fichier):
+        """ Écrit dans le fichier dont le chemin est passé en paramètre le livret des grilles de l'itérable donné.
+            Retourne le nombre de grilles du livret.
+        """
+        encodees = []
+        nombre = self.ajouter_grilles(grilles, 1, encodees if self.solutions else None)
+
+        if self.solutions and nombre > 0:
+            self.titre = TITRE_SOLUTIONS_LIVRET
+            self.ajouter_grilles(Livret._decoder(encodees), 1, solution=True)
+
+        self.output(nom_fichier)
+        return nombre
+
+    def ajouter_grilles(self, grilles, premier=1, encodees=None, solution=False):
+        """ Ajoute au livret les grilles de l'itérable passé en paramètre, en commençant une nouvelle page.
+            Les grilles sont numérotées à partir de premier. Si solution vaut True, les cases vides contiennent leur solution.
+            Si une liste encodees est passée en paramètre, les grilles encodées par le module serialisation y sont ajoutées.
+            Retourne le nombre de grilles ajoutées.
+        """
+        par_page = self.colonnes * self.lignes
+        nombre = 0
+        for grille_livret in grilles:
+            if nombre % par_page == 0:
+                self.add_page()
+            if encodees is not None:
+                encodees.append(serialisation.encoder(grille_livret._grid, grille_livret.nb_colonne, grille_livret.nb_ligne))
+
+            x, y, largeur, hauteur = self.emplacement(nombre % par_page)
+            self.set_font(POLICE_LIVRET, "B", 10)
+            self.text(x, y + HAUTEUR_NUMERO_LIVRET - 1, FORMAT_NUMERO_GRILLE_LIVRET.format(premier + nombre))
+            self.dessiner_grille(grille_livret._grid, grille_livret.nb_colonne, grille_livret.nb_ligne,
+                                 x, y + HAUTEUR_NUMERO_LIVRET, largeur, hauteur - HAUTEUR_NUMERO_LIVRET, solution)
+            nombre += 1
+        return nombre
+
+    def emplacement(self, indice):
+        """ Retourne la position et les dimensions (x, y, largeur, hauteur) de l'emplacement d'indice passé en paramètre sur une page """
+        largeur = (self.w - 2 * MARGE_LIVRET - (self.colonnes - 1) * ESPACE_LIVRET) / self.colonnes
+        hauteur = (self.h - 2 * MARGE_LIVRET - HAUTEUR_TITRE_LIVRET - (self.lignes - 1) * ESPACE_LIVRET) / self.lignes
+        colonne, ligne = indice % self.colonnes, indice // self.colonnes
+        return (MARGE_LIVRET + colonne * (largeur + ESPACE_LIVRET),
+                MARGE_LIVRET + HAUTEUR_TITRE_LIVRET + ligne * (hauteur + ESPACE_LIVRET), largeur, hauteur)
+
+    def dessiner_grille(self, grid, nb_colonne, nb_ligne, x, y, largeur, hauteur, solution=False):
+        """ Dessine le dictionnaire de cases passé en paramètre dans le rectangle donné, avec des cases carrées aussi grandes que possible.
+            Les cases noires et les indicatrices sont remplies, puis le quadrillage est tracé en une ligne par rangée.
+        """
+        cote = min(largeur / nb_colonne, hauteur / nb_ligne)
+        taille_indicatrice = cote * PROPORTION_INDICATRICE_LIVRET * POINTS_PAR_MILLIMETRE
+        taille_solution = cote * PROPORTION_SOLUTION_LIVRET * POINTS_PAR_MILLIMETRE
+
+        for (i, j), case in grid.items():
+            gauche, haut = x + i * cote, y + j * cote
+            if type(case) is cases.Indicatrice:
+                self.set_fill_color(*COULEUR_INDICATRICE_LIVRET)
+                self.rect(gauche, haut, cote, cote, "F")
+                self.line(gauche, haut, gauche + cote, haut + cote)
+                self.set_font(POLICE_LIVRET, "", taille_indicatrice)
+                if case.valeur_droite:
+                    self.text(gauche + cote * 0.55, haut + cote * 0.4, str(case.valeur_droite))
+                if case.valeur_bas:
+                    self.text(gauche + cote * 0.1, haut + cote * 0.9, str(case.valeur_bas))
+            elif type(case) is cases.CaseVide:
+                if solution and VALEUR_MIN <= case._solution_case <= VALEUR_MAX:
+                    self.set_font(POLICE_LIVRET, "", taille_solution)
+                    valeur = str(case._solution_case)
+                    self.text(gauche + (cote - self.get_string_width(valeur)) / 2, haut + cote * 0.75, valeur)
+            else:
+                self.set_fill_color(*COULEUR_CASE_NOIRE_LIVRET)
+                self.rect(gauche, haut, cote, cote, "F")
+
+        for j in range(nb_ligne + 1):
+            self.line(x, y + j * cote, x + nb_colonne * cote, y + j * cote)
+        for i in range(nb_colonne + 1):
+            self.line(x + i * cote, y, x + i * cote, y + nb_ligne * cote)
+
+    @staticmethod
+    def generer_volumes(grilles, nom_fichier, solutions=True, processus=None, progression=None, taille_volume=GRILLES_PAR_VOLUME_LIVRET):
+        """ Écrit les grilles de l'itérable passé en paramètre dans des volumes de taille_volume grilles, rendus en parallèle.
+            Les volumes sont nommés selon FORMAT_VOLUME_LIVRET à partir du nom de fichier passé en paramètre, et leurs grilles sont numérotées à la suite.
+            Le nombre de processus vaut par défaut le nombre de processeurs. Avec un seul processus, les volumes sont rendus dans le processus courant.
+            Si une fonction progression est passée en paramètre, elle est appelée après chaque volume écrit, avec le nombre total de grilles écrites.
+            Retourne la liste des chemins des volumes écrits, dans l'ordre.
+        """
+        processus = processus or os.cpu_count() or 1
+        base = nom_fichier[:-len(EXTENSION_FICHIER_IMPRESSION)] if nom_fichier.endswith(EXTENSION_FICHIER_IMPRESSION) else nom_fichier
+        volumes = Livret._volumes(grilles, base, taille_volume)
+
+        chemins, ecrites = [], 0
+        if processus == 1:
+            for volume in volumes:
+                premier, chemin, nombre = _rendre_volume(solutions, *volume)
+                chemins.append((premier, chemin))
+                ecrites += nombre
+                if progression is not None:
+                    progression(ecrites)
+            return [chemin for (premier, chemin) in chemins]
+
+        with concurrent.futures.ProcessPoolExecutor(processus) as executeur:
+            en_cours = set()
+            for volume in volumes:
+                # Le nombre de volumes en attente est limité, pour ne pas conserver toutes les grilles en mémoire
+                if len(en_cours) >= 2 * processus:
+                    terminees, en_cours = concurrent.futures.wait(en_cours, return_when=concurrent.futures.FIRST_COMPLETED)
+                    ecrites = Livret._terminer(terminees, chemins, ecrites, progression)
+                en_cours.add(executeur.submit(_rendre_volume, solutions, *volume))
+            Livret._terminer(en_cours, chemins, ecrites, progression)
+
+        return [chemin for (premier, chemin) in sorted(chemins)]
+
+    @staticmethod
+    def _volumes(grilles, base, taille_volume):
+        """ Générateur parcourant les volumes des grilles passées en paramètre, sous la forme (chemin, grilles encodées, numéro de la première grille) """
+        encodees, premier = [], 1
+        for grille_livret in grilles:
+            encodees.append(serialisation.encoder(grille_livret._grid, grille_livret.nb_colonne, grille_livret.nb_ligne))
+            if len(encodees) == taille_volume:
+                yield FORMAT_VOLUME_LIVRET.format(base, (premier - 1) // taille_volume + 1), encodees, premier
+                encodees, premier = [], premier + taille_volume
+        if encodees:
+            yield FORMAT_VOLUME_LIVRET.format(base, (premier - 1) // taille_volume + 1), encodees, premier
+
+    @staticmethod
+    def _terminer(terminees, chemins, ecrites, progression):
+        """ Ajoute aux chemins ceux des volumes terminés passés en paramètre, appelle la fonction progression et retourne le nombre de grilles écrites """
+        for future in terminees:
+            premier, chemin, nombre = future.result()
+            chemins.append((premier, chemin))
+            ecrites += nombre
+            if progression is not None:
+                progression(ecrites)
+        return ecrites
+
+    @staticmethod
+    def _decoder(encodees):
+        """ Générateur parcourant les grilles encodées passées en paramètre """
+        for donnees in encodees:
+            grille_livret = grille.Grille()
+            grille_livret._grid = serialisation.decoder(donnees)
+            grille_livret.nb_colonne, grille_livret.nb_ligne = donnees[len(ENTETE_SAUVEGARDE) + 1], donnees[len(ENTETE_SAUVEGARDE) + 2]
+            yield grille_livret
+
+
+def _rendre_volume(solutions, chemin, encodees, premier):
+    """ Écrit dans le fichier dont le chemin est passé en paramètre le volume des grilles encodées, numérotées à partir de premier.
+        Fonction exécutée par les processus du groupe: elle retourne le numéro de la première grille, le chemin du volume et son nombre de grilles.
+    """
+    volume = Livret(solutions)
+    volume.ajouter_grilles(Livret._decoder(encodees), premier)
+    if solutions:
+        volume.titre = TITRE_SOLUTIONS_LIVRET
+        volume.ajouter_grilles(Livret._decoder(encodees), premier, solution=True)
+    volume.output(chemin)
+    return premier, chemin, len(encodees)
@@ -4,13 +4,31 @@
 """ Module principal du jeu Kakurawwr.
     Le lancement du module provoque le lancement du produit dans son état actuel.
     Actuellement le jeu est entièrement fonctionnel.
+
+    Options de lancement:
+        - --journal NIVEAU: active le journal de débogage au niveau donné (DEBUG, INFO...)
+        - --profil [DOSSIER]: profile la résolution, la génération et le rendu des images, les profils étant écrits dans DOSSIER à la fermeture
 """
 
+import argparse
 import pygame
 from pygame.locals import *
 import menu
+import reserve
+import prechargement
+import ressources
+import diagnostic
 from constantes import *
 
+options = argparse.ArgumentParser(description=TITRE_JEU)
+options.add_argument("--journal", metavar="NIVEAU", help="active le journal de débogage au niveau donné")
+options.add_argument("--profil", nargs="?", const=CHEMIN_DOSSIER_PROFILS, metavar="DOSSIER", help="profile les phases coûteuses et écrit les profils dans DOSSIER")
+options = options.parse_args()
+if options.journal:
+    diagnostic.activer_journal(options.journal)
+if options.profil:
+    diagnostic.activer_profilage(options.profil)
+
 pygame.init()
 
 # Création de la fenêtre
@@ -19,9 +37,25 @@ pygame.display.set_caption(TITRE_JEU)
 pygame.display.set_icon(pygame.image.load(CHEMIN_IMAGE_ICONE))
 fenetre.fill(COULEUR_FOND)
 
+# Chargement des images et des polices en arrière-plan, pendant l'affichage du menu
+ressources.precharger_en_arriere_plan()
+
 # curseur est un rect de 0 par 0 (un point) qui suit le curseur
 curseur = pygame.Rect(pygame.mouse.get_pos(), (0, 0))
 
+# Remplissage de la réserve de grilles en arrière-plan
+reserve_grilles = reserve.Reserve()
+reserve_grilles.demarrer()
+
+# Préparation d'une grille par difficulté pendant l'affichage des menus
+prechargement_grilles = prechargement.Prechargement(reserve_grilles)
+prechargement_grilles.demarrer()
+
 # Lancement du jeu
-ecran_menu = menu.Menu(fenetre)
-ecran_menu.wait_evenement()
+try:
+    ecran_menu = menu.Menu(fenetre, reserve_grilles, prechargement_grilles)
+    ecran_menu.wait_evenement()
+finally:
+    prechargement_grilles.arreter()
+    reserve_grilles.arreter()
+    diagnostic.desactiver_profilage()
@@ -8,59 +8,70 @@
     Modules importés:
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour manier les boutons de l'écran
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
         - constantes: utilisé par toutes les méthodes
         - generation: utilisé pour acceder à l'écran de génération
         - sauvegarde: utilisé pour acceder à l'écran de sauvegarde
         - editeur: utilisé pour acceder à l'écran d'éditeur
+
+    Les modules des écrans ne sont importés qu'à la première ouverture de leur écran:
+    le menu, premier écran affiché, est ainsi chargé sans les écrans de jeu, d'édition et d'impression, ni la bibliothèque fpdf.
 """
 
 import pygame
 from pygame.locals import *
 import pygame.freetype
 import boutons
-import generation
-import editeur
-import sauvegarde
+import ressources
+import boucle
+import rendu
 from constantes import *
 
 
 class Menu:
     """ Modèle de donnée utilisé pour modéliser le menu, dans sa représentation graphique aussi bien que dans son fontionnement.
-        Cette classe possède 4 attributs:
+        Cette classe possède 7 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
+            - _reserve: la réserve de grilles pré-générées, transmise à l'écran de génération
+            - _prechargement: le préchargement des grilles, actif tant que le menu est affiché
             - bouton_jouer: bouton permettant d'acceder au jouer
             - bouton_editeur: bouton permettant d'acceder a l'editeur
             - bouton_charger: bouton permettant de charger une grille puis de la jouer
     """
 
-    def __init__(self, fenetre):
+    def __init__(self, fenetre, reserve_grilles=None, prechargement=None):
         """ Initialise les attributs de la classe.
-            La fenetre d'affichage est passée en paramètre.
+            La fenetre d'affichage est passée en paramètre, ainsi que la réserve de grilles et le préchargement éventuels.
             Les autres éléments sont des boutons, initialisés avec des titres définis dans les constantes.
         """
 
         self._fenetre = fenetre
+        self._reserve = reserve_grilles
+        self._prechargement = prechargement
 
         self.bouton_jouer = boutons.Bouton(TITRE_BOUTON_JOUER)
         self.bouton_charger = boutons.Bouton(TITRE_BOUTON_CHARGER)
         self.bouton_editeur = boutons.Bouton(TITRE_BOUTON_EDITEUR)
+        self._rendu = rendu.Rendu()
 
     def afficher(self):
-        """ Méthode permettant d'afficher le menu à l'écran.
-            Chacun des boutons du menu est affiché.
-            Par la suite, la grille est affichée.
+        """ Méthode permettant de déclarer le menu à son rendu.
+            Le titre et chacun des boutons du menu sont déclarés.
 
-            La méthode afficher de la classe Bouton est utilisée pour afficher les boutons.
+            La méthode afficher de la classe Bouton est utilisée pour dessiner les boutons.
         """
 
-        img_kakurawwr = pygame.image.load(CHEMIN_IMAGE_KAKURAWWR).convert_alpha()
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        img_kakurawwr = ressources.image(CHEMIN_IMAGE_KAKURAWWR, True)
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
-        self._fenetre.blit(img_kakurawwr, POSITION_IMG_KAKURAWWR)
-        self.bouton_jouer.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_JOUER)
-        self.bouton_charger.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_CHARGER)
-        self.bouton_editeur.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_EDITEUR)
+        self._rendu.ajouter("titre", POSITION_IMG_KAKURAWWR, self._fenetre.blit, img_kakurawwr, POSITION_IMG_KAKURAWWR)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_jouer, bouton_img, titre_bouton, POSITION_BOUTON_JOUER)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_charger, bouton_img, titre_bouton, POSITION_BOUTON_CHARGER)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_editeur, bouton_img, titre_bouton, POSITION_BOUTON_EDITEUR)
 
     def wait_evenement(self):
         """ Méthode d'attente d'évenements de la classe.
@@ -73,11 +84,13 @@ class Menu:
         """
         # Boucle infinie - Attente d'évenement
         while True:
-            self._fenetre.fill(COULEUR_FOND)
+            if self._prechargement is not None:
+                self._prechargement.activer()
+
             self.afficher()
-            pygame.display.flip()
+            self._rendu.mettre_a_jour(self._fenetre)
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
                 if event.type == QUIT:
                     pygame.quit()
                 # Traitement des clics boutons
@@ -86,13 +99,26 @@ class Menu:
                     curseur = pygame.Rect(event.pos, (0, 0))
 
                     if self.bouton_jouer.clicked(curseur):
-                        ecran_difficulte = generation.Generation(self._fenetre)
+                        import generation
+                        ecran_difficulte = generation.Generation(self._fenetre, self._reserve, self._prechargement)
                         ecran_difficulte.choisir_difficulte()
+                        self._rendu.invalider()
 
                     elif self.bouton_charger.clicked(curseur):
+                        self.suspendre_prechargement()
+                        import sauvegarde
                         ecran_chargement = sauvegarde.Chargement(self._fenetre)
                         ecran_chargement.chargement()
+                        self._rendu.invalider()
 
                     elif self.bouton_editeur.clicked(curseur):
+                        self.suspendre_prechargement()
+                        import editeur
                         ecran_editeur = editeur.Editeur(self._fenetre)
                         ecran_editeur.edition()
+                        self._rendu.invalider()
+
+    def suspendre_prechargement(self):
+        """ Suspend le préchargement des grilles lorsque le joueur quitte les menus. """
+        if self._prechargement is not None:
+            self._prechargement.suspendre()
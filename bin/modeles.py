@@ -0,0 +1,295 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant la bibliothèque de modèles de structure utilisée lors de la génération de grille.
+
+    Un modèle de structure décrit la forme d'une grille: pour chaque case, il indique si elle est blanche (une case vide à remplir) ou pleine (une indicatrice ou une case noire).
+    Il est représenté par une chaine de nb_ligne * nb_colonne caractères, parcourue ligne par ligne.
+    La nature d'une case pleine n'est pas stockée: c'est une indicatrice si une case blanche la suit à droite ou en-dessous, une case noire sinon.
+
+    Les modèles sont précalculés et validés une fois pour toutes, puis enregistrés dans le fichier CHEMIN_FICHIER_MODELES.
+    Lors de la génération, un modèle est tiré au hasard puis transformé (miroirs, transposition) pour varier les grilles.
+
+    Contient la classe suivante:
+        - Modeles
+
+    Modules importés:
+        - os: utilisé pour l'enregistrement de la bibliothèque
+        - random: utilisé pour créer et tirer les modèles
+        - threading: utilisé pour partager la bibliothèque entre les threads de génération
+        - constantes: utilisé dans toutes les méthodes
+"""
+
+import os
+import random
+import threading
+from constantes import *
+
+
+class Modeles:
+    """ Classe modélisant la bibliothèque de modèles de structure.
+        Cette classe possède 5 attributs:
+            - _chemin: le chemin du fichier de la bibliothèque
+            - nb_ligne, nb_colonne: les dimensions des modèles
+            - _modeles: dictionnaire associant à chaque difficulté la liste de ses modèles
+            - _charge: booléen indiquant si le fichier de la bibliothèque a déjà été lu
+    """
+
+    _partagee = None
+    _verrou_partage = threading.Lock()
+
+    def __init__(self, chemin=CHEMIN_FICHIER_MODELES, nb_ligne=NB_LIGNE_GRILLE, nb_colonne=NB_COLONNE_GRILLE):
+        """ Initialise une bibliothèque vide, associée au fichier passé en paramètre.
+            Le fichier n'est lu qu'au premier tirage.
+        """
+        self._chemin = chemin
+        self.nb_ligne = nb_ligne
+        self.nb_colonne = nb_colonne
+        self._modeles = {difficulte: [] for difficulte in DIFFICULTES}
+        self._charge = False
+
+    def __len__(self):
+        """ Retourne le nombre total de modèles de la bibliothèque """
+        return sum(len(liste) for liste in self._modeles.values())
+
+    @classmethod
+    def partagee(cls):
+        """ Retourne la bibliothèque partagée par toutes les grilles, créée lors du premier appel. """
+        with cls._verrou_partage:
+            if cls._partagee is None:
+                cls._partagee = cls()
+            return cls._partagee
+
+    ############################################################# Fichier ##########################################################################
+
+    def charger(self):
+        """ Charge les modèles depuis le fichier de la bibliothèque.
+            Chaque ligne du fichier contient une difficulté et un modèle, séparés par un espace.
+            Les lignes invalides sont ignorées. Un fichier absent donne une bibliothèque vide.
+        """
+        self._charge = True
+        if not os.path.isfile(self._chemin):
+            return
+
+        with open(self._chemin, "r") as fichier:
+            for ligne in fichier:
+                elements = ligne.split()
+                if len(elements) == 2 and elements[0] in self._modeles and self.valider(elements[1]):
+                    self._modeles[elements[0]].append(elements[1])
+
+    def sauvegarder(self):
+        """ Enregistre les modèles de la bibliothèque dans son fichier """
+        dossier = os.path.dirname(self._chemin)
+        if dossier and not os.path.isdir(dossier):
+            os.mkdir(dossier)
+
+        with open(self._chemin, "w") as fichier:
+            for difficulte in DIFFICULTES:
+                for structure in self._modeles[difficulte]:
+                    fichier.write(difficulte + " " + structure + "\n")
+
+    ############################################################# Bibliothèque ##########################################################################
+
+    def tirer(self, difficulte):
+        """ Retourne un modèle de la difficulté passée en paramètre, transformé aléatoirement.
+            Si la bibliothèque ne contient aucun modèle de cette difficulté, la méthode retourne None.
+        """
+        if not self._charge:
+            self.charger()
+
+        if not self._modeles[difficulte]:
+            return None
+
+        structure = random.choice(self._modeles[difficulte])
+        for transformation in self.transformations():
+            if random.random() < 0.5:
+                structure = self.transformer(structure, transformation)
+        return structure
+
+    def ajouter(self, difficulte, structure):
+        """ Ajoute un modèle à la bibliothèque s'il est valide et qu'aucune de ses transformations n'y est déjà.
+            Retourne True si le modèle a été ajouté, False sinon.
+        """
+        if not self.valider(structure, Modeles.nb_cases_vides_min(difficulte)):
+            return False
+
+        forme = self.forme_canonique(structure)
+        if forme in self._modeles[difficulte]:
+            return False
+
+        self._modeles[difficulte].append(forme)
+        return True
+
+    def construire(self, difficulte, nombre=NB_MODELES_PAR_DIFFICULTE):
+        """ Complète la bibliothèque jusqu'à nombre modèles pour la difficulté passée en paramètre.
+            Les modèles sont créés aléatoirement puis réparés. Seuls les modèles valides et distincts sont conservés.
+        """
+        nb_indicatrice = Modeles.nb_indicatrices(difficulte)
+        while len(self._modeles[difficulte]) < nombre:
+            structure = self.reparer(self.structure_aleatoire(nb_indicatrice))
+            self.ajouter(difficulte, structure)
+
+    ############################################################# Création ##########################################################################
+
+    def structure_aleatoire(self, nb_indicatrice):
+        """ Crée un modèle de la même manière que la génération de grille historique.
+            La première ligne et la première colonne sont pleines, à un décalage aléatoire près.
+            nb_indicatrice cases pleines supplémentaires sont ensuite placées au hasard.
+        """
+        pleines = set()
+
+        for i in range(self.nb_colonne):
+            decalage = random.choice(range(0, 2))
+            pleines.update((i, j) for j in range(decalage + 1))
+        for j in range(self.nb_ligne):
+            decalage = random.choice(range(0, 2))
+            pleines.update((i, j) for i in range(decalage + 1))
+
+        for n in range(nb_indicatrice):
+            pleines.add((random.choice(range(1, self.nb_colonne)), random.choice(range(1, self.nb_ligne))))
+
+        return "".join(CASE_MODELE_PLEINE if (i, j) in pleines else CASE_MODELE_BLANCHE for j in range(self.nb_ligne) for i in range(self.nb_colonne))
+
+    def reparer(self, structure):
+        """ Supprime les défauts d'un modèle.
+            Les cases blanches isolées, n'ayant de voisine blanche ni sur leur ligne ni sur leur colonne, deviennent pleines.
+            Seule la plus grande zone de cases blanches connexes est conservée.
+        """
+        cases_modele = list(structure)
+
+        for j in range(self.nb_ligne):
+            for i in range(self.nb_colonne):
+                if self.est_blanche(structure, i, j):
+                    horizontal = self.est_blanche(structure, i - 1, j) or self.est_blanche(structure, i + 1, j)
+                    vertical = self.est_blanche(structure, i, j - 1) or self.est_blanche(structure, i, j + 1)
+                    if not horizontal and not vertical:
+                        cases_modele[j * self.nb_colonne + i] = CASE_MODELE_PLEINE
+
+        structure = "".join(cases_modele)
+        zone = self.plus_grande_zone(structure)
+
+        return "".join(CASE_MODELE_BLANCHE if (indice % self.nb_colonne, indice // self.nb_colonne) in zone else CASE_MODELE_PLEINE for indice in range(len(structure)))
+
+    def plus_grande_zone(self, structure):
+        """ Retourne l'ensemble des coordonnées de la plus grande zone de cases blanches connexes du modèle """
+        vues = set()
+        meilleure = set()
+
+        for j in range(self.nb_ligne):
+            for i in range(self.nb_colonne):
+                if self.est_blanche(structure, i, j) and (i, j) not in vues:
+                    zone = {(i, j)}
+                    a_explorer = [(i, j)]
+                    while a_explorer:
+                        x, y = a_explorer.pop()
+                        for voisine in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                            if voisine not in zone and self.est_blanche(structure, *voisine):
+                                zone.add(voisine)
+                                a_explorer.append(voisine)
+                    vues.update(zone)
+                    if len(zone) > len(meilleure):
+                        meilleure = zone
+
+        return meilleure
+
+    ############################################################# Validation ##########################################################################
+
+    def est_blanche(self, structure, i, j):
+        """ Retourne True si la case (i, j) du modèle est une case blanche. Une case hors du modèle n'est pas blanche. """
+        if 0 <= i < self.nb_colonne and 0 <= j < self.nb_ligne:
+            return structure[j * self.nb_colonne + i] == CASE_MODELE_BLANCHE
+        return False
+
+    def valider(self, structure, nb_cases_vides_min=1):
+        """ Vérifie qu'un modèle est utilisable pour générer une grille.
+            Le modèle doit avoir la bonne taille, une première ligne et une première colonne pleines, aucune case blanche isolée,
+            des cases blanches connexes, et au moins nb_cases_vides_min cases blanches.
+        """
+        if len(structure) != self.nb_ligne * self.nb_colonne or set(structure) - {CASE_MODELE_BLANCHE, CASE_MODELE_PLEINE}:
+            return False
+
+        for i in range(self.nb_colonne):
+            if self.est_blanche(structure, i, 0):
+                return False
+        for j in range(self.nb_ligne):
+            if self.est_blanche(structure, 0, j):
+                return False
+
+        if structure.count(CASE_MODELE_BLANCHE) < nb_cases_vides_min:
+            return False
+
+        # Un modèle sans défaut est inchangé par la réparation
+        return self.reparer(structure) == structure
+
+    ############################################################# Transformations ##########################################################################
+
+    def transformations(self):
+        """ Retourne la liste des transformations valides pour les dimensions de la bibliothèque.
+            La première ligne et la première colonne restant pleines, les miroirs ne portent que sur le reste de la grille.
+            La transposition n'est valide que pour une grille carrée.
+        """
+        resultat = ["miroir_horizontal", "miroir_vertical"]
+        if self.nb_ligne == self.nb_colonne:
+            resultat.append("transposition")
+        return resultat
+
+    def transformer(self, structure, transformation):
+        """ Applique la transformation passée en paramètre au modèle et retourne le modèle obtenu """
+        resultat = []
+        for j in range(self.nb_ligne):
+            for i in range(self.nb_colonne):
+                if transformation == "miroir_horizontal" and i != 0:
+                    source = (self.nb_colonne - i, j)
+                elif transformation == "miroir_vertical" and j != 0:
+                    source = (i, self.nb_ligne - j)
+                elif transformation == "transposition":
+                    source = (j, i)
+                else:
+                    source = (i, j)
+                resultat.append(structure[source[1] * self.nb_colonne + source[0]])
+        return "".join(resultat)
+
+    def forme_canonique(self, structure):
+        """ Retourne la plus petite, dans l'ordre lexicographique, des transformations du modèle.
+            Deux modèles se déduisant l'un de l'autre par transformation ont donc la même forme canonique.
+        """
+        formes = {structure}
+        for transformation in self.transformations():
+            formes.update([self.transformer(forme, transformation) for forme in formes])
+        return min(formes)
+
+    ############################################################# Difficulté ##########################################################################
+
+    @staticmethod
+    def nb_indicatrices(difficulte):
+        """ Retourne le nombre d'indicatrices supplémentaires placées lors de la création d'un modèle de la difficulté passée en paramètre """
+        if difficulte == "facile":
+            return NB_INDICATRICE_FACILE
+        elif difficulte == "moyen":
+            return NB_INDICATRICE_MOYEN
+        elif difficulte == "difficile":
+            return NB_INDICATRICE_DIFFICILE
+        else:
+            return NB_INDICATRICE_MDFT
+
+    @staticmethod
+    def nb_cases_vides_min(difficulte):
+        """ Retourne le nombre minimal de cases blanches d'un modèle de la difficulté passée en paramètre """
+        if difficulte == "facile":
+            return NB_CASES_VIDES_MIN_FACILE
+        elif difficulte == "moyen":
+            return NB_CASES_VIDES_MIN_MOYEN
+        elif difficulte == "difficile":
+            return NB_CASES_VIDES_MIN_DIFFICILE
+        else:
+            return NB_CASES_VIDES_MIN_MDFT
+
+
+if __name__ == "__main__":
+    """ En executant ce fichier, la bibliothèque de modèles est construite et enregistrée dans CHEMIN_FICHIER_MODELES. """
+    bibliotheque = Modeles()
+    bibliotheque.charger()
+    for difficulte in DIFFICULTES:
+        bibliotheque.construire(difficulte)
+        print(difficulte, ":", len(bibliotheque._modeles[difficulte]), "modèles")
+    bibliotheque.sauvegarder()
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de préchargement des grilles du produit.
+    Ce module permet de préparer, pendant que le joueur est sur les menus, une grille vérifiée pour chaque difficulté.
+    Ce module possède une unique classe Prechargement.
+
+    Modules importés:
+        - threading: utilisé pour préparer les grilles en arrière-plan
+        - grille: utilisé pour générer et vérifier les grilles
+        - exceptions: utilisé lors de la vérification des grilles
+        - constantes: utilisé par toutes les méthodes
+"""
+
+import threading
+import grille
+from exceptions import *
+from constantes import *
+
+
+class Prechargement:
+    """ Classe modélisant le préchargement des grilles.
+        Un thread prépare une grille par difficulté tant que le préchargement est actif, c'est à dire tant qu'un menu est affiché.
+        Cette classe possède 7 attributs:
+            - _reserve: la réserve de grilles dans laquelle les grilles sont piochées, ou None
+            - _pretes: dictionnaire associant à chaque difficulté la grille préparée
+            - _verrou: verrou protégeant l'accès aux grilles préparées
+            - _actif: événement indiquant qu'un menu est affiché et que le thread peut travailler
+            - _besoin: événement réveillant le thread lorsqu'une grille préparée a été prise
+            - _arret: événement demandant l'arrêt du thread
+            - _thread: le thread de préchargement
+    """
+
+    def __init__(self, reserve_grilles=None):
+        """ Initialise les attributs de la classe.
+            La réserve de grilles éventuelle est passée en paramètre.
+            Le préchargement est initialement suspendu.
+        """
+        self._reserve = reserve_grilles
+        self._pretes = {}
+        self._verrou = threading.Lock()
+        self._actif = threading.Event()
+        self._besoin = threading.Event()
+        self._arret = threading.Event()
+        self._thread = None
+
+    def demarrer(self):
+        """ Lance le thread de préchargement. Ce thread est un daemon: il ne retient pas la fermeture du jeu. """
+        self._arret.clear()
+        self._thread = threading.Thread(target=self._preparation, name="prechargement", daemon=True)
+        self._thread.start()
+
+    def arreter(self):
+        """ Demande l'arrêt du thread de préchargement et attend sa fin.
+            La grille éventuellement en cours de préparation est abandonnée.
+        """
+        self._arret.set()
+        self._actif.set()
+        self._besoin.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def activer(self):
+        """ Autorise le thread à préparer des grilles. Appelée pendant l'affichage des menus. """
+        self._actif.set()
+
+    def suspendre(self):
+        """ Suspend la préparation des grilles. Appelée lorsque le joueur quitte les menus. """
+        self._actif.clear()
+
+    def prendre(self, difficulte):
+        """ Retourne la grille préparée de la difficulté passée en paramètre et la retire du préchargement.
+            Si aucune grille n'est prête, la méthode retourne None.
+        """
+        with self._verrou:
+            grille_prete = self._pretes.pop(difficulte, None)
+        self._besoin.set()
+        return grille_prete
+
+    def _preparation(self):
+        """ Boucle du thread de préchargement.
+            Tant que le préchargement est actif, une grille est préparée pour chaque difficulté n'en ayant pas.
+            Lorsque toutes les difficultés ont une grille prête, le thread attend qu'une grille soit prise.
+        """
+        while not self._arret.is_set():
+            self._actif.wait()
+            self._besoin.clear()
+            complet = True
+
+            for difficulte in DIFFICULTES:
+                if self._arret.is_set() or not self._actif.is_set():
+                    complet = False
+                    break
+
+                with self._verrou:
+                    deja_prete = difficulte in self._pretes
+                if deja_prete:
+                    continue
+
+                candidate = self._produire(difficulte)
+                if Prechargement.verifier(candidate):
+                    with self._verrou:
+                        self._pretes.setdefault(difficulte, candidate)
+                else:
+                    complet = False
+
+            if complet:
+                self._besoin.wait(DELAI_ATTENTE_PRECHARGEMENT)
+
+    def _produire(self, difficulte):
+        """ Retourne une grille candidate de la difficulté passée en paramètre.
+            La grille est piochée dans la réserve si possible, générée sinon.
+        """
+        candidate = None
+        if self._reserve is not None:
+            candidate = self._reserve.piocher(difficulte)
+
+        if candidate is None:
+            candidate = grille.Grille()
+            candidate.generer_grille(difficulte)
+        return candidate
+
+    @staticmethod
+    def verifier(candidate):
+        """ Méthode vérifiant qu'une grille est jouable.
+            Aucune indicatrice ne doit être bloquée, et la solution de la grille doit respecter les règles du jeu.
+            La vérification se fait sur une copie, la grille passée en paramètre n'est pas modifiée.
+        """
+        copie = grille.Grille(grid=candidate._grid)
+
+        for (i, j) in copie.keys():
+            if copie.blocked(i, j):
+                return False
+
+        copie.solve()
+        try:
+            return copie.validate() and copie.victoire()
+        except (DoublonException, SommeIncorrecteException, ExceptionMixte):
+            return False
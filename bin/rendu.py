@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant le moteur d'affichage partiel des écrans.
+
+    Plutôt que d'effacer puis de redessiner toute la fenêtre à chaque itération, un écran déclare à chaque image les éléments qui la composent
+    (boutons, cases de la grille, barre d'erreur...), chacun associé à une signature décrivant son état.
+    Seuls les éléments dont la signature a changé depuis l'image précédente sont effacés et redessinés,
+    et seules les zones modifiées de la fenêtre sont mises à jour par pygame.display.update.
+
+    Contient la classe suivante:
+        - Rendu
+
+    Modules importés:
+        - pygame: utilisé pour la mise à jour de la fenêtre
+        - vue_grille: utilisé pour dessiner les cases de la grille depuis sa couche statique
+        - diagnostic: utilisé pour profiler le dessin des images
+        - constantes: utilisé pour la couleur de fond des écrans
+"""
+
+import pygame
+import vue_grille
+import diagnostic
+from constantes import *
+
+
+class Rendu:
+    """ Classe modélisant l'affichage partiel d'un écran.
+        Cette classe possède 5 attributs:
+            - _couleur_fond: la couleur utilisée pour effacer les éléments modifiés
+            - _vue_grille: l'affichage en couches de la grille de l'écran
+            - _elements: dictionnaire associant à chaque élément affiché sa signature et la zone qu'il occupe
+            - _a_dessiner: liste des éléments déclarés pour l'image en cours
+            - _complet: booléen indiquant si la prochaine image doit être entièrement redessinée
+    """
+
+    def __init__(self, couleur_fond=COULEUR_FOND):
+        """ Initialise un rendu vide. La première image sera entièrement dessinée. """
+        self._couleur_fond = couleur_fond
+        self._vue_grille = vue_grille.VueGrille()
+        self._elements = {}
+        self._a_dessiner = []
+        self._complet = True
+
+    def ajouter(self, cle, signature, fonction, *parametres):
+        """ Déclare un élément de l'image en cours.
+            cle identifie l'élément d'une image à l'autre, signature décrit son état.
+            fonction(*parametres) dessine l'élément et retourne le rect de la zone dessinée. Elle n'est appelée que si l'élément doit être redessiné.
+        """
+        self._a_dessiner.append((cle, signature, fonction, parametres))
+
+    def ajouter_bouton(self, fenetre, bouton, image, font_titre, position):
+        """ Déclare un bouton de l'image en cours. Sa signature est son titre et sa position. """
+        self.ajouter(("bouton", id(bouton)), (bouton.titre, position), bouton.afficher, fenetre, image, font_titre, position)
+
+    def ajouter_grille(self, fenetre, grille):
+        """ Déclare chacune des cases de la grille.
+            La couche statique de la grille est préparée, ce qui met à jour le rect des cases, puis chaque case est dessinée depuis cette couche.
+            La signature d'une case comprend l'objet case lui-même: une case remplacée est donc toujours redessinée.
+        """
+        self._vue_grille.preparer(grille)
+        for (i, j), case in grille.items():
+            self.ajouter(("case", i, j), (id(case), case.etat()), self._vue_grille.afficher_case, fenetre, grille, i, j)
+
+    def invalider(self, cle=None):
+        """ Force le dessin d'un élément lors de la prochaine image.
+            Sans paramètre, l'image entière est redessinée: c'est le cas au retour d'un écran ou d'une saisie ayant dessiné sur la fenêtre.
+        """
+        if cle is None:
+            self._complet = True
+        elif cle in self._elements:
+            del self._elements[cle]
+
+    @diagnostic.profiler(PHASE_RENDU)
+    def mettre_a_jour(self, fenetre):
+        """ Dessine les éléments déclarés depuis le dernier appel et met à jour la fenêtre.
+            Les zones des éléments modifiés ou disparus sont effacées. Un élément inchangé recouvrant une zone effacée est lui aussi redessiné.
+            Les éléments sont dessinés dans leur ordre de déclaration.
+        """
+        elements, self._a_dessiner = self._a_dessiner, []
+
+        if self._complet:
+            self._complet = False
+            fenetre.fill(self._couleur_fond)
+            self._elements = {cle: (signature, fonction(*parametres)) for cle, signature, fonction, parametres in elements}
+            pygame.display.flip()
+            return
+
+        cles = {cle for cle, signature, fonction, parametres in elements}
+        modifies = {cle for cle, signature, fonction, parametres in elements if cle not in self._elements or self._elements[cle][0] != signature}
+        effaces = [rect for cle, (signature, rect) in self._elements.items() if cle in modifies or cle not in cles]
+
+        # Propagation aux éléments inchangés touchés par une zone effacée
+        propagation = True
+        while propagation:
+            propagation = False
+            for cle in cles - modifies:
+                rect = self._elements[cle][1]
+                if rect.collidelist(effaces) != -1:
+                    modifies.add(cle)
+                    effaces.append(rect)
+                    propagation = True
+
+        for rect in effaces:
+            fenetre.fill(self._couleur_fond, rect)
+
+        zones = list(effaces)
+        dessines = {}
+        for cle, signature, fonction, parametres in elements:
+            if cle in modifies:
+                rect = fonction(*parametres)
+                zones.append(rect)
+                dessines[cle] = (signature, rect)
+            else:
+                dessines[cle] = self._elements[cle]
+        self._elements = dessines
+
+        if zones:
+            pygame.display.update(zones)
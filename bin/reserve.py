@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de réserve de grilles du produit.
+    Ce module permet de servir instantanément une grille pré-générée d'une difficulté donnée.
+    Ce module possède une unique classe Reserve.
+
+    Les grilles sont conservées sur le disque, dans un fichier par difficulté du dossier CHEMIN_DOSSIER_RESERVE.
+    Chaque grille y est écrite au format du module serialisation, précédée de sa longueur sur OCTETS_LONGUEUR_RESERVE octets.
+    Des threads de remplissage complètent la réserve en arrière-plan, jusqu'à TAILLE_RESERVE grilles par difficulté.
+
+    Modules importés:
+        - os: utilisé pour la lecture et l'écriture des fichiers de la réserve
+        - serialisation: utilisé pour encoder et décoder les grilles des fichiers de la réserve
+        - threading: utilisé pour le remplissage de la réserve en arrière-plan
+        - collections: utilisé pour stocker les grilles de chaque difficulté dans une file
+        - grille: utilisé pour générer les grilles de la réserve
+        - constantes: utilisé par toutes les méthodes
+"""
+
+import os
+import threading
+from collections import deque
+import grille
+import serialisation
+from constantes import *
+
+
+class Reserve:
+    """ Classe modélisant une réserve persistante de grilles, classées par difficulté.
+        Cette classe possède 7 attributs:
+            - _dossier: le dossier où sont enregistrées les grilles de la réserve
+            - _taille: le nombre de grilles à conserver pour chaque difficulté
+            - _grilles: un dictionnaire associant à chaque difficulté une file de grilles (dictionnaires de cases)
+            - _verrou: verrou protégeant l'accès aux files entre le jeu et les threads de remplissage
+            - _verrou_disque: verrou protégeant l'écriture des fichiers de la réserve
+            - _demande: événement réveillant les threads de remplissage lorsqu'une grille a été piochée
+            - _arret: événement demandant l'arrêt des threads de remplissage
+    """
+
+    def __init__(self, dossier=CHEMIN_DOSSIER_RESERVE, taille=TAILLE_RESERVE):
+        """ Initialise les attributs de la classe.
+            Les grilles déjà présentes dans le dossier de la réserve sont chargées.
+        """
+        self._dossier = dossier
+        self._taille = taille
+        self._grilles = {}
+        self._verrou = threading.Lock()
+        self._verrou_disque = threading.Lock()
+        self._demande = threading.Event()
+        self._arret = threading.Event()
+        self._threads = []
+
+        for difficulte in DIFFICULTES:
+            self._grilles[difficulte] = deque(self._charger(difficulte))
+
+    def __len__(self):
+        """ Retourne le nombre total de grilles présentes dans la réserve """
+        with self._verrou:
+            return sum(len(file) for file in self._grilles.values())
+
+    def nombre(self, difficulte):
+        """ Retourne le nombre de grilles de la difficulté passée en paramètre présentes dans la réserve """
+        with self._verrou:
+            return len(self._grilles[difficulte])
+
+    def piocher(self, difficulte):
+        """ Retire une grille de la difficulté demandée de la réserve et la retourne.
+            Si la réserve ne contient aucune grille de cette difficulté, la méthode retourne None.
+            Les threads de remplissage sont réveillés pour compléter la réserve.
+        """
+        with self._verrou:
+            if self._grilles[difficulte]:
+                grid = self._grilles[difficulte].popleft()
+            else:
+                grid = None
+
+        self._demande.set()
+
+        if grid is None:
+            return None
+
+        resultat = grille.Grille(grid=grid)
+        resultat.solved = True
+        return resultat
+
+    def obtenir(self, difficulte):
+        """ Retourne une grille de la difficulté demandée.
+            La grille est piochée dans la réserve. Si la réserve est vide, la grille est générée immédiatement.
+        """
+        resultat = self.piocher(difficulte)
+        if resultat is None:
+            resultat = grille.Grille()
+            resultat.generer_grille(difficulte)
+        return resultat
+
+    def remplir(self, difficulte):
+        """ Génère une grille de la difficulté passée en paramètre et l'ajoute à la réserve si elle n'est pas pleine.
+            Retourne True si une grille a été ajoutée, False sinon.
+        """
+        if self.nombre(difficulte) >= self._taille:
+            return False
+
+        nouvelle = grille.Grille()
+        nouvelle.generer_grille(difficulte)
+
+        with self._verrou:
+            if len(self._grilles[difficulte]) >= self._taille:
+                return False
+            self._grilles[difficulte].append(nouvelle._grid)
+        return True
+
+    def demarrer(self, nb_threads=NB_THREADS_RESERVE):
+        """ Lance les threads de remplissage de la réserve.
+            Ces threads sont des daemons: ils ne retiennent pas la fermeture du jeu.
+        """
+        self._arret.clear()
+        self._demande.set()
+        for numero in range(nb_threads):
+            thread = threading.Thread(target=self._remplissage, name="reserve-" + str(numero), daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def arreter(self):
+        """ Demande l'arrêt des threads de remplissage, attend leur fin et enregistre la réserve sur le disque. """
+        self._arret.set()
+        self._demande.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        for difficulte in DIFFICULTES:
+            self._sauvegarder(difficulte)
+
+    def _remplissage(self):
+        """ Boucle des threads de remplissage.
+            Tant qu'une difficulté n'a pas atteint TAILLE_RESERVE grilles, une grille est générée et ajoutée à la réserve.
+            Lorsque la réserve est pleine, le thread attend qu'une grille soit piochée.
+        """
+        while not self._arret.is_set():
+            self._demande.clear()
+            ajout = False
+
+            for difficulte in DIFFICULTES:
+                if self._arret.is_set():
+                    return
+                if self.remplir(difficulte):
+                    self._sauvegarder(difficulte)
+                    ajout = True
+
+            if not ajout:
+                self._demande.wait(DELAI_ATTENTE_RESERVE)
+
+    def _chemin(self, difficulte):
+        """ Retourne le chemin du fichier de la réserve correspondant à la difficulté passée en paramètre """
+        return os.path.join(self._dossier, difficulte + EXTENSION_FICHIER_RESERVE)
+
+    def _charger(self, difficulte):
+        """ Charge la liste des grilles de la difficulté passée en paramètre depuis le disque.
+            Un fichier absent ou illisible, par exemple écrit dans un format précédent de la réserve, donne une liste vide:
+            la réserve n'est qu'un cache, qui sera de nouveau rempli.
+        """
+        try:
+            with open(self._chemin(difficulte), "rb") as fichier:
+                donnees = fichier.read()
+
+            grids = []
+            position = 0
+            while position < len(donnees):
+                debut = position + OCTETS_LONGUEUR_RESERVE
+                fin = debut + int.from_bytes(donnees[position:debut], "big")
+                if fin > len(donnees):
+                    return []
+                grids.append(serialisation.decoder(donnees[debut:fin]))
+                position = fin
+            return grids
+        except Exception:
+            return []
+
+    def _sauvegarder(self, difficulte):
+        """ Enregistre les grilles de la difficulté passée en paramètre sur le disque.
+            L'écriture passe par un fichier temporaire, pour ne jamais laisser de fichier tronqué.
+        """
+        with self._verrou:
+            grids = list(self._grilles[difficulte])
+
+        with self._verrou_disque:
+            if not os.path.isdir(self._dossier):
+                os.mkdir(self._dossier)
+
+            chemin = self._chemin(difficulte)
+            with open(chemin + ".tmp", "wb") as fichier:
+                for grid in grids:
+                    donnees = serialisation.encoder(grid, *serialisation.dimensions(grid))
+                    fichier.write(len(donnees).to_bytes(OCTETS_LONGUEUR_RESERVE, "big") + donnees)
+            os.replace(chemin + ".tmp", chemin)
@@ -0,0 +1,493 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de calcul de la solution d'une grille.
+    Ce module contient les algorithmes de résolution utilisés par l'écran Solveur, sans aucun affichage.
+    Le calcul peut être exécuté dans un thread séparé: il publie son avancement dans une file, que l'écran lit à chaque image,
+    et s'interrompt lorsque l'événement d'arrêt est positionné.
+    Ce module possède une unique classe Resolveur.
+
+    Modules importés:
+        - time: utilisé pour mesurer la vitesse du calcul
+        - random: utilisé lors du calcul de la solution
+        - itertools: utilisé pour énumérer les combinaisons de chiffres des plages lors du comptage des solutions
+        - cases: utilisé lors du calcul de la solution
+        - grille: utilisé lors du calcul de la solution
+        - exceptions: utilisé pour les grilles sans solutions
+        - logging, diagnostic: utilisés pour profiler le calcul et journaliser ses étapes
+        - constantes: utilisé pour les messages et la fréquence de publication
+"""
+
+import time
+import random
+import itertools
+import logging
+import cases
+import diagnostic
+from diagnostic import journal
+from grille import *
+from exceptions import *
+from constantes import *
+
+
+class Resolveur:
+    """ Classe permettant de calculer la solution d'une grille.
+        Les messages publiés dans la file sont des couples (nature, contenu):
+            - (CALCUL_PROGRESSION, instantané): l'avancement du calcul, sous la forme d'un dictionnaire (voir instantane)
+            - (CALCUL_RESULTAT, grille): la grille résolue
+            - (CALCUL_ERREUR, exception): l'exception ayant interrompu le calcul
+            - (CALCUL_ABANDON, None): le calcul a été arrêté à la demande de l'écran
+        Cette classe possède 10 attributs:
+            - grille: la grille dont la solution est calculée
+            - message: le message décrivant l'étape courante du calcul
+            - noeuds: le nombre de noeuds explorés depuis le début du calcul
+            - profondeur: la profondeur courante de la recherche
+            - _progression: la file dans laquelle l'avancement est publié, ou None
+            - _arret: l'événement demandant l'arrêt du calcul, ou None
+            - _intervalle: la durée minimale (en secondes) entre deux publications, ou None
+            - _noeuds_par_image: le nombre de noeuds explorés entre deux publications, ou 0
+            - _derniere_publication: l'instant de la dernière publication
+            - _debut: l'instant du début du calcul
+    """
+
+    def __init__(self, grille, progression=None, arret=None, images_par_seconde=IMAGES_PAR_SECONDE_SOLVEUR, noeuds_par_image=NOEUDS_PAR_IMAGE_SOLVEUR):
+        """ Initialise les attributs de la classe.
+            La grille passée en paramètre est modifiée par le calcul: l'appelant doit fournir une copie s'il affiche la sienne pendant ce temps.
+            images_par_seconde et noeuds_par_image fixent la fréquence de publication de l'avancement. Une valeur nulle désactive le critère correspondant.
+        """
+        self.grille = grille
+        self.message = ""
+        self.noeuds = 0
+        self.profondeur = 0
+        self._progression = progression
+        self._arret = arret
+        self._intervalle = 1 / images_par_seconde if images_par_seconde else None
+        self._noeuds_par_image = noeuds_par_image
+        self._derniere_publication = 0
+        self._debut = time.monotonic()
+
+    def resoudre(self, flag):
+        """ Calcule la solution de la grille, puis publie le résultat dans la file.
+            Cette méthode est la cible du thread de calcul: aucune exception n'en sort, elle est publiée à la place.
+        """
+        try:
+            trouvee = self.calculate_solution(flag)
+        except Exception as e:
+            self.publier(CALCUL_ERREUR, e)
+            return
+
+        if self.arrete():
+            self.publier(CALCUL_ABANDON, None)
+        elif trouvee:
+            self.publier(CALCUL_RESULTAT, self.grille)
+        else:
+            self.publier(CALCUL_ERREUR, NoSolutionException())
+
+    @diagnostic.profiler(PHASE_RESOLUTION)
+    def calculate_solution(self, flag):
+        """ Méthode permettant de calculer la solution d'une grille.
+            Dans un premier temps, la grille est mis dans une forme calculable.
+            Cette méthode calcule l'ensemble des domaines de valeurs pour chaque plage et affecte à domaine leur intersection.
+            Elle verifie ensuite si la grille à une solution.
+            Elle appelle le solveur sur la première case si c'est le cas.
+            Retourne True si une solution a été trouvée, quel que soit le mode.
+            Si l'arrêt est demandé pendant la préparation de la grille, la méthode retourne False sans lancer la recherche.
+        """
+        self.noeuds = 0
+        self._debut = time.monotonic()
+        self.changer_etape(MESSAGE_CORRECTION_GRILLE)
+        self.correction_grille()
+        self.changer_etape(MESSAGE_ENSEMBLES_POSSIBLES)
+        self.distribuer_domaine()
+        if self.arrete():
+            return False
+
+        self.grille.initDegre()
+        self.changer_etape(MESSAGE_SOLVABILITE)
+        self.has_solution()
+        self.changer_etape(MESSAGE_CALCUL)
+
+        if flag == "SLOW":
+            return self.baseSolver(0, 0)
+
+        else:
+            return self.solver(flag)
+
+    def arrete(self):
+        """ Retourne True si l'arrêt du calcul a été demandé """
+        return self._arret is not None and self._arret.is_set()
+
+    def publier(self, nature, contenu):
+        """ Publie un message dans la file de progression, s'il y en a une """
+        if self._progression is not None:
+            self._progression.put((nature, contenu))
+
+    def instantane(self):
+        """ Retourne l'état courant du calcul, sous la forme d'un dictionnaire contenant:
+                - valeurs: dictionnaire associant à chaque case vide sa valeur saisie
+                - message: le message de l'étape courante
+                - noeuds, noeuds_par_seconde, profondeur: les statistiques de la recherche
+        """
+        duree = time.monotonic() - self._debut
+        return {"valeurs": {(i, j): case.valeur_saisie for (i, j), case in self.grille.items() if type(case) is cases.CaseVide},
+                "message": self.message,
+                "noeuds": self.noeuds,
+                "noeuds_par_seconde": int(self.noeuds / duree) if duree > 0 else 0,
+                "profondeur": self.profondeur}
+
+    def changer_etape(self, message):
+        """ Change le message de l'étape courante et publie immédiatement l'avancement """
+        self.message = message
+        self._derniere_publication = time.monotonic()
+        self.publier(CALCUL_PROGRESSION, self.instantane())
+
+    def echantillonner(self):
+        """ Méthode appelée à chaque noeud du calcul de la solution.
+            L'avancement n'est publié que si l'intervalle entre deux publications est écoulé
+            ou si noeuds_par_image noeuds ont été explorés depuis la dernière publication. Le reste du temps, le calcul n'est pas ralenti.
+        """
+        self.noeuds += 1
+        if self._progression is None:
+            return
+
+        maintenant = time.monotonic()
+        delai_ecoule = self._intervalle is not None and maintenant - self._derniere_publication >= self._intervalle
+        noeuds_explores = self._noeuds_par_image and self.noeuds % self._noeuds_par_image == 0
+
+        if delai_ecoule or noeuds_explores:
+            self._derniere_publication = maintenant
+            self.publier(CALCUL_PROGRESSION, self.instantane())
+
+    def correction_grille(self):
+        """ Méthode permettant de corriger les éventuelles erreurs laissées par l'utilisateur lors de la saisie de la grille.
+            Les cases vides n'étant rattachées à aucune indicatrice sont transformées en case noire.
+        """
+
+        for (i, j) in self.grille.keys():
+            if self.arrete():
+                return
+
+            if type(self.grille[i, j]) is cases.CaseVide and self.grille.get_indicatrices(i, j) == (None, None):
+                self.grille[i, j] = cases.CaseNoire()
+
+    def baseSolver(self, i, j):
+        """ Méthode permettant de générer la solution d'une grille.
+            Cette méthode est récursive et s'appelle sur les cases de la grille.
+
+            Si la case courante est une case vide, elle essaye de lui affecter comme valeur une de ses valeurs_possibles.
+            Si ce n'est pas possible elle retourne False et remet sa valeur a -1. Si la grille est finie après avoir entré cette valeur, elle retourne True.
+
+            Elle lance ensuite l'appel sur la case suivante (en fonction de la position dans la grille) tant qu'il ne retourne pas true ou qu'il reste des valeurs à affecter.
+            Si cet appel retourne faux, elle change sa propre valeur.
+            Si il n'y a plus de valeurs possibles, elle retourne alors elle-même faux après avoir remis sa valeur à -1.
+            Si cet appel retourne vrai, elle le retourne.
+
+            Si ce n'est pas une case vide n'ayant pas de valeurs saisies, elle lance simplement l'appel sur la case suivante et retourne son retour.
+            Si l'arrêt du calcul est demandé, la recherche remonte en retournant False.
+        """
+        self.echantillonner()
+        if self.arrete():
+            return False
+
+        self.profondeur += 1
+        try:
+            return self._baseSolver(i, j)
+        finally:
+            self.profondeur -= 1
+
+    def _baseSolver(self, i, j):
+        """ Corps de baseSolver, pour la case (i, j) """
+        # Cas d'une case vide
+        if type(self.grille[i, j]) is cases.CaseVide and self.grille[i, j].valeur_saisie == -1:
+            valeurs_possibles = list(self.grille[i, j].domaine)
+            erreur = True
+            fin = False
+
+            # On teste chaque valeur jusqu'a ce qu'une marche
+            while erreur and len(valeurs_possibles) != 0:
+                self.grille[i, j].valeur_saisie = random.choice(valeurs_possibles)
+                try:
+                    self.grille.validate(True)
+                    erreur = False
+                except:
+                    valeurs_possibles.remove(self.grille[i, j].valeur_saisie)
+                    erreur = True
+
+            # Si aucune ne marche, on retourne False. La grille n'a pas de solutions en l'état
+            if erreur:
+                self.grille[i, j].valeur_saisie = -1
+                return False
+
+            # Si la grille est fini, on retourne la solution
+            elif self.grille.victoire():
+                return True
+
+            # Partie recursive
+            while not(fin) and len(valeurs_possibles) != 0 and not self.arrete():
+
+                if i < self.grille.nb_colonne - 1:
+                    fin = self.baseSolver(i + 1, j)
+
+                elif j < self.grille.nb_ligne - 1:
+                    fin = self.baseSolver(0, j + 1)
+
+                if not(fin):
+                    valeurs_possibles.remove(self.grille[i, j].valeur_saisie)
+                    if len(valeurs_possibles) != 0:
+                        self.grille[i, j].valeur_saisie = random.choice(valeurs_possibles)
+
+            if fin:
+                return True
+            else:
+                self.grille[i, j].valeur_saisie = -1
+                return False
+
+        # Cas d'une case noire/indicatrice, on réitère simplement l'appel
+        else:
+            if self.grille.victoire():
+                return True
+
+            if i < self.grille.nb_colonne - 1:
+                return self.baseSolver(i + 1, j)
+            elif j < self.grille.nb_ligne - 1:
+                return self.baseSolver(0, j + 1)
+            return False
+
+    def distribuer_domaine(self):
+        """ Méthode permettant d'affecter à chaque case vide son domaine de valeur possible.
+            Cet ensemble permettrait de donner une solution à la grille.
+            Pour chaque indicatrice, elle calcule le domaine de valeur de sa plage bas et droite, en fonction de ses valeurs bas et droites et des longueurs de chaque plage.
+            Pour chaque case de la plage bas, l'intersection entre le domaine_bas et son domaine existant est affecté à la case.
+            Pour chaque case de la plage droite, l'intersection entre le domaine_droite et son domaine existant est affecté à la case.
+        """
+        for (i, j) in self.grille.keys():
+            if self.arrete():
+                return
+
+            if type(self.grille[i, j]) is cases.Indicatrice:
+
+                if self.grille[i, j].valeur_droite != 0:
+                    # Calcul du nouveau domaine possible
+                    longueur_droite = Grille.longueur(self.grille.ligne(i + 1, j)) + 1
+                    self.grille[i, j].domaine_droite = Grille.get_domaine(self.grille[i, j].valeur_droite, longueur_droite)
+
+                    domaine = [nb for sousliste in self.grille[i, j].domaine_droite for nb in sousliste]
+                    domaine = set(domaine)
+
+                    # Intersection entre domaines
+                    self.grille[i + 1, j].domaine = set.intersection(self.grille[i + 1, j].domaine, domaine)
+                    for el in self.grille.ligne(i + 1, j):
+                        el.domaine = set.intersection(el.domaine, domaine)
+
+                if self.grille[i, j].valeur_bas != 0:
+                    # Calcul du nouveau domaine possible
+                    longueur_bas = Grille.longueur(self.grille.colonne(i, j + 1)) + 1
+                    self.grille[i, j].domaine_bas = Grille.get_domaine(self.grille[i, j].valeur_bas, longueur_bas)
+
+                    domaine = [nb for sousliste in self.grille[i, j].domaine_bas for nb in sousliste]
+                    domaine = set(domaine)
+
+                    # Intersection des domaines
+                    self.grille[i, j + 1].domaine = set.intersection(self.grille[i, j + 1].domaine, domaine)
+                    for el in self.grille.colonne(i, j + 1):
+                        el.domaine = set.intersection(el.domaine, domaine)
+
+                if journal.isEnabledFor(logging.DEBUG):
+                    journal.debug("Domaine de l'indicatrice (%d, %d): droite %s, bas %s", i, j, self.grille[i, j].domaine_droite, self.grille[i, j].domaine_bas)
+
+    def has_solution(self):
+        """ Méthode permettant de verifier si une grille à une solution calculable.
+            Parcourt l'ensemble de la grille. Si une case vide à un domaine contenant un seul élément, elle affecte à la case cette valeur.
+            Elle retire cette valeur des domaines de l'ensemble des cases de sa plage.
+
+            Elle parcourt ensuite une seconde fois la grille et verifie qu'aucune case vide n'a un domaine vide, sans avoir de valeur_saisie.
+        """
+
+        # On teste si la grille a une solution
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.CaseVide:
+                if len(self.grille[i, j].domaine) == 0 and self.grille[i, j].valeur_saisie == -1:
+                    self.grille[i, j].erreur = True
+                    raise NoSolutionException()
+
+            if type(self.grille[i, j]) is cases.Indicatrice:
+                indicatrice = self.grille[i, j]
+                if indicatrice.valeur_bas != 0 and len(indicatrice.domaine_bas) == 0:
+                    indicatrice.erreur_bas = True
+                    raise NoSolutionException()
+
+                elif indicatrice.valeur_droite != 0 and len(indicatrice.domaine_droite) == 0:
+                    indicatrice.erreur_droite = True
+                    raise NoSolutionException()
+
+    def solver(self, flag):
+        """ Solveur utilisant un algorithme à recherche en arrière, en utilisant les heuristiques MRV et degré.
+            Si l'arrêt du calcul est demandé, la recherche remonte en retournant False.
+        """
+        if self.arrete():
+            return False
+
+        try:
+            (i, j), square = self.grille.getNextSquareUsingHeuristics()
+        except IndexError as e:
+            return True
+
+        valeurs_possibles = list(square.domaine)
+        erreur = True
+        fini = False
+        self.profondeur += 1
+
+        # On teste chaque valeur jusqu'a ce qu'une marche
+        while not fini and len(valeurs_possibles) != 0 and not self.arrete():
+            square.valeur_saisie = random.choice(valeurs_possibles)
+            copy = Grille(grid=self.grille)
+            erreur = self.postTreatment(flag, i, j)
+            self.echantillonner()
+
+            if not erreur:
+                fini = self.grille.victoire() or self.solver(flag)
+
+            if erreur or not fini:
+                self.grille = copy
+                square = self.grille[i, j]
+                valeurs_possibles = [el for el in list(square.domaine) if el in valeurs_possibles]
+                valeurs_possibles.remove(square.valeur_saisie)
+
+        if not fini:
+            square.valeur_saisie = -1
+
+        self.profondeur -= 1
+        return fini
+
+    def postTreatment(self, flag, i, j):
+        """ Verifies that the grid is correct.
+            Applies forward and arc consistency checking and verifies that there is no empty domain.
+            params:
+                i,j -> coordinates of the current square
+        """
+        try:
+            self.grille.validate(True)
+            if flag == "FAST":
+                self.grille.forwardChecking(i, j)
+                self.grille.checkArcConsistency(i, j)
+                self.has_solution()
+            erreur = False
+        except Exception as e:
+            journal.debug("Grille incorrecte après la case (%d, %d): %s", i, j, e)
+            erreur = True
+
+        return erreur
+
+    def compter_solutions(self, limite=None):
+        """ Retourne le nombre de solutions de la grille, sans tenir compte des valeurs saisies, en s'arrêtant à limite solutions si elle est donnée.
+            Chaque plage est décrite par sa somme, ses cases et les chiffres déjà placés; une case ne peut recevoir que les chiffres
+            d'une combinaison de sa plage, et une plage incomplète doit pouvoir atteindre sa somme avec les chiffres restants.
+            Si l'arrêt est demandé, la recherche s'interrompt et retourne le nombre de solutions trouvées jusque-là.
+            La grille n'est pas modifiée.
+        """
+        self.noeuds = 0
+        self._debut = time.monotonic()
+        self.changer_etape(MESSAGE_COMPTAGE)
+
+        # Plages: [somme, cases, somme placée, chiffres placés]; plages de chaque case vide
+        plages, plages_case = [], {}
+        for (i, j), case in self.grille.items():
+            if type(case) is not cases.Indicatrice:
+                continue
+            for somme, (di, dj) in ((case.valeur_droite, (1, 0)), (case.valeur_bas, (0, 1))):
+                coordonnees, x, y = [], i + di, j + dj
+                while type(self.grille._grid.get((x, y))) is cases.CaseVide:
+                    coordonnees.append((x, y))
+                    x, y = x + di, y + dj
+                if somme != 0 and coordonnees:
+                    plages.append([somme, coordonnees, 0, set()])
+                    for position in coordonnees:
+                        plages_case.setdefault(position, []).append(plages[-1])
+
+        domaines = {}
+        for position, plages_position in plages_case.items():
+            domaines[position] = set(range(VALEUR_MIN, VALEUR_MAX + 1))
+            for plage in plages_position:
+                combinaisons = itertools.combinations(range(VALEUR_MIN, VALEUR_MAX + 1), len(plage[1]))
+                domaines[position] &= set(chiffre for combinaison in combinaisons if sum(combinaison) == plage[0] for chiffre in combinaison)
+
+        return self._compter(set(domaines), domaines, plages_case, limite)
+
+    def _compter(self, restantes, domaines, plages_case, limite):
+        """ Compte les solutions obtenues en affectant les cases restantes.
+            La case affectée est celle ayant le moins de chiffres possibles: si l'une d'elles n'en a aucun, la branche est abandonnée.
+        """
+        if not restantes:
+            return 1
+
+        self.echantillonner()
+        if self.arrete():
+            return 0
+
+        position, candidats = None, None
+        for autre in restantes:
+            possibles = [chiffre for chiffre in domaines[autre]
+                         if all(chiffre not in plage[3] and Resolveur._atteignable(plage, chiffre) for plage in plages_case[autre])]
+            if candidats is None or len(possibles) < len(candidats):
+                position, candidats = autre, possibles
+                if not candidats:
+                    return 0
+
+        restantes.remove(position)
+        nombre = 0
+        for chiffre in candidats:
+            for plage in plages_case[position]:
+                plage[2] += chiffre
+                plage[3].add(chiffre)
+            nombre += self._compter(restantes, domaines, plages_case, None if limite is None else limite - nombre)
+            for plage in plages_case[position]:
+                plage[2] -= chiffre
+                plage[3].remove(chiffre)
+
+            if (limite is not None and nombre >= limite) or self.arrete():
+                break
+        restantes.add(position)
+        return nombre
+
+    @staticmethod
+    def _atteignable(plage, chiffre):
+        """ Retourne True si la somme de la plage peut encore être atteinte après y avoir placé le chiffre passé en paramètre """
+        reste = plage[0] - plage[2] - chiffre
+        restantes = len(plage[1]) - len(plage[3]) - 1
+        libres = [valeur for valeur in range(VALEUR_MIN, VALEUR_MAX + 1) if valeur not in plage[3] and valeur != chiffre]
+        return len(libres) >= restantes and sum(libres[:restantes]) <= reste <= sum(libres[len(libres) - restantes:])
+
+    def checkArcConsistency(self, i, j):
+        """ returns true if arcs are consistent
+            returns false otherwise
+        """
+
+        queue = [((i, j), self.grille[i, j])]
+        while len(queue) != 0:
+            index, caseCourante = queue.pop()
+
+            # Vérification des domaines
+            for otherIndex in self.grille.ligneIndices(*index):
+                self.grille.checkDomain(*otherIndex)
+
+            for otherIndex in self.grille.colonneIndices(*index):
+                self.grille.checkDomain(*otherIndex)
+
+            """if caseCourante.valeur_saisie == -1 and len(caseCourante.domaine)==1:
+
+                caseCourante.valeur_saisie=caseCourante.domaine[0] 
+                valeur = caseCourante.valeur_saisie
+
+                for otherIndex in self.ligneIndices(*index): 
+                    other = self.grille[otherIndex]                        
+                    if valeur in other.domaine:
+                        other.domaine.remove(valeur)
+                        queue.append((otherIndex, other))
+
+                for otherIndex in self.colonne(*index): 
+                    other = self.grille[otherIndex]                                   
+                    if valeur in other.domaine:
+                        other.domaine.remove(caseCourante.valeur_saisie)
+                        queue.append((otherIndex, other))"""
+
+        return True
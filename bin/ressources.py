@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module de gestion des ressources graphiques du produit.
+    Ce module conserve les images et les polices utilisées par les écrans, pour qu'elles ne soient lues et converties qu'une seule fois.
+    Chaque ressource est chargée au premier appel, puis partagée par l'ensemble des écrans.
+
+    Les textes rendus (chiffres des cases, sommes des indicatrices, titres des boutons, messages) sont eux aussi conservés.
+    Leur nombre étant illimité pour les textes libres (noms de fichier, messages), seuls les TAILLE_CACHE_TEXTES derniers utilisés sont gardés.
+
+    Contient les fonctions suivantes:
+        - image: retourne une image chargée et convertie au format de la fenêtre
+        - police: retourne une police de caractères
+        - texte: retourne la surface d'un texte rendu avec une police
+        - precharger: charge en avance l'ensemble des ressources du jeu
+        - precharger_en_arriere_plan: lance precharger dans un fil d'exécution séparé
+        - vider: oublie les ressources chargées et les textes rendus
+
+    Modules importés:
+        - collections: utilisé pour conserver les textes dans l'ordre de leur dernière utilisation
+        - threading: utilisé pour protéger le cache lors d'un préchargement en arrière-plan
+        - pygame: utilisé pour charger les images et les polices
+        - constantes: utilisé dans toutes les fonctions
+"""
+
+import collections
+import threading
+import pygame
+import pygame.freetype
+from constantes import *
+
+# Ressources déjà chargées, indexées par chemin (et transparence ou taille)
+_images = {}
+_polices = {}
+_textes = collections.OrderedDict()
+_verrou = threading.RLock()
+
+# Ressources chargées par precharger: (chemin, transparence) pour les images, taille pour les polices
+IMAGES_JEU = ((CHEMIN_IMAGE_BOUTON, True),
+              (CHEMIN_IMAGE_KAKURAWWR, True),
+              (CHEMIN_IMAGE_INDICATRICE, False),
+              (CHEMIN_IMAGE_CASEVIDE, False),
+              (CHEMIN_IMAGE_CASENOIRE, False),
+              (CHEMIN_IMAGE_ZONE_SAISIE, False),
+              (CHEMIN_IMAGE_MODE_CASEVIDE, True),
+              (CHEMIN_IMAGE_MODE_INDICATRICE, True),
+              (CHEMIN_IMAGE_MODE_CASENOIRE, True))
+
+POLICES_JEU = (TAILLE_POLICE_BOUTON, TAILLE_POLICE_INDICATRICE, TAILLE_POLICE_CASEVIDE, TAILLE_POLICE_SAISIE)
+
+
+def image(chemin, transparence=False):
+    """ Retourne l'image dont le chemin est passé en paramètre.
+        L'image est convertie au format de la fenêtre, en conservant sa transparence si transparence est vrai.
+        La fenêtre doit avoir été créée avant le premier appel pour une image donnée.
+    """
+    cle = (chemin, transparence)
+    with _verrou:
+        if cle not in _images:
+            chargee = pygame.image.load(chemin)
+            if transparence:
+                _images[cle] = chargee.convert_alpha()
+            else:
+                _images[cle] = chargee.convert()
+        return _images[cle]
+
+
+def police(taille, chemin=CHEMIN_FICHIER_POLICE):
+    """ Retourne la police de taille passée en paramètre.
+        Par défaut, la police du jeu est utilisée. Le module freetype est initialisé si nécessaire.
+    """
+    cle = (chemin, taille)
+    with _verrou:
+        if cle not in _polices:
+            if not pygame.freetype.get_init():
+                pygame.freetype.init()
+            _polices[cle] = pygame.freetype.Font(chemin, taille)
+        return _polices[cle]
+
+
+def texte(font, chaine, couleur, style=pygame.freetype.STYLE_DEFAULT):
+    """ Retourne la surface de la chaine rendue avec la police font, dans la couleur et le style passés en paramètres.
+        Une même chaine n'est rendue qu'une fois par police, taille, couleur et style.
+        Lorsque plus de TAILLE_CACHE_TEXTES textes sont conservés, le moins récemment utilisé est oublié.
+        La surface retournée est partagée: elle ne doit pas être modifiée.
+    """
+    cle = (font.path, font.size, chaine, couleur, style)
+    with _verrou:
+        if cle in _textes:
+            _textes.move_to_end(cle)
+        else:
+            _textes[cle] = font.render(chaine, couleur, style=style)[0]
+            if len(_textes) > TAILLE_CACHE_TEXTES:
+                _textes.popitem(last=False)
+        return _textes[cle]
+
+
+def precharger():
+    """ Charge l'ensemble des images et des polices du jeu, et rend les valeurs pouvant apparaître dans les cases.
+        Appelée au lancement, une fois la fenêtre créée, elle évite les lectures de fichier lors du premier affichage de chaque écran.
+    """
+    for chemin, transparence in IMAGES_JEU:
+        image(chemin, transparence)
+    for taille in POLICES_JEU:
+        police(taille)
+
+    # Valeurs des cases vides et sommes des indicatrices, dans leurs couleurs normale et d'erreur
+    for couleur in (COULEUR_POLICE, COULEUR_ERREUR):
+        for valeur in range(1, 10):
+            texte(police(TAILLE_POLICE_CASEVIDE), str(valeur), couleur)
+        for somme in range(0, 46):
+            texte(police(TAILLE_POLICE_INDICATRICE), str(somme), couleur)
+
+
+def precharger_en_arriere_plan():
+    """ Lance precharger dans un fil d'exécution séparé, et retourne ce fil.
+        La fenêtre doit avoir été créée. Le premier écran s'affiche sans attendre la fin du préchargement:
+        une ressource qu'il demande avant d'avoir été préchargée est chargée à ce moment, le verrou empêchant un double chargement.
+    """
+    fil = threading.Thread(target=precharger, name="Ressources", daemon=True)
+    fil.start()
+    return fil
+
+
+def vider():
+    """ Oublie l'ensemble des ressources chargées et des textes rendus. Les ressources seront relues lors de leur prochaine utilisation. """
+    with _verrou:
+        _images.clear()
+        _polices.clear()
+        _textes.clear()
@@ -8,9 +8,12 @@
     Modules importés:
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour manier les boutons de l'écran
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
         - constantes: utilisé par toutes les méthodes
         - grille: utilisé pour intéragir avec la grille à sauvegarder
-        - jeu: utilisé pour lancer le jeu d'une grille chargée
+        - bibliotheque: utilisé pour enregistrer, lister et charger les grilles sauvegardées
+        - jeu: utilisé pour lancer le jeu d'une grille chargée, importé au premier lancement d'une partie
 """
 import os
 import pygame
@@ -18,15 +21,18 @@ from pygame.locals import *
 import pygame.freetype
 import boutons
 import grille
-import jeu
+import bibliotheque
+import ressources
+import boucle
 from constantes import *
 
 
 class Sauvegarde:
     """ Classe modélisant la sauvegarde, dans son affichage aussi bien que dans son fontionnement.
-        Cette classe possède 7 attributs:
+        Cette classe possède 8 attributs:
             - _fenetre: la fenetre de jeu
             - _grille: la grille à sauvegarder
+            - _chemin_bibliotheque: le chemin de la bibliothèque dans laquelle la grille est enregistrée
             - nom_fichier: le nom donné par le joueur
             - indication: l'indication donné au joueur
             - zone_saisie: la zone de saisie
@@ -34,9 +40,10 @@ class Sauvegarde:
             - bouton_retour: bouton permettant de revenir au jeu.
     """
 
-    def __init__(self, fenetre, grille):
+    def __init__(self, fenetre, grille, chemin_bibliotheque=CHEMIN_BIBLIOTHEQUE):
         """ Initialise les attributs de la classe.
             La fenetre d'affichage et la grille à imprimer sont passé en paramètre, les attributs correspondant sont initialisé avec ces valeurs.
+            Le chemin de la bibliothèque peut être remplacé, par exemple par les tests unitaires.
             Le nom du fichier à sauvegarder est initialisé avec une chaine vide.
             Les autres éléments sont des boutons, qui seront initialisés dans l'affichage de l'écran de Sauvegarde.
             L'indication donnée au joueur est initialisé avec INDICATION_SAUVEGARDE, défini dans les constantes.
@@ -45,6 +52,7 @@ class Sauvegarde:
 
         self._fenetre = fenetre
         self._grille = grille
+        self._chemin_bibliotheque = chemin_bibliotheque
         self.nom_fichier = ""
         self.indication = INDICATION_SAUVEGARDE
         self.zone_saisie = boutons.ZoneSaisie()
@@ -57,16 +65,16 @@ class Sauvegarde:
             La zone de saisie est aussi affiché au cours de cette étape.
         """
 
-        img_saisie = pygame.image.load(CHEMIN_IMAGE_ZONE_SAISIE).convert()
-        font_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        font_saisie = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        img_saisie = ressources.image(CHEMIN_IMAGE_ZONE_SAISIE)
+        font_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        font_saisie = ressources.police(TAILLE_POLICE_SAISIE)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
         self.bouton_valider.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_SOLUTION)
         self.bouton_retour.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_RETOUR)
         self.zone_saisie.afficher(self._fenetre, img_saisie, font_saisie, POSITION_ZONE_SAISIE)
 
-        self._fenetre.blit(font_saisie.render(self.indication, COULEUR_POLICE)[0], POSITION_INDICATION_SAUVEGARDE)
+        self._fenetre.blit(ressources.texte(font_saisie, self.indication, COULEUR_POLICE), POSITION_INDICATION_SAUVEGARDE)
 
     def sauvegarde(self):
         """ Méthode permettant de sauvegarder la grille.
@@ -82,7 +90,7 @@ class Sauvegarde:
 
             pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
 
                 if event.type == QUIT:
                     pygame.quit()
@@ -94,7 +102,7 @@ class Sauvegarde:
                         return
 
                     if self.zone_saisie.clicked(curseur):
-                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE))
+                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, ressources.police(TAILLE_POLICE_SAISIE))
 
                     if self.bouton_valider.clicked(curseur):
                         if (self.valider()):
@@ -103,15 +111,20 @@ class Sauvegarde:
     def valider(self):
         """ Méthode permettant de valider la sauvegarde.
             La chaine est formatée, l'extension lui est ajouté et le dossier de sauvegarde lui est ajouté.
-            La méthode de sauvegarde de la grille est appellée.
+            La méthode de sauvegarde de la grille est appellée, et la grille est enregistrée dans la bibliothèque.
         """
 
         if self.nom_fichier:
             if not os.path.isdir(CHEMIN_DOSSIER_SAUVEGARDE):
                 os.mkdir(CHEMIN_DOSSIER_SAUVEGARDE)
-            self.nom_fichier = self.nom_fichier.lower()
-            self.nom_fichier = CHEMIN_DOSSIER_SAUVEGARDE + self.nom_fichier + EXTENSION_FICHIER_SAUVEGARDE
+            nom = self.nom_fichier.lower()
+            self.nom_fichier = CHEMIN_DOSSIER_SAUVEGARDE + nom + EXTENSION_FICHIER_SAUVEGARDE
             self._grille.sauvegarde(self.nom_fichier)
+
+            bibliotheque_grilles = bibliotheque.Bibliotheque(self._chemin_bibliotheque)
+            bibliotheque_grilles.enregistrer(nom, self._grille)
+            bibliotheque_grilles.fermer()
+            self._grille.nom = nom
             return True
         else:
             return False
@@ -119,9 +132,16 @@ class Sauvegarde:
 
 class Chargement:
     """ Classe modélisant le chargement d'une grille.
-        Cette classe possède 8 attributs:
+        Les grilles de la bibliothèque sont proposées page par page, et peuvent aussi être chargées en saisissant leur nom.
+        Cette classe possède 14 attributs:
             - _fenetre: la fenetre de jeu
             - _grille: la grille à charger
+            - _bibliotheque: la bibliothèque des grilles sauvegardées
+            - page: le numéro de la page de grilles affichée
+            - grilles: les métadonnées des grilles de la page affichée
+            - boutons_grilles: les boutons permettant de charger chacune des grilles de la page
+            - bouton_precedent: bouton permettant d'afficher la page précédente
+            - bouton_suivant: bouton permettant d'afficher la page suivante
             - nom_fichier: le nom de la grille à charger
             - indication: L'indication donné au joueur
             - zone_saisie: la zone de saisie
@@ -130,9 +150,10 @@ class Chargement:
             - barre_erreur: zone d'affichage permettant d'afficher les erreurs à l'écran
     """
 
-    def __init__(self, fenetre):
+    def __init__(self, fenetre, chemin_bibliotheque=CHEMIN_BIBLIOTHEQUE):
         """ Initialise les attributs de la classe.
-            La fenetre d'affichage est passée en paramètre.
+            La fenetre d'affichage est passée en paramètre, ainsi que le chemin de la bibliothèque, qui peut être remplacé par les tests unitaires.
+            La connexion à la bibliothèque est ouverte ici, et fermée à la sortie de l'écran de chargement.
             le nom du fichier à charger est initialisé avec une chaine vide.
             Les autres éléments sont des boutons, qui seront initialisés dans l'affichage de l'écran de Chargement.
             L'indication donnée au joueur est initialisé avec INDICATION_CHARGEMENT, défini dans les constantes.
@@ -147,24 +168,47 @@ class Chargement:
         self.bouton_valider = boutons.Bouton(TITRE_BOUTON_VALIDER)
         self.bouton_retour = boutons.Bouton(TITRE_BOUTON_RETOUR)
 
-        self.barre_erreur = boutons.BarreErreur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON))
+        self.barre_erreur = boutons.BarreErreur(ressources.police(TAILLE_POLICE_BOUTON))
+
+        # Les anciennes sauvegardes sont importées à la création de la bibliothèque
+        self._bibliotheque = bibliotheque.Bibliotheque(chemin_bibliotheque)
+        if self._bibliotheque.compter() == 0:
+            self._bibliotheque.importer()
+
+        self.boutons_grilles = [boutons.Bouton("") for position in POSITIONS_GRILLES_BIBLIOTHEQUE]
+        self.bouton_precedent = boutons.Bouton(TITRE_BOUTON_PRECEDENT)
+        self.bouton_suivant = boutons.Bouton(TITRE_BOUTON_SUIVANT)
+        self.changer_page(0)
+
+    def changer_page(self, page):
+        """ Méthode permettant d'afficher la page de grilles passée en paramètre, si elle existe. """
+        nb_pages = max(1, -(-self._bibliotheque.compter() // TAILLE_PAGE_BIBLIOTHEQUE))
+        self.page = min(max(page, 0), nb_pages - 1)
+        self.grilles = self._bibliotheque.lister(self.page, TAILLE_PAGE_BIBLIOTHEQUE)
+        for meta, bouton in zip(self.grilles, self.boutons_grilles):
+            bouton.titre = meta["nom"]
 
     def afficher(self):
         """ Méthode permettant d'afficher l'écran de chargement à l'écran.
             Chacun des boutons de l'écran est affiché, ainsi que leur titre correspondant.
-            La zone de saisie et l'indication sont affichés dans cette méthode.
+            La zone de saisie et l'indication sont affichés dans cette méthode, ainsi que les grilles de la page courante.
         """
 
-        img_saisie = pygame.image.load(CHEMIN_IMAGE_ZONE_SAISIE).convert()
-        font_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        font_saisie = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        img_saisie = ressources.image(CHEMIN_IMAGE_ZONE_SAISIE)
+        font_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        font_saisie = ressources.police(TAILLE_POLICE_SAISIE)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
         self.bouton_valider.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_SOLUTION)
         self.bouton_retour.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_RETOUR)
         self.zone_saisie.afficher(self._fenetre, img_saisie, font_saisie, POSITION_ZONE_SAISIE)
 
-        self._fenetre.blit(font_saisie.render(self.indication, COULEUR_POLICE)[0], POSITION_INDICATION_CHARGEMENT)
+        self._fenetre.blit(ressources.texte(font_saisie, self.indication, COULEUR_POLICE), POSITION_INDICATION_CHARGEMENT)
+
+        for bouton, position in zip(self.boutons_grilles[:len(self.grilles)], POSITIONS_GRILLES_BIBLIOTHEQUE):
+            bouton.afficher(self._fenetre, bouton_img, font_bouton, position)
+        self.bouton_precedent.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_PRECEDENT)
+        self.bouton_suivant.afficher(self._fenetre, bouton_img, font_bouton, POSITION_BOUTON_SUIVANT)
 
     def chargement(self):
         """ Méthode permettant de charger la grille.
@@ -172,6 +216,21 @@ class Chargement:
             L'utilisateur peut quitter le chargement pour revenir au menu, ou quitter simplement le jeu.
             Il peut saisir un nom, qui sera le nom de fichier à charger.
             La pression du bouton validation lance la méthode validation.
+            La connexion à la bibliothèque est fermée à la sortie de l'écran, avant le jeu de la grille chargée.
+        """
+        try:
+            chargee = self._attente()
+        finally:
+            self._bibliotheque.fermer()
+
+        if chargee:
+            import jeu
+            ecran_jeu = jeu.Jeu(self._fenetre, self._grille)
+            ecran_jeu.jouer()
+
+    def _attente(self):
+        """ Boucle d'événements de l'écran de chargement.
+            Retourne True lorsqu'une grille a été chargée, False lorsque l'utilisateur revient au menu.
         """
 
         erreur_saisie = False
@@ -183,7 +242,7 @@ class Chargement:
                 self.barre_erreur.afficher_erreur(self._fenetre, MESSAGE_ERREUR_NOM_INCORRECT, COULEUR_ERREUR)
             pygame.display.flip()
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
 
                 if event.type == QUIT:
                     pygame.quit()
@@ -192,34 +251,47 @@ class Chargement:
                     curseur = pygame.Rect(event.pos, (0, 0))
 
                     if self.bouton_retour.clicked(curseur):
-                        return
+                        return False
 
                     if self.zone_saisie.clicked(curseur):
                         erreur_saisie = False
-                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_SAISIE))
+                        self.nom_fichier = self.zone_saisie.saisie(self._fenetre, ressources.police(TAILLE_POLICE_SAISIE))
+
+                    if self.bouton_precedent.clicked(curseur):
+                        self.changer_page(self.page - 1)
+                    elif self.bouton_suivant.clicked(curseur):
+                        self.changer_page(self.page + 1)
+
+                    for meta, bouton in zip(self.grilles, self.boutons_grilles):
+                        if bouton.clicked(curseur):
+                            self.nom_fichier = meta["nom"]
+                            if (self.valider()):
+                                return True
 
                     if self.bouton_valider.clicked(curseur):
                         if (self.valider()):
-                            ecran_jeu = jeu.Jeu(self._fenetre, self._grille)
-                            ecran_jeu.jouer()
-                            return
+                            return True
                         else:
                             erreur_saisie = True
 
     def valider(self):
-        """ Méthode permettant de valider la sauvegarde.
-            La chaine est formatée, l'extension lui est ajouté et le dossier de sauvegarde lui est ajouté.
-            La méthode de sauvegarde de la grille est appellée.
+        """ Méthode permettant de valider le chargement.
+            La grille portant le nom saisi est chargée depuis la bibliothèque.
+            Si elle n'y est pas, le fichier de ce nom est cherché dans le dossier de sauvegarde.
         """
 
         if self.nom_fichier != "":
             if not os.path.isdir(CHEMIN_DOSSIER_SAUVEGARDE):
                 os.mkdir(CHEMIN_DOSSIER_SAUVEGARDE)
                 return False
-            self.nom_fichier = self.nom_fichier.lower()
-            self.nom_fichier = CHEMIN_DOSSIER_SAUVEGARDE + self.nom_fichier + EXTENSION_FICHIER_SAUVEGARDE
+            nom = self.nom_fichier.lower()
+            self.nom_fichier = CHEMIN_DOSSIER_SAUVEGARDE + nom + EXTENSION_FICHIER_SAUVEGARDE
             try:
-                self._grille.chargement(self.nom_fichier)
+                # Une grille absente de la bibliothèque est cherchée dans le dossier de sauvegarde, puis ajoutée à la bibliothèque
+                if not self._bibliotheque.charger(nom, self._grille):
+                    self._grille.chargement(self.nom_fichier)
+                    self._grille.nom = nom
+                    self._bibliotheque.enregistrer(nom, self._grille)
                 self._grille.solved = self._grille.is_solved()
             except Exception as e:
                 return False
@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant le format de sauvegarde des grilles.
+    Une grille est enregistrée dans un format binaire compact et versionné, qui ne contient que la structure de la grille,
+    les sommes des indicatrices, la solution et les valeurs saisies par le joueur.
+
+    Le fichier commence par un en-tête: ENTETE_SAUVEGARDE, le numéro de version, le nombre de colonnes et le nombre de lignes.
+    Suit un enregistrement par case, ligne par ligne:
+        - un octet donnant le type de la case (absente, noire, vide ou indicatrice)
+        - pour une case vide, un octet contenant la solution (4 bits de poids fort) et la valeur saisie (4 bits de poids faible), 0 signifiant aucune valeur
+        - pour une indicatrice, un octet pour la somme droite puis un octet pour la somme bas
+
+    Les anciennes sauvegardes, qui contenaient le dictionnaire de cases sérialisé par pickle, sont toujours lues par charger et migrer.
+    La fonction decoder n'accepte au contraire que le format actuel: les données qui lui sont passées (bibliothèque, réserve, volumes)
+    ne sont jamais désérialisées par pickle.
+
+    Contient les fonctions suivantes:
+        - encoder, decoder
+        - sauvegarder, charger
+        - migrer
+        - dimensions
+
+    Modules importés:
+        - pickle: utilisé pour lire les anciens fichiers de sauvegarde
+        - cases: utilisé pour créer les cases de la grille chargée
+        - exceptions: utilisé pour signaler un fichier illisible
+        - constantes: utilisé pour l'en-tête, la version du format et les types de case
+"""
+
+import pickle
+import cases
+from exceptions import *
+from constantes import *
+
+
+def encoder(grid, nb_colonne=NB_COLONNE_GRILLE, nb_ligne=NB_LIGNE_GRILLE):
+    """ Retourne le contenu binaire de la sauvegarde du dictionnaire de cases passé en paramètre, de dimensions nb_colonne x nb_ligne """
+    donnees = bytearray(ENTETE_SAUVEGARDE)
+    donnees += bytes((VERSION_SAUVEGARDE, nb_colonne, nb_ligne))
+
+    for j in range(nb_ligne):
+        for i in range(nb_colonne):
+            case = grid.get((i, j))
+            if type(case) is cases.CaseVide:
+                donnees += bytes((TYPE_CASE_VIDE, max(case._solution_case, 0) << 4 | max(case.valeur_saisie, 0)))
+            elif type(case) is cases.Indicatrice:
+                donnees += bytes((TYPE_CASE_INDICATRICE, case.valeur_droite, case.valeur_bas))
+            elif type(case) is cases.CaseNoire:
+                donnees.append(TYPE_CASE_NOIRE)
+            else:
+                donnees.append(TYPE_CASE_ABSENTE)
+
+    return bytes(donnees)
+
+
+def decoder(donnees):
+    """ Retourne le dictionnaire de cases contenu dans la sauvegarde binaire passée en paramètre.
+        Lève FormatSauvegardeException si le contenu est illisible, ou s'il ne commence pas par l'en-tête du format actuel.
+    """
+    if not donnees.startswith(ENTETE_SAUVEGARDE):
+        raise FormatSauvegardeException()
+
+    try:
+        version = donnees[len(ENTETE_SAUVEGARDE)]
+        lecteur = _LECTEURS[version]
+    except (IndexError, KeyError):
+        raise FormatSauvegardeException()
+
+    try:
+        return lecteur(donnees, len(ENTETE_SAUVEGARDE) + 1)
+    except IndexError:
+        raise FormatSauvegardeException()
+
+
+def sauvegarder(grid, chemin_fichier, nb_colonne=NB_COLONNE_GRILLE, nb_ligne=NB_LIGNE_GRILLE):
+    """ Enregistre le dictionnaire de cases dans le fichier dont le chemin est passé en paramètre """
+    with open(chemin_fichier, "wb") as fichier:
+        fichier.write(encoder(grid, nb_colonne, nb_ligne))
+
+
+def charger(chemin_fichier):
+    """ Retourne le dictionnaire de cases de la grille enregistrée dans le fichier dont le chemin est passé en paramètre.
+        Un fichier de l'ancien format pickle est converti.
+    """
+    with open(chemin_fichier, "rb") as fichier:
+        return _decoder_fichier(fichier.read())
+
+
+def migrer(chemin_fichier):
+    """ Réécrit dans le format actuel une sauvegarde écrite dans un format précédent.
+        Retourne True si le fichier a été réécrit, False s'il était déjà au format actuel.
+    """
+    with open(chemin_fichier, "rb") as fichier:
+        donnees = fichier.read()
+
+    if donnees.startswith(ENTETE_SAUVEGARDE) and donnees[len(ENTETE_SAUVEGARDE)] == VERSION_SAUVEGARDE:
+        return False
+
+    grid = _decoder_fichier(donnees)
+    sauvegarder(grid, chemin_fichier, *dimensions(grid))
+    return True
+
+
+def dimensions(grid):
+    """ Retourne le nombre de colonnes et le nombre de lignes occupées par le dictionnaire de cases passé en paramètre """
+    return (max([i for (i, j) in grid.keys()], default=-1) + 1, max([j for (i, j) in grid.keys()], default=-1) + 1)
+
+
+def _lire_v1(donnees, position):
+    """ Lit les cases d'une sauvegarde de version 1, à partir de la position passée en paramètre """
+    nb_colonne, nb_ligne = donnees[position], donnees[position + 1]
+    position += 2
+    grid = {}
+
+    for j in range(nb_ligne):
+        for i in range(nb_colonne):
+            nature = donnees[position]
+            if nature == TYPE_CASE_VIDE:
+                valeurs = donnees[position + 1]
+                case = cases.CaseVide((valeurs >> 4) or -1)
+                case.valeur_saisie = (valeurs & 0x0F) or -1
+                grid[i, j] = case
+                position += 2
+            elif nature == TYPE_CASE_INDICATRICE:
+                case = cases.Indicatrice()
+                case.valeur_droite = donnees[position + 1]
+                case.valeur_bas = donnees[position + 2]
+                grid[i, j] = case
+                position += 3
+            elif nature == TYPE_CASE_NOIRE:
+                grid[i, j] = cases.CaseNoire()
+                position += 1
+            elif nature == TYPE_CASE_ABSENTE:
+                position += 1
+            else:
+                raise FormatSauvegardeException()
+
+    if position != len(donnees):
+        raise FormatSauvegardeException()
+    return grid
+
+
+# Fonctions de lecture associées à chaque version du format
+_LECTEURS = {1: _lire_v1}
+
+
+def _decoder_fichier(donnees):
+    """ Retourne le dictionnaire de cases du contenu d'un fichier de sauvegarde, qui peut être au format actuel ou à l'ancien format pickle """
+    if not donnees.startswith(ENTETE_SAUVEGARDE):
+        return _migrer_pickle(donnees)
+    return decoder(donnees)
+
+
+def _migrer_pickle(donnees):
+    """ Convertit une ancienne sauvegarde, contenant le dictionnaire de cases sérialisé par pickle.
+        Seules les informations du format actuel sont conservées: les rect, erreurs et domaines sont réinitialisés.
+    """
+    try:
+        ancien = pickle.loads(donnees)
+        grid = {}
+        for (i, j), case in ancien.items():
+            if type(case) is cases.CaseVide:
+                grid[i, j] = cases.CaseVide(case._solution_case)
+                grid[i, j].valeur_saisie = case.valeur_saisie
+            elif type(case) is cases.Indicatrice:
+                grid[i, j] = cases.Indicatrice()
+                grid[i, j].valeur_droite = case.valeur_droite
+                grid[i, j].valeur_bas = case.valeur_bas
+            else:
+                grid[i, j] = cases.CaseNoire()
+    except Exception:
+        raise FormatSauvegardeException()
+
+    return grid
+
@@ -0,0 +1,352 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module du service HTTP local de génération, de résolution et de validation des grilles.
+    Le service permet aux autres outils d'utiliser le moteur du jeu sans fenêtre. Il n'écoute que sur HOTE_SERVICE.
+    Les requêtes et les réponses sont des objets JSON, les grilles y étant écrites au format du module texte.
+
+    Points d'accès:
+        - POST /generate {"difficulte"}: retourne une grille générée et sa solution
+        - POST /solve {"grille", "mode", "delai"}: retourne la grille résolue par le Resolveur, dans le mode donné ("SLOW", "MEDIUM" ou "FAST")
+        - POST /count_solutions {"grille", "limite", "delai"}: retourne le nombre de solutions de la grille, jusqu'à limite
+        - POST /validate {"grille"}: vérifie les indicatrices et les valeurs saisies de la grille
+        - GET /metrics: retourne, par point d'accès, le nombre de requêtes, d'erreurs et de refus, et les durées de traitement
+
+    Les calculs sont exécutés par un groupe de processus créé au lancement du service.
+    Chaque requête dispose d'une durée maximale (delai, en secondes): la résolution et le comptage s'arrêtent d'eux-mêmes une fois celle-ci écoulée.
+    Au-delà de REQUETES_SIMULTANEES_SERVICE requêtes en cours, les nouvelles requêtes sont refusées.
+    Une erreur survenue pendant un calcul est retournée au client (400 pour une grille illisible ou incohérente, 500 sinon) et comptée dans les mesures.
+
+    Contient les classes Service et Echeance, et la fonction main, qui lance le service.
+
+    Modules importés:
+        - json: utilisé pour lire les requêtes et écrire les réponses
+        - math: utilisé pour refuser les durées et les limites non finies
+        - time: utilisé pour mesurer les durées de traitement
+        - io: utilisé pour lire les grilles reçues
+        - argparse: utilisé pour lire les options de lancement
+        - collections: utilisé pour conserver les dernières durées de traitement
+        - threading: utilisé pour limiter le nombre de requêtes simultanées et protéger les mesures
+        - concurrent.futures: utilisé pour le groupe de processus
+        - http.server: utilisé pour le serveur HTTP
+        - grille, resolveur, texte: utilisés pour les calculs
+        - exceptions: utilisé pour les grilles illisibles ou sans solution
+        - constantes: utilisé par toutes les méthodes
+"""
+
+import json
+import math
+import time
+import io
+import argparse
+import collections
+import threading
+import concurrent.futures
+import http.server
+import grille
+import resolveur
+import texte
+from exceptions import *
+from constantes import *
+
+# Modes de résolution acceptés par le point d'accès solve
+MODES_SERVICE = ("SLOW", "MEDIUM", "FAST")
+
+
+class Echeance:
+    """ Classe modélisant la fin de la durée allouée à un calcul.
+        Elle s'utilise comme l'événement d'arrêt du Resolveur: l'arrêt est demandé une fois la durée écoulée.
+        Cette classe possède 1 attribut:
+            - fin: l'instant, selon time.monotonic, auquel l'arrêt est demandé
+    """
+
+    def __init__(self, delai):
+        """ Initialise l'échéance à delai secondes de l'instant présent """
+        self.fin = time.monotonic() + delai
+
+    def is_set(self):
+        """ Retourne True si la durée allouée est écoulée """
+        return time.monotonic() >= self.fin
+
+
+class Service(http.server.ThreadingHTTPServer):
+    """ Classe modélisant le service HTTP.
+        Cette classe possède 5 attributs, en plus de ceux de ThreadingHTTPServer:
+            - _executeur: le groupe de processus effectuant les calculs
+            - _places: le sémaphore limitant le nombre de requêtes traitées simultanément
+            - _verrou: le verrou protégeant les mesures
+            - _mesures: les mesures de chaque point d'accès, sous la forme d'un dictionnaire (voir metriques)
+            - _debut: l'instant du lancement du service
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=PORT_SERVICE, processus=PROCESSUS_SERVICE, simultanees=REQUETES_SIMULTANEES_SERVICE):
+        """ Ouvre le port d'écoute passé en paramètre (0 pour un port libre quelconque) et crée le groupe de processus """
+        http.server.ThreadingHTTPServer.__init__(self, (HOTE_SERVICE, port), _Requetes)
+        self._executeur = concurrent.futures.ProcessPoolExecutor(processus)
+        self._places = threading.BoundedSemaphore(simultanees)
+        self._verrou = threading.Lock()
+        self._mesures = {}
+        self._debut = time.monotonic()
+
+    def fermer(self):
+        """ Ferme le port d'écoute et arrête le groupe de processus """
+        self.server_close()
+        self._executeur.shutdown(cancel_futures=True)
+
+    def traiter(self, point, parametres):
+        """ Traite la requête adressée au point d'accès passé en paramètre, et retourne le code HTTP et l'objet JSON de la réponse.
+            Les paramètres sont vérifiés, puis le calcul est confié au groupe de processus.
+            Une exception levée par le calcul est retournée comme une erreur interne (code 500).
+        """
+        if point == "metrics":
+            return 200, self.metriques()
+        if point not in _POINTS:
+            return 404, {"erreur": MESSAGE_SERVICE_INCONNU}
+        if not isinstance(parametres, dict):
+            return 400, {"erreur": MESSAGE_SERVICE_REQUETE}
+
+        try:
+            delai = min(max(_nombre(parametres, "delai", DELAI_SERVICE), 0), DELAI_MAX_SERVICE)
+            arguments = _POINTS[point][1](parametres, delai)
+        except (TypeError, ValueError, KeyError, OverflowError) as e:
+            return 400, {"erreur": MESSAGE_SERVICE_PARAMETRE.format(e)}
+
+        if not self._places.acquire(blocking=False):
+            return 503, {"erreur": MESSAGE_SERVICE_OCCUPE}
+        try:
+            calcul = self._executeur.submit(_POINTS[point][0], *arguments)
+            return calcul.result(timeout=delai + MARGE_DELAI_SERVICE)
+        except concurrent.futures.TimeoutError:
+            return 504, {"erreur": MESSAGE_SERVICE_DELAI}
+        except Exception as e:
+            return 500, {"erreur": MESSAGE_SERVICE_INTERNE.format(e)}
+        finally:
+            self._places.release()
+
+    def noter(self, point, statut, duree):
+        """ Enregistre le code de la réponse et la durée (en secondes) d'une requête adressée au point d'accès passé en paramètre """
+        with self._verrou:
+            mesure = self._mesures.setdefault(point, {"requetes": 0, "erreurs": 0, "refus": 0,
+                                                      "durees": collections.deque(maxlen=TAILLE_HISTORIQUE_SERVICE)})
+            mesure["requetes"] += 1
+            if statut in (503, 504):
+                mesure["refus"] += 1
+            elif statut >= 400:
+                mesure["erreurs"] += 1
+            mesure["durees"].append(duree)
+
+    def metriques(self):
+        """ Retourne les mesures du service: sa durée de fonctionnement, et pour chaque point d'accès les nombres de requêtes,
+            d'erreurs et de refus (service occupé ou durée dépassée), ainsi que la durée moyenne, médiane, au 95e centile et maximale
+            des TAILLE_HISTORIQUE_SERVICE dernières requêtes, en millisecondes.
+        """
+        with self._verrou:
+            points = {}
+            for point, mesure in self._mesures.items():
+                durees = sorted(mesure["durees"])
+                points[point] = {"requetes": mesure["requetes"], "erreurs": mesure["erreurs"], "refus": mesure["refus"],
+                                 "moyenne_ms": 1000 * sum(durees) / len(durees),
+                                 "p50_ms": 1000 * durees[(len(durees) - 1) // 2],
+                                 "p95_ms": 1000 * durees[(95 * (len(durees) - 1)) // 100],
+                                 "max_ms": 1000 * durees[-1]}
+        return {"duree_fonctionnement": time.monotonic() - self._debut, "points": points}
+
+
+class _Requetes(http.server.BaseHTTPRequestHandler):
+    """ Classe traitant les requêtes HTTP adressées au service """
+
+    def do_GET(self):
+        """ Traite une requête GET, sans paramètres """
+        self._repondre(None)
+
+    def do_POST(self):
+        """ Traite une requête POST, dont le corps est un objet JSON.
+            Une longueur de corps illisible ou négative est refusée avant toute lecture: rfile.read(-1) attendrait la fermeture de la connexion.
+        """
+        try:
+            longueur = int(self.headers.get("Content-Length", 0))
+            if longueur < 0:
+                raise ValueError(longueur)
+        except ValueError:
+            self._envoyer(400, {"erreur": MESSAGE_SERVICE_REQUETE})
+            return
+        if longueur > TAILLE_REQUETE_MAX_SERVICE:
+            self._envoyer(413, {"erreur": MESSAGE_SERVICE_TAILLE})
+            return
+        try:
+            parametres = json.loads(self.rfile.read(longueur) or b"{}")
+        except ValueError:
+            self._envoyer(400, {"erreur": MESSAGE_SERVICE_REQUETE})
+            return
+        self._repondre(parametres)
+
+    def _repondre(self, parametres):
+        """ Traite la requête par le service, mesure sa durée et envoie la réponse.
+            La requête est enregistrée avant l'envoi de la réponse, pour qu'un client interrogeant /metrics ensuite la trouve toujours.
+        """
+        debut = time.monotonic()
+        point = self.path.strip("/").split("?")[0]
+        statut, reponse = self.server.traiter(point, parametres)
+        if point in _POINTS:
+            self.server.noter(point, statut, time.monotonic() - debut)
+        self._envoyer(statut, reponse)
+
+    def _envoyer(self, statut, reponse):
+        """ Envoie la réponse JSON avec le code HTTP passé en paramètre """
+        corps = json.dumps(reponse).encode("utf-8")
+        self.send_response(statut)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def log_message(self, format, *arguments):
+        """ Les requêtes ne sont pas écrites sur la sortie d'erreur: les mesures sont disponibles par /metrics """
+        pass
+
+
+def _lire_grille(grille_texte):
+    """ Retourne la première grille du texte passé en paramètre. Lève FormatTexteException si le texte ne contient aucune grille. """
+    for lue in texte.lire(io.StringIO(grille_texte)):
+        return lue
+    raise FormatTexteException(MESSAGE_ERREUR_FORMAT_TEXTE.format(1))
+
+
+def _lire_grille_jouable(grille_texte):
+    """ Retourne la première grille du texte passé en paramètre, après avoir vérifié ses indicatrices.
+        Le Resolveur suppose que chaque indicatrice est suivie d'une plage cohérente avec ses valeurs: une grille incohérente lève
+        ValeurIncorrecteException, BlockedException ou ExceptionMixte au lieu d'être résolue.
+    """
+    lue = _lire_grille(grille_texte)
+    lue.validate_saisie()
+    return lue
+
+
+def _ecrire_grille(grille_texte, contenu=CONTENU_SAISIE):
+    """ Retourne le texte de la grille passée en paramètre """
+    return "\n".join(texte.lignes(grille_texte, contenu)) + "\n"
+
+
+def _generer(difficulte):
+    """ Calcul exécuté par le groupe de processus: génère une grille de la difficulté passée en paramètre """
+    generee = grille.Grille()
+    generee.generer_grille(difficulte)
+    return 200, {"difficulte": difficulte, "grille": _ecrire_grille(generee), "solution": _ecrire_grille(generee, CONTENU_SOLUTION)}
+
+
+def _resoudre(grille_texte, mode, delai):
+    """ Calcul exécuté par le groupe de processus: résout la grille dans le mode passé en paramètre, pendant au plus delai secondes """
+    try:
+        calcul = resolveur.Resolveur(_lire_grille_jouable(grille_texte), arret=Echeance(delai))
+        resolue = calcul.calculate_solution(mode)
+    except (FormatTexteException, ValeurIncorrecteException, BlockedException, ExceptionMixte) as e:
+        return 400, {"erreur": str(e)}
+    except NoSolutionException as e:
+        return 422, {"erreur": str(e)}
+
+    if calcul.arrete():
+        return 504, {"erreur": MESSAGE_SERVICE_DELAI, "noeuds": calcul.noeuds}
+    if not resolue:
+        return 422, {"erreur": MESSAGE_ERREUR_NOSOLUTION, "noeuds": calcul.noeuds}
+    return 200, {"grille": _ecrire_grille(calcul.grille), "noeuds": calcul.noeuds}
+
+
+def _compter(grille_texte, limite, delai):
+    """ Calcul exécuté par le groupe de processus: compte les solutions de la grille jusqu'à limite, pendant au plus delai secondes.
+        La réponse indique si le comptage est complet, c'est-à-dire s'il n'a pas été interrompu par la fin de la durée allouée.
+    """
+    try:
+        calcul = resolveur.Resolveur(_lire_grille_jouable(grille_texte), arret=Echeance(delai))
+    except (FormatTexteException, ValeurIncorrecteException, BlockedException, ExceptionMixte) as e:
+        return 400, {"erreur": str(e)}
+
+    nombre = calcul.compter_solutions(limite)
+    return 200, {"solutions": nombre, "complet": not calcul.arrete(), "unique": nombre == 1 and not calcul.arrete(), "noeuds": calcul.noeuds}
+
+
+def _valider(grille_texte):
+    """ Calcul exécuté par le groupe de processus: vérifie les indicatrices puis les valeurs saisies de la grille.
+        La réponse contient le message de la première erreur trouvée, et les cases en erreur.
+    """
+    try:
+        lue = _lire_grille(grille_texte)
+    except FormatTexteException as e:
+        return 400, {"erreur": str(e)}
+
+    erreur = None
+    try:
+        lue.validate_saisie()
+        lue.validate()
+    except (DoublonException, SommeIncorrecteException, ExceptionMixte, ValeurIncorrecteException, BlockedException) as e:
+        erreur = str(e)
+
+    en_erreur = [[i, j] for (i, j), case in sorted(lue.items())
+                 if getattr(case, "erreur", False) or getattr(case, "erreur_droite", False) or getattr(case, "erreur_bas", False)]
+    return 200, {"valide": erreur is None, "complete": erreur is None and lue.victoire(), "erreur": erreur, "cases_en_erreur": en_erreur}
+
+
+def _nombre(parametres, nom, defaut):
+    """ Retourne le paramètre numérique nom de la requête, ou defaut s'il est absent.
+        Lève ValueError si le paramètre n'est pas un nombre fini: une durée infinie ou NaN ne laisserait jamais l'échéance expirer.
+    """
+    valeur = float(parametres.get(nom, defaut))
+    if not math.isfinite(valeur):
+        raise ValueError(nom)
+    return valeur
+
+
+def _parametres_generer(parametres, delai):
+    """ Retourne les arguments du calcul de génération """
+    if parametres.get("difficulte", "moyen") not in DIFFICULTES:
+        raise ValueError("difficulte")
+    return (parametres.get("difficulte", "moyen"),)
+
+
+def _parametres_resoudre(parametres, delai):
+    """ Retourne les arguments du calcul de résolution """
+    if parametres.get("mode", "FAST") not in MODES_SERVICE:
+        raise ValueError("mode")
+    return str(parametres["grille"]), parametres.get("mode", "FAST"), delai
+
+
+def _parametres_compter(parametres, delai):
+    """ Retourne les arguments du calcul de comptage des solutions """
+    limite = int(_nombre(parametres, "limite", LIMITE_SOLUTIONS_SERVICE))
+    if not 1 <= limite <= LIMITE_SOLUTIONS_MAX_SERVICE:
+        raise ValueError("limite")
+    return str(parametres["grille"]), limite, delai
+
+
+def _parametres_valider(parametres, delai):
+    """ Retourne les arguments du calcul de validation """
+    return (str(parametres["grille"]),)
+
+
+# Points d'accès: calcul exécuté par le groupe de processus, et fonction retournant ses arguments à partir des paramètres de la requête
+_POINTS = {"generate": (_generer, _parametres_generer),
+           "solve": (_resoudre, _parametres_resoudre),
+           "count_solutions": (_compter, _parametres_compter),
+           "validate": (_valider, _parametres_valider)}
+
+
+def main(arguments=None):
+    """ Lance le service sur le port et avec le nombre de processus donnés en options, jusqu'à son interruption """
+    options = argparse.ArgumentParser(description="Service local de génération, de résolution et de validation des grilles")
+    options.add_argument("--port", type=int, default=PORT_SERVICE)
+    options.add_argument("--processus", type=int, default=PROCESSUS_SERVICE)
+    options.add_argument("--simultanees", type=int, default=REQUETES_SIMULTANEES_SERVICE)
+    options = options.parse_args(arguments)
+
+    service = Service(options.port, options.processus, options.simultanees)
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.fermer()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@
         - pygame: utilisé pour l'affichage de l'écran de jeu et jeu d'une grille
         - grille: utilisé pour manier la grille de jeu
         - boutons: utilisé pour manier les boutons de l'écran
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
         - constantes: utilisé par toutes les méthodes
         - grille: permet l'affichage de la grille résolu
 """
@@ -21,13 +24,17 @@ import pygame
 from pygame.locals import *
 import pygame.freetype
 import boutons
+import ressources
+import boucle
+import rendu
 from constantes import *
 
 
 class Solution:
     """ Classe Solution, permet d'afficher la solution d'une grille.
-        Cette classe possède 8 attributs:
+        Cette classe possède 6 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
             - grille: la grille de jeu
             - bouton_menu: bouton permettant de retourner au menu
             - victoire: boolean permettant de savoir si le joueur à gagner ou à demander la solution
@@ -45,24 +52,26 @@ class Solution:
         self._fenetre = fenetre
         self.grille = grille
         self.bouton_menu = boutons.Bouton(TITRE_BOUTON_MENU)
-        self.barre_erreur = boutons.BarreErreur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON))
+        self.barre_erreur = boutons.BarreErreur(ressources.police(TAILLE_POLICE_BOUTON))
         self.victoire = victoire
+        self._rendu = rendu.Rendu()
 
     def afficher(self):
-        """ Méthode permettant d'afficher l'écran de solution à l'écran.
-            Le bouton menu est affiché, ainsi que la barre d'erreur et la grille.
+        """ Méthode permettant de déclarer l'écran de solution à son rendu.
+            Le bouton menu est déclaré, ainsi que la barre d'erreur et la grille.
         """
 
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
-        self.bouton_menu.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SOLUTION)
-        self.grille.afficher_grille(self._fenetre)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_menu, bouton_img, titre_bouton, POSITION_BOUTON_SOLUTION)
+        self._rendu.ajouter_grille(self._fenetre, self.grille)
 
         if self.victoire:
-            self.barre_erreur.afficher_erreur(self._fenetre, MESSAGE_VICTOIRE, COULEUR_MESSAGE)
+            message = MESSAGE_VICTOIRE
         else:
-            self.barre_erreur.afficher_erreur(self._fenetre, MESSAGE_DEFAITE, COULEUR_MESSAGE)
+            message = MESSAGE_DEFAITE
+        self._rendu.ajouter("erreur", message, self.barre_erreur.afficher_erreur, self._fenetre, message, COULEUR_MESSAGE)
 
     def attente_evenement(self):
         """ Méthode permettant d'afficher la solution et d'attendre un événement.
@@ -73,11 +82,10 @@ class Solution:
 
         while True:
 
-            self._fenetre.fill(COULEUR_FOND)
             self.afficher()
-            pygame.display.flip()
+            self._rendu.mettre_a_jour(self._fenetre)
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
                 if event.type == QUIT:
                     pygame.quit()
                 if event.type == MOUSEBUTTONUP and event.button == 1:
@@ -3,73 +3,107 @@
 
 """ Module Solveur du produit.
     Ce module permet l'implémentation de la fonctionnalité Solveur.
+    Le calcul de la solution est exécuté dans un thread séparé par le module resolveur. L'écran reste réactif et affiche l'avancement publié par le calcul.
     Ce module possède une unique classe Solveur.
 
     Modules importés:
+        - threading: utilisé pour exécuter le calcul en arrière-plan
+        - queue: utilisé pour recevoir l'avancement du calcul
         - pygame: utilisé pour l'affichage
         - boutons: utilisé pour  afficher les informations à l'écran
+        - ressources: utilisé pour obtenir les images et les polices sans les recharger
+        - boucle: utilisé pour attendre les événements sans occuper le processeur
+        - rendu: utilisé pour ne redessiner que les éléments modifiés de l'écran
+        - resolveur: utilisé pour calculer la solution
         - constantes: utilisé par toutes les méthodes
-        - cases : utilisé lors du calcul de la solution
-        - grille : utilisé lors du calcul de la solution
-        - random : utilisé lors du calcul de la solution
-        - exception: utilisé pour les grilles sans solutions
+        - cases : utilisé pour afficher l'avancement du calcul
+        - grille : utilisé pour copier la grille avant le calcul
+        - random : utilisé pour changer le message affiché
+        - exception: utilisé pour les grilles sans solutions et l'abandon
 
 """
 import random
+import threading
+import queue
 import pygame
 from pygame.locals import *
 import pygame.freetype
 import cases
 import boutons
 from grille import *
+import ressources
+import boucle
+import rendu
+import resolveur
 from exceptions import *
 from constantes import *
 
 
 class Solveur:
     """ Classe permettant de calculer la solution d'une grille tout en affichant les différentes étapes de calcul à l'utilisateur.
-        Cette classe possède 4 attributs:
+        Pendant le calcul, l'écran lit à chaque image les messages publiés par le calcul, à la fréquence images_par_seconde.
+        Cette classe possède 9 attributs:
             - _fenetre: la fenetre d'affichage de l'écran
+            - _rendu: l'affichage partiel de l'écran
             - _grille: la grille en cours d'edition
+            - _images_par_seconde: la fréquence d'affichage et de publication de l'avancement pendant le calcul
+            - _noeuds_par_image: le nombre de noeuds explorés entre deux publications de l'avancement, ou 0
             - bouton_abandon: bouton permettant d'arreter le calcul de la solution
             - barre_erreur: zone d'affichage
             - message: message devant être affiché à l'utilisateur
+            - progression: texte décrivant l'avancement du calcul (noeuds explorés, vitesse, profondeur)
     """
 
-    def __init__(self, fenetre, grille):
+    def __init__(self, fenetre, grille, images_par_seconde=IMAGES_PAR_SECONDE_SOLVEUR, noeuds_par_image=NOEUDS_PAR_IMAGE_SOLVEUR):
         """ Initialise les attributs de la classe.
             La fenetre d'affichage et la grille à calculer sont passées en paramètre.
+            images_par_seconde et noeuds_par_image fixent la fréquence d'affichage pendant le calcul. Une valeur nulle désactive le critère correspondant.
             Le bouton d'abandon, la barre d'erreur sont initialisées.
             Le compteur de message est initialisé à 0.
         """
 
         self._fenetre = fenetre
         self._grille = grille
+        self._images_par_seconde = images_par_seconde
+        self._noeuds_par_image = noeuds_par_image
         self.bouton_abandon = boutons.Bouton(TITRE_BOUTON_ABANDON)
 
         self.bouton_simple = boutons.Bouton(TITRE_BOUTON_SOLVEUR_SIMPLE)
         self.bouton_moyen = boutons.Bouton(TITRE_BOUTON_SOLVEUR_MOYEN)
         self.bouton_complexe = boutons.Bouton(TITRE_BOUTON_SOLVEUR_COMPLEXE)
 
-        self.barre_erreur = boutons.BarreErreur(pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON))
+        self.barre_erreur = boutons.BarreErreur(ressources.police(TAILLE_POLICE_BOUTON))
         self.compteur_changement_message = 0
         self.message = ""
+        self.progression = ""
+        self._rendu = rendu.Rendu()
 
     def afficher(self):
-        """ Affiche l'ecran du solveur.
-            La grille est affiché ainsi que le bouton d'abandon.
+        """ Déclare l'ecran du solveur à son rendu.
+            La grille est déclarée ainsi que les boutons.
             Le message est affiché par la barre_erreur.
         """
-        titre_bouton = pygame.freetype.Font(CHEMIN_FICHIER_POLICE, TAILLE_POLICE_BOUTON)
-        bouton_img = pygame.image.load(CHEMIN_IMAGE_BOUTON).convert_alpha()
+        titre_bouton = ressources.police(TAILLE_POLICE_BOUTON)
+        bouton_img = ressources.image(CHEMIN_IMAGE_BOUTON, True)
 
-        self.bouton_abandon.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
-        self.bouton_simple.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_SIMPLE)
-        self.bouton_moyen.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_MOYEN)
-        self.bouton_complexe.afficher(self._fenetre, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_COMPLEXE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_abandon, bouton_img, titre_bouton, POSITION_BOUTON_RETOUR)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_simple, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_SIMPLE)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_moyen, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_MOYEN)
+        self._rendu.ajouter_bouton(self._fenetre, self.bouton_complexe, bouton_img, titre_bouton, POSITION_BOUTON_SOLVEUR_COMPLEXE)
 
-        self._grille.afficher_grille(self._fenetre)
-        self.barre_erreur.afficher_erreur(self._fenetre, self.message, COULEUR_POLICE)
+        self._rendu.ajouter_grille(self._fenetre, self._grille)
+        self._rendu.ajouter("message", self.message, self.barre_erreur.afficher_erreur, self._fenetre, self.message, COULEUR_POLICE)
+        self._rendu.ajouter("progression", self.progression, self.afficher_progression)
+
+    def afficher_progression(self):
+        """ Affiche le texte d'avancement du calcul. Retourne le rect de la zone dessinée. """
+        texte = ressources.texte(ressources.police(TAILLE_POLICE_BOUTON), self.progression, COULEUR_POLICE)
+        return self._fenetre.blit(texte, POSITION_PROGRESSION_SOLVEUR)
+
+    def rafraichir(self):
+        """ Redessine les éléments de l'écran modifiés depuis la dernière image et met à jour la fenêtre. """
+        self.afficher()
+        self._rendu.mettre_a_jour(self._fenetre)
 
     def loop(self):
         """ Méthode permettant de résoudre une grille selon plusieurs niveau de résolution.
@@ -82,11 +116,9 @@ class Solveur:
         """
         # Boucle infinie
         while True:
-            self._fenetre.fill(COULEUR_FOND)
-            self.afficher()
-            pygame.display.flip()
+            self.rafraichir()
 
-            for event in pygame.event.get():
+            for event in boucle.evenements():
                 if event.type == QUIT:
                     pygame.quit()
 
@@ -109,306 +141,96 @@ class Solveur:
                     elif self.bouton_abandon.clicked(curseur):
                         raise AbandonException()
 
-    def updateDisplaying(self):
-        """ Update the displaying during the solver exection """
-        # Affichage
-        self.change_message()
-        self._fenetre.fill(COULEUR_FOND)
-        self.afficher()
-        pygame.display.flip()
-        self.gestion_evenement()
-
     def calculate_solution(self, flag):
         """ Méthode permettant de calculer la solution d'une grille.
-            Dans un premier temps, la grille est mis dans une forme calculable.
-            Cette méthode calcule l'ensemble des domaines de valeurs pour chaque plage et affecte à domaine leur intersection.
-            Elle verifie ensuite si la grille à une solution.
-            Elle appelle le solveur sur la première case si c'est le cas
+            Le calcul est lancé sur une copie de la grille dans un thread séparé. Pendant ce temps, l'écran est redessiné
+            et les événements traités à chaque image, et l'avancement publié par le calcul est appliqué à la grille affichée.
+            Un clic sur le bouton d'abandon demande l'arrêt du calcul, qui remonte alors sa recherche et publie son abandon.
+            Retourne True si une solution a été trouvée, la grille de l'écran étant remplacée par la grille résolue.
+            Lève l'exception ayant interrompu le calcul, ou AbandonException en cas d'abandon.
         """
-        self.message = MESSAGE_CORRECTION_GRILLE
-        self.correction_grille()
-        self.message = MESSAGE_ENSEMBLES_POSSIBLES
-        self.distribuer_domaine()
-        self._grille.initDegre()
-        self.message = MESSAGE_SOLVABILITE
-        self.has_solution()
-        self.message = MESSAGE_CALCUL
-
-        if flag == "SLOW":
-            self.baseSolver(0, 0)
-            return True
-
-        else:
-            return self.solver(flag)
-
-    def correction_grille(self):
-        """ Méthode permettant de corriger les éventuelles erreurs laissées par l'utilisateur lors de la saisie de la grille.
-            Les cases vides n'étant rattachées à aucune indicatrice sont transformées en case noire.
-        """
-
-        for (i, j) in self._grille.keys():
-            self._fenetre.fill(COULEUR_FOND)
-            self.afficher()
-            pygame.display.flip()
-            self.gestion_evenement()
-
-            if type(self._grille[i, j]) is cases.CaseVide and self._grille.get_indicatrices(i, j) == (None, None):
-                self._grille[i, j] = cases.CaseNoire()
-
-    def baseSolver(self, i, j):
-        """ Méthode permettant de générer la solution d'une grille.
-            Cette méthode est récursive et s'appelle sur les cases de la grille.
-
-            Si la case courante est une case vide, elle essaye de lui affecter comme valeur une de ses valeurs_possibles.
-            Si ce n'est pas possible elle retourne False et remet sa valeur a -1. Si la grille est finie après avoir entré cette valeur, elle retourne True.
-
-            Elle lance ensuite l'appel sur la case suivante (en fonction de la position dans la grille) tant qu'il ne retourne pas true ou qu'il reste des valeurs à affecter.
-            Si cet appel retourne faux, elle change sa propre valeur.
-            Si il n'y a plus de valeurs possibles, elle retourne alors elle-même faux après avoir remis sa valeur à -1.
-            Si cet appel retourne vrai, elle le retourne.
+        self.compteur_changement_message = 0
+        progression = queue.Queue()
+        arret = threading.Event()
+        calcul = resolveur.Resolveur(Grille(grid=self._grille), progression, arret, self._images_par_seconde, self._noeuds_par_image)
+        thread = threading.Thread(target=calcul.resoudre, args=(flag,), name="solveur", daemon=True)
+        thread.start()
 
-            Si ce n'est pas une case vide n'ayant pas de valeurs saisies, elle lance simplement l'appel sur la case suivante et retourne son retour.
+        delai = int(1000 / self._images_par_seconde) if self._images_par_seconde else DELAI_ATTENTE_EVENEMENT
+        try:
+            while True:
+                self.rafraichir()
+
+                for event in boucle.evenements(delai, self._images_par_seconde or IMAGES_PAR_SECONDE_MAX):
+                    if event.type == QUIT:
+                        arret.set()
+                        pygame.quit()
+
+                    elif event.type == MOUSEBUTTONUP and event.button == 1:
+                        if self.bouton_abandon.clicked(pygame.Rect(event.pos, (0, 0))):
+                            arret.set()
+
+                if self.lire_progression(progression):
+                    return True
+        finally:
+            arret.set()
+            thread.join()
+
+    def lire_progression(self, progression):
+        """ Vide la file des messages publiés par le calcul.
+            L'avancement est appliqué à l'écran. Retourne True si la grille résolue a été reçue, False si le calcul continue.
+            Lève l'exception publiée par le calcul, ou AbandonException si le calcul a été abandonné.
         """
-        # Affichage
-        self.change_message()
-        self._fenetre.fill(COULEUR_FOND)
-        self.afficher()
-        pygame.display.flip()
-        self.gestion_evenement()
-
-        # Cas d'une case vide
-        if type(self._grille[i, j]) is cases.CaseVide and self._grille[i, j].valeur_saisie == -1:
-            valeurs_possibles = list(self._grille[i, j].domaine)
-            erreur = True
-            fin = False
-
-            # On teste chaque valeur jusqu'a ce qu'une marche
-            while erreur and len(valeurs_possibles) != 0:
-                self._grille[i, j].valeur_saisie = random.choice(valeurs_possibles)
-                try:
-                    self._grille.validate(True)
-                    erreur = False
-                except:
-                    valeurs_possibles.remove(self._grille[i, j].valeur_saisie)
-                    erreur = True
-
-            # Si aucune ne marche, on retourne False. La grille n'a pas de solutions en l'état
-            if erreur:
-                self._grille[i, j].valeur_saisie = -1
-                return False
-
-            # Si la grille est fini, on retourne la solution
-            elif self._grille.victoire():
-                return True
-
-            # Partie recursive
-            while not(fin) and len(valeurs_possibles) != 0:
-
-                if i < self._grille.nb_colonne - 1:
-                    fin = self.baseSolver(i + 1, j)
-
-                elif j < self._grille.nb_ligne - 1:
-                    fin = self.baseSolver(0, j + 1)
-
-                if not(fin):
-                    valeurs_possibles.remove(self._grille[i, j].valeur_saisie)
-                    if len(valeurs_possibles) != 0:
-                        self._grille[i, j].valeur_saisie = random.choice(valeurs_possibles)
-
-            if fin:
-                return True
-            else:
-                self._grille[i, j].valeur_saisie = -1
+        while True:
+            try:
+                nature, contenu = progression.get_nowait()
+            except queue.Empty:
                 return False
 
-        # Cas d'une case noire/indicatrice, on réitère simplement l'appel
-        else:
-            if self._grille.victoire():
+            if nature == CALCUL_PROGRESSION:
+                self.appliquer(contenu)
+            elif nature == CALCUL_RESULTAT:
+                self._grille = contenu
                 return True
-
-            if i < self._grille.nb_colonne - 1:
-                return self.baseSolver(i + 1, j)
-            elif j < self._grille.nb_ligne - 1:
-                return self.baseSolver(0, j + 1)
-
-    def distribuer_domaine(self):
-        """ Méthode permettant d'affecter à chaque case vide son domaine de valeur possible.
-            Cet ensemble permettrait de donner une solution à la grille.
-            Pour chaque indicatrice, elle calcule le domaine de valeur de sa plage bas et droite, en fonction de ses valeurs bas et droites et des longueurs de chaque plage.
-            Pour chaque case de la plage bas, l'intersection entre le domaine_bas et son domaine existant est affecté à la case.
-            Pour chaque case de la plage droite, l'intersection entre le domaine_droite et son domaine existant est affecté à la case.
+            elif nature == CALCUL_ERREUR:
+                raise contenu
+            elif nature == CALCUL_ABANDON:
+                raise AbandonException()
+
+    def appliquer(self, instantane):
+        """ Applique un instantané de l'avancement du calcul à l'écran.
+            Les valeurs des cases vides sont recopiées dans la grille affichée, et le message et le texte d'avancement sont mis à jour.
+            Si le calcul en est à la recherche, le message change régulièrement en fonction du nombre de noeuds explorés.
         """
-        # Affichage
-        self._fenetre.fill(COULEUR_FOND)
-        self.afficher()
-        pygame.display.flip()
-
-        for (i, j) in self._grille.keys():
-
-            self.gestion_evenement()
-
-            if type(self._grille[i, j]) is cases.Indicatrice:
-
-                if self._grille[i, j].valeur_droite != 0:
-                    # Calcul du nouveau domaine possible
-                    longueur_droite = Grille.longueur(self._grille.ligne(i + 1, j)) + 1
-                    self._grille[i, j].domaine_droite = Grille.get_domaine(self._grille[i, j].valeur_droite, longueur_droite)
-
-                    domaine = [nb for sousliste in self._grille[i, j].domaine_droite for nb in sousliste]
-                    domaine = set(domaine)
-
-                    # Intersection entre domaines
-                    self._grille[i + 1, j].domaine = set.intersection(self._grille[i + 1, j].domaine, domaine)
-                    for el in self._grille.ligne(i + 1, j):
-                        el.domaine = set.intersection(el.domaine, domaine)
-
-                if self._grille[i, j].valeur_bas != 0:
-                    # Calcul du nouveau domaine possible
-                    longueur_bas = Grille.longueur(self._grille.colonne(i, j + 1)) + 1
-                    self._grille[i, j].domaine_bas = Grille.get_domaine(self._grille[i, j].valeur_bas, longueur_bas)
+        for (i, j), valeur in instantane["valeurs"].items():
+            if type(self._grille[i, j]) is cases.CaseVide:
+                self._grille[i, j].valeur_saisie = valeur
 
-                    domaine = [nb for sousliste in self._grille[i, j].domaine_bas for nb in sousliste]
-                    domaine = set(domaine)
+        if instantane["message"] != MESSAGE_CALCUL or self.message not in TABLEAU_MESSAGE:
+            self.message = instantane["message"]
+        if instantane["message"] == MESSAGE_CALCUL:
+            self.change_message(instantane["noeuds"] - self.compteur_changement_message)
 
-                    # Intersection des domaines
-                    self._grille[i, j + 1].domaine = set.intersection(self._grille[i, j + 1].domaine, domaine)
-                    for el in self._grille.colonne(i, j + 1):
-                        el.domaine = set.intersection(el.domaine, domaine)
+        self.progression = FORMAT_PROGRESSION_SOLVEUR.format(**instantane)
 
-                print("Domaine de l'indicatrice:\n", self._grille[i, j].domaine_droite, "\n", self._grille[i, j].domaine_bas)
+    def correction_grille(self):
+        """ Méthode permettant de corriger les éventuelles erreurs laissées par l'utilisateur lors de la saisie de la grille.
+            Les cases vides n'étant rattachées à aucune indicatrice sont transformées en case noire.
+        """
+        resolveur.Resolveur(self._grille).correction_grille()
 
     def has_solution(self):
         """ Méthode permettant de verifier si une grille à une solution calculable.
-            Parcourt l'ensemble de la grille. Si une case vide à un domaine contenant un seul élément, elle affecte à la case cette valeur.
-            Elle retire cette valeur des domaines de l'ensemble des cases de sa plage.
-
-            Elle parcourt ensuite une seconde fois la grille et verifie qu'aucune case vide n'a un domaine vide, sans avoir de valeur_saisie.
+            Lève NoSolutionException si une case vide ou une plage n'a plus aucune valeur possible.
         """
+        resolveur.Resolveur(self._grille).has_solution()
 
-        # On teste si la grille a une solution
-        for (i, j) in self._grille.keys():
-            if type(self._grille[i, j]) is cases.CaseVide:
-                if len(self._grille[i, j].domaine) == 0 and self._grille[i, j].valeur_saisie == -1:
-                    self._grille[i, j].erreur = True
-                    raise NoSolutionException()
-
-            if type(self._grille[i, j]) is cases.Indicatrice:
-                indicatrice = self._grille[i, j]
-                if indicatrice.valeur_bas != 0 and len(indicatrice.domaine_bas) == 0:
-                    indicatrice.erreur_bas = True
-                    raise NoSolutionException()
-
-                elif indicatrice.valeur_droite != 0 and len(indicatrice.domaine_droite) == 0:
-                    indicatrice.erreur_droite = True
-                    raise NoSolutionException()
-
-    def change_message(self):
+    def change_message(self, noeuds=1):
         """ Cette méthode permet de changer le message affiché à l'écran.
-            Le compteur_changement_message est incrémenté à chaque appel.
-            Si ce compteur arrive à un multiple de VAL_CHANGEMENT_MESSAGE, le message affiché à l'écran est changé.
+            Le compteur_changement_message est augmenté du nombre de noeuds explorés passé en paramètre.
+            Si ce compteur dépasse un multiple de VAL_CHANGEMENT_MESSAGE, le message affiché à l'écran est changé.
         """
-        self.compteur_changement_message += 1
-        if self.compteur_changement_message % VAL_CHANGEMENT_MESSAGE == 0:
+        avant = self.compteur_changement_message
+        self.compteur_changement_message += noeuds
+        if avant // VAL_CHANGEMENT_MESSAGE != self.compteur_changement_message // VAL_CHANGEMENT_MESSAGE:
             self.message = random.choice(TABLEAU_MESSAGE)
-
-    def gestion_evenement(self):
-        """ Méthode permettant de gérer les évenements.
-            Cette méthode est utilisé dans chaque étape du solveur pour permettre à l'utilisateur de quitter le jeu ou le calcul de la grille.
-            Cela permet aussi de simplement intéragir avec la fenêtre sans entrainer de problème avec le calcul de la solution
-        """
-        for event in pygame.event.get():
-
-            if event.type == QUIT:
-                pygame.quit()
-
-            if event.type == MOUSEBUTTONUP:
-                curseur = pygame.Rect(event.pos, (0, 0))
-
-                if self.bouton_abandon.clicked(curseur):
-                    raise AbandonException()
-
-    def solver(self, flag):
-        """ Solveur utilisant un algorithme à recherche en arrière, en utilisant les heuristiques MRV et degré """
-        try:
-            (i, j), square = self._grille.getNextSquareUsingHeuristics()
-        except IndexError as e:
-            return True
-
-        valeurs_possibles = list(square.domaine)
-        erreur = True
-        fini = False
-
-        # On teste chaque valeur jusqu'a ce qu'une marche
-        while not fini and len(valeurs_possibles) != 0:
-            square.valeur_saisie = random.choice(valeurs_possibles)
-            copy = Grille(grid=self._grille)
-            erreur = self.postTreatment(flag, i, j)
-            self.updateDisplaying()
-
-            if not erreur:
-                fini = self._grille.victoire() or self.solver(flag)
-
-            if erreur or not fini:
-                self._grille = copy
-                square = self._grille[i, j]
-                valeurs_possibles = [el for el in list(square.domaine) if el in valeurs_possibles]
-                valeurs_possibles.remove(square.valeur_saisie)
-
-        if not fini:
-            square.valeur_saisie = -1
-
-        return fini
-
-    def postTreatment(self, flag, i, j):
-        """ Verifies that the grid is correct.
-            Applies forward and arc consistency checking and verifies that there is no empty domain.
-            params:
-                i,j -> coordinates of the current square
-        """
-        try:
-            self._grille.validate(True)
-            if flag == "FAST":
-                self._grille.forwardChecking(i, j)
-                self._grille.checkArcConsistency(i, j)
-                self.has_solution()
-            erreur = False
-        except Exception as e:
-            print(e)
-            erreur = True
-
-        return erreur
-
-    def checkArcConsistency(self, i, j):
-        """ returns true if arcs are consistent
-            returns false otherwise
-        """
-
-        queue = [((i, j), self._grille[i, j])]
-        while len(queue) != 0:
-            index, caseCourante = queue.pop()
-
-            # Vérification des domaines
-            for otherIndex in self._grille.ligneIndices(*index):
-                self._grille.checkDomain(*otherIndex)
-
-            for otherIndex in self._grille.colonneIndices(*index):
-                self._grille.checkDomain(*otherIndex)
-
-            """if caseCourante.valeur_saisie == -1 and len(caseCourante.domaine)==1:
-
-                caseCourante.valeur_saisie=caseCourante.domaine[0] 
-                valeur = caseCourante.valeur_saisie
-
-                for otherIndex in self.ligneIndices(*index): 
-                    other = self._grille[otherIndex]                        
-                    if valeur in other.domaine:
-                        other.domaine.remove(valeur)
-                        queue.append((otherIndex, other))
-
-                for otherIndex in self.colonne(*index): 
-                    other = self._grille[otherIndex]                                   
-                    if valeur in other.domaine:
-                        other.domaine.remove(caseCourante.valeur_saisie)
-                        queue.append((otherIndex, other))"""
-
-        return True
@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module apercu
+
+    Ce module est composé d'une unique classe ApercuTest, dont les méthodes effectuent les tests unitaires des fonctions du module apercu.
+
+    Module utilisé:
+        - io, os, shutil: utilisés pour relire les images produites et supprimer les fichiers générés par les tests
+        - unittest: utilisé pour effectuer les tests unitaires
+        - xml.etree.ElementTree: utilisé pour vérifier les images SVG
+        - pygame: utilisé pour relire les images PNG
+        - grille, cases: utilisés pour créer les grilles à dessiner
+        - apercu: utilisé pour tester ses fonctions
+        - constantes: utilisé dans chaque méthode
+"""
+
+import io
+import os
+import shutil
+import unittest
+import xml.etree.ElementTree
+import pygame
+import grille
+import cases
+import apercu
+from constantes import *
+
+CHEMIN_DOSSIER_APERCUS_TEST = "TU_apercus"
+
+
+class ApercuTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module apercu"""
+
+    def setUp(self, diff="moyen"):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille est générée, et les aperçus conservés sont oubliés.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille(diff)
+        apercu.vider()
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le dossier des aperçus de test """
+        shutil.rmtree(CHEMIN_DOSSIER_APERCUS_TEST, ignore_errors=True)
+
+    def test_svg(self):
+        """ Méthode permettant de tester le comportement de svg.
+            L'aperçu doit être un document SVG aux dimensions de la grille, contenant un texte par valeur affichée.
+        """
+        racine = xml.etree.ElementTree.fromstring(apercu.svg(self.grille, True, 20))
+        self.assertEqual((racine.get("width"), racine.get("height")), (str(20 * self.grille.nb_colonne), str(20 * self.grille.nb_ligne)))
+
+        textes = [element.text for element in racine.iter("{http://www.w3.org/2000/svg}text")]
+        attendus = [str(case._solution_case) for case in self.grille.values() if type(case) is cases.CaseVide]
+        attendus += [str(somme) for case in self.grille.values() if type(case) is cases.Indicatrice for somme in (case.valeur_droite, case.valeur_bas) if somme]
+        self.assertEqual(sorted(textes), sorted(attendus))
+
+    def test_png(self):
+        """ Méthode permettant de tester le comportement de png.
+            L'aperçu doit être une image PNG aux dimensions de la grille, dont les cases noires ont leur couleur.
+        """
+        image = pygame.image.load(io.BytesIO(apercu.png(self.grille)), "apercu.png")
+        self.assertEqual(image.get_size(), (COTE_CASE_APERCU * self.grille.nb_colonne, COTE_CASE_APERCU * self.grille.nb_ligne))
+
+        for (i, j), case in self.grille.items():
+            if type(case) is cases.CaseNoire:
+                centre = (i * COTE_CASE_APERCU + COTE_CASE_APERCU // 2, j * COTE_CASE_APERCU + COTE_CASE_APERCU // 2)
+                self.assertEqual(tuple(image.get_at(centre))[:3], COULEUR_CASE_NOIRE_APERCU)
+
+    def test_cache(self):
+        """ Méthode permettant de tester la conservation des aperçus.
+            Une même grille ne doit être dessinée qu'une fois. Une valeur saisie doit changer l'empreinte et l'aperçu.
+        """
+        self.assertIs(apercu.png(self.grille), apercu.png(self.grille))
+        self.assertIs(apercu.svg(self.grille), apercu.svg(self.grille))
+        premiere = apercu.svg(self.grille)
+        self.assertNotEqual(apercu.empreinte(self.grille), apercu.empreinte(self.grille, True))
+
+        empreinte = apercu.empreinte(self.grille)
+        vide = next((i, j) for (i, j), case in self.grille.items() if type(case) is cases.CaseVide)
+        self.grille[vide].valeur_saisie = 5
+        self.assertNotEqual(apercu.empreinte(self.grille), empreinte)
+        self.assertNotEqual(apercu.svg(self.grille), premiere)
+
+        avant = apercu.png(self.grille)
+        apercu.vider()
+        self.assertIsNot(apercu.png(self.grille), avant)
+        self.assertEqual(apercu.png(self.grille), avant)
+
+    def test_enregistrer(self):
+        """ Méthode permettant de tester le comportement de enregistrer.
+            Le fichier doit être nommé par l'empreinte de la grille, et ne pas être réécrit lors d'un second appel.
+        """
+        for format in FORMATS_APERCU:
+            chemin = apercu.enregistrer(self.grille, format, dossier=CHEMIN_DOSSIER_APERCUS_TEST)
+            self.assertEqual(os.path.basename(chemin), apercu.empreinte(self.grille) + "." + format)
+            self.assertTrue(os.path.getsize(chemin) > 0)
+
+            os.utime(chemin, (0, 0))
+            self.assertEqual(apercu.enregistrer(self.grille, format, dossier=CHEMIN_DOSSIER_APERCUS_TEST), chemin)
+            self.assertEqual(os.path.getmtime(chemin), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module benchmark
+
+    Ce module est composé d'une unique classe BenchmarkTest, dont les méthodes effectuent les tests unitaires des fonctions du module benchmark.
+
+    Module utilisé:
+        - io, shutil: utilisés pour lire une grille incohérente et supprimer le corpus généré par les tests
+        - subprocess, sys: utilisés pour vérifier les modules chargés au lancement du jeu
+        - unittest: utilisé pour effectuer les tests unitaires
+        - texte: utilisé pour relire le corpus généré
+        - benchmark: utilisé pour tester ses fonctions
+        - diagnostic: utilisé pour vérifier que les erreurs des calculs sont journalisées
+        - constantes: utilisé dans chaque méthode
+"""
+
+import io
+import shutil
+import subprocess
+import sys
+import unittest
+import texte
+import benchmark
+import diagnostic
+from constantes import *
+
+CHEMIN_DOSSIER_CORPUS_TEST = "TU_corpus_benchmark"
+
+
+class BenchmarkTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module benchmark"""
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le corpus de test """
+        shutil.rmtree(CHEMIN_DOSSIER_CORPUS_TEST, ignore_errors=True)
+
+    def test_centile(self):
+        """ Méthode permettant de tester le comportement de centile, par la méthode du rang le plus proche """
+        valeurs = [5, 1, 4, 2, 3]
+        self.assertEqual(benchmark.centile(valeurs, 0.5), 3)
+        self.assertEqual(benchmark.centile(valeurs, 0.95), 5)
+        self.assertEqual(benchmark.centile(valeurs, 0), 1)
+        self.assertEqual(benchmark.centile([7], 0.95), 7)
+
+    def test_comparer(self):
+        """ Méthode permettant de tester le comportement de comparer.
+            Seules les médianes dépassant la référence de plus du seuil doivent être signalées, les groupes absents de la référence étant ignorés.
+        """
+        reference = {"mesures": {"FAST/facile/10x10": {"mediane_ms": 100}, "SLOW/facile/10x10": {"mediane_ms": 100}}}
+        resultats = {"mesures": {"FAST/facile/10x10": {"mediane_ms": 119}, "SLOW/facile/10x10": {"mediane_ms": 121},
+                                 "MEDIUM/facile/10x10": {"mediane_ms": 1000}}}
+        self.assertEqual(benchmark.comparer(resultats, reference, 0.2), [("SLOW/facile/10x10", 100, 121)])
+        self.assertEqual(benchmark.comparer(resultats, reference, 0.25), [])
+
+        reference["demarrage"] = {"import/menu": {"mediane_ms": 100}}
+        resultats["demarrage"] = {"import/menu": {"mediane_ms": 130}}
+        self.assertEqual(benchmark.comparer(resultats, reference, 0.25), [("import/menu", 100, 130)])
+
+        # Un groupe qui ne se termine plus est une régression, un groupe qui ne se terminait pas n'est pas comparé
+        reference["mesures"]["MEDIUM/facile/10x10"] = {"mediane_ms": None}
+        resultats["mesures"]["FAST/facile/10x10"]["mediane_ms"] = None
+        self.assertEqual(benchmark.comparer(resultats, reference, 0.25), [("FAST/facile/10x10", 100, None), ("import/menu", 100, 130)])
+
+    def test_generer_corpus(self):
+        """ Méthode permettant de tester le comportement de generer_corpus: une même graine doit produire le même corpus """
+        benchmark.generer_corpus(1, 7, CHEMIN_DOSSIER_CORPUS_TEST)
+        corpus = benchmark.lire_corpus(DIFFICULTES, CHEMIN_DOSSIER_CORPUS_TEST)
+        self.assertEqual([difficulte for difficulte, lue in corpus], list(DIFFICULTES))
+
+        premier = [list(texte.lignes(lue)) for difficulte, lue in corpus]
+        benchmark.generer_corpus(1, 7, CHEMIN_DOSSIER_CORPUS_TEST)
+        self.assertEqual([list(texte.lignes(lue)) for difficulte, lue in benchmark.lire_corpus(DIFFICULTES, CHEMIN_DOSSIER_CORPUS_TEST)], premier)
+
+    def test_executer(self):
+        """ Méthode permettant de tester le comportement de executer sur le corpus enregistré.
+            Chaque groupe doit contenir une exécution par grille et par répétition, et des statistiques cohérentes.
+            Le 95e centile n'est pas donné pour moins de ECHANTILLONS_CENTILE_BENCHMARK exécutions terminées.
+        """
+        resultats = benchmark.executer(["FAST"], ["facile"], 2)
+        self.assertEqual(resultats["parametres"]["modes"], ["FAST"])
+        self.assertEqual(resultats["parametres"]["delais"], {"FAST": DELAIS_BENCHMARK["FAST"]})
+
+        nombre = len(benchmark.lire_corpus(["facile"]))
+        self.assertEqual(sum(mesure["executions"] for mesure in resultats["mesures"].values()), 2 * nombre)
+        for groupe, mesure in resultats["mesures"].items():
+            self.assertTrue(groupe.startswith("FAST/facile/"))
+            self.assertTrue(mesure["mediane_ms"] > 0)
+            if mesure["executions"] - mesure["hors_delai"] - mesure["erreurs"] < ECHANTILLONS_CENTILE_BENCHMARK:
+                self.assertIsNone(mesure["p95_ms"])
+            self.assertTrue(mesure["noeuds_median"] > 0 and mesure["memoire_max_ko"] > 0)
+            self.assertTrue(0 <= mesure["resolues"] <= mesure["executions"])
+
+    def test_hors_delai(self):
+        """ Méthode permettant de tester les exécutions arrêtées faute de temps: elles doivent être comptées à part, sans durée médiane """
+        resultats = benchmark.executer(["MEDIUM"], ["facile"], 1, delai=0)
+        for groupe, mesure in resultats["mesures"].items():
+            self.assertEqual((mesure["hors_delai"], mesure["resolues"], mesure["erreurs"]), (mesure["executions"], 0, 0))
+            self.assertIsNone(mesure["mediane_ms"])
+            self.assertIsNone(mesure["p95_ms"])
+
+    def test_erreur(self):
+        """ Méthode permettant de tester qu'une exception levée par le calcul est comptée comme une erreur et journalisée, et non comme une grille non résolue """
+        incoherente = next(texte.lire(io.StringIO("1\\2 3\n")))
+        with self.assertLogs(diagnostic.journal, "ERROR"):
+            mesure = benchmark.mesurer(incoherente, "FAST", GRAINE_BENCHMARK)
+        self.assertIn("KeyError", mesure["erreur"])
+        self.assertFalse(mesure["resolue"] or mesure["hors_delai"])
+
+    def test_demarrage(self):
+        """ Méthode permettant de tester le comportement de mesurer_demarrage et executer_demarrage.
+            La durée d'import de la grille doit être mesurée, sans que pygame ne soit importé.
+        """
+        total, imports = benchmark.mesurer_demarrage("grille")
+        self.assertTrue(total > 0 and 0 < len(imports) <= IMPORTS_SIGNALES_BENCHMARK)
+        self.assertTrue(all(total >= duree for nom, duree in imports))
+        self.assertNotIn("pygame", [nom for nom, duree in imports])
+
+        demarrage = benchmark.executer_demarrage(["grille"], 2)
+        self.assertEqual(list(demarrage), ["import/grille"])
+        self.assertTrue(demarrage["import/grille"]["mediane_ms"] > 0)
+
+    def test_menu_sans_ecrans(self):
+        """ Méthode permettant de tester que le menu, chargé au lancement du jeu, n'importe ni les autres écrans ni fpdf """
+        code = "import sys, menu; sys.exit(any(module in sys.modules for module in ('fpdf', 'pdf', 'jeu', 'editeur', 'solveur', 'sauvegarde')))"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code], capture_output=True).returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
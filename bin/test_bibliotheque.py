@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module bibliotheque
+
+    Ce module est composé d'une unique classe BibliothequeTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Bibliotheque.
+
+    Module utilisé:
+        - os, shutil, pickle: utilisés pour créer et supprimer les fichiers des tests
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour créer les grilles à enregistrer
+        - bibliotheque: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import shutil
+import pickle
+import unittest
+import grille
+import bibliotheque
+from constantes import *
+
+
+class BibliothequeTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Bibliotheque"""
+
+    def setUp(self, chemin="TU_bibliotheque/bibliotheque.db"):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une bibliothèque vide est créée dans un dossier de test.
+        """
+        self.dossier = os.path.dirname(chemin)
+        self.bibliotheque = bibliotheque.Bibliotheque(chemin)
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test. La bibliothèque et le dossier de test sont supprimés. """
+        self.bibliotheque.fermer()
+        shutil.rmtree(self.dossier)
+
+    def generer(self, difficulte="facile"):
+        """ Retourne une grille générée de la difficulté passée en paramètre """
+        nouvelle = grille.Grille()
+        nouvelle.generer_grille(difficulte)
+        return nouvelle
+
+    def test_enregistrer_charger(self):
+        """ Méthode permettant de tester le comportement de enregistrer et charger.
+            Une grille enregistrée doit être chargée à l'identique, avec sa difficulté et son nom en minuscules.
+            Une grille absente ne doit pas être chargée.
+        """
+        sauvee = self.generer("moyen")
+        self.bibliotheque.enregistrer("Ma Grille", sauvee)
+
+        chargee = grille.Grille()
+        self.assertTrue(self.bibliotheque.charger("ma grille", chargee))
+        self.assertEqual(chargee._grid, sauvee._grid)
+        self.assertEqual(chargee.difficulte, "moyen")
+        self.assertEqual(chargee.nom, "ma grille")
+
+        self.assertFalse(self.bibliotheque.charger("absente", chargee))
+
+    def test_lister(self):
+        """ Méthode permettant de tester le comportement de lister et compter.
+            Les grilles doivent être listées page par page, de la plus récente à la plus ancienne, et filtrées par difficulté et par résolution.
+        """
+        for indice in range(7):
+            self.bibliotheque.enregistrer("grille" + str(indice), self.generer("facile" if indice % 2 == 0 else "moyen"))
+
+        self.assertEqual(self.bibliotheque.compter(), 7)
+        self.assertEqual(self.bibliotheque.compter(difficulte="facile"), 4)
+
+        pages = [self.bibliotheque.lister(page, 3) for page in range(3)]
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([meta["nom"] for page in pages for meta in page], ["grille" + str(indice) for indice in range(6, -1, -1)])
+        self.assertEqual(set(pages[0][0].keys()), set(COLONNES_BIBLIOTHEQUE))
+
+        self.assertEqual([meta["nom"] for meta in self.bibliotheque.lister(difficulte="moyen")], ["grille5", "grille3", "grille1"])
+        self.assertEqual(self.bibliotheque.lister(resolue=True), [])
+
+        # Une grille enregistrée de nouveau garde sa date de création, et donc sa place dans la liste
+        self.bibliotheque.enregistrer("grille0", self.generer("facile"))
+        self.assertEqual(self.bibliotheque.lister(2, 3)[0]["nom"], "grille0")
+
+    def test_noter_resolution(self):
+        """ Méthode permettant de tester le comportement de noter_resolution.
+            La grille doit être marquée comme résolue, son nombre de résolutions incrémenté et son meilleur temps conservé.
+        """
+        self.bibliotheque.enregistrer("grille", self.generer())
+        self.bibliotheque.noter_resolution("grille", 120)
+        self.bibliotheque.noter_resolution("grille", 90)
+        self.bibliotheque.noter_resolution("grille", 150)
+
+        meta = self.bibliotheque.lister(resolue=True)[0]
+        self.assertEqual((meta["resolutions"], meta["meilleur_temps"]), (3, 90))
+
+    def test_importer(self):
+        """ Méthode permettant de tester le comportement de importer.
+            Une sauvegarde au format actuel et une ancienne sauvegarde pickle doivent être importées, un fichier illisible ignoré.
+            Un second import ne doit rien ajouter.
+        """
+        actuelle, ancienne = self.generer(), self.generer()
+        ancienne.solve()
+        actuelle.sauvegarde(os.path.join(self.dossier, "actuelle" + EXTENSION_FICHIER_SAUVEGARDE))
+        with open(os.path.join(self.dossier, "ancienne" + EXTENSION_FICHIER_SAUVEGARDE), "wb") as fichier:
+            pickle.Pickler(fichier).dump(ancienne._grid)
+        with open(os.path.join(self.dossier, "illisible" + EXTENSION_FICHIER_SAUVEGARDE), "wb") as fichier:
+            fichier.write(b"rawr")
+
+        self.assertEqual(self.bibliotheque.importer(self.dossier), 2)
+        self.assertEqual(self.bibliotheque.importer(self.dossier), 0)
+        self.assertEqual([meta["nom"] for meta in self.bibliotheque.lister(resolue=True)], ["ancienne"])
+
+        chargee = grille.Grille()
+        self.assertTrue(self.bibliotheque.charger("actuelle", chargee))
+        self.assertEqual(chargee._grid, actuelle._grid)
+
+
+if __name__ == "__main__":
+    unittest.main()
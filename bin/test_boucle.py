@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module boucle
+
+    Ce module est composé d'une unique classe BoucleTest, dont les méthodes effectuent les tests unitaires des fonctions du module boucle.
+
+    Module utilisé:
+        - time: utilisé pour mesurer la durée d'attente
+        - unittest: utilisé pour effectuer les tests unitaires
+        - pygame: utilisé pour créer des événements
+        - boucle: utilisé pour tester ses fonctions
+        - constantes: utilisé dans chaque méthode
+"""
+
+import time
+import unittest
+import pygame
+from pygame.locals import *
+import boucle
+from constantes import *
+
+
+class BoucleTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module boucle"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            La file d'événements est vidée.
+        """
+        pygame.display.set_mode(TAILLE_FENETRE_TEST)
+        pygame.event.clear()
+
+    def test_evenements(self):
+        """ Méthode permettant de tester le comportement de evenements.
+            Les événements en file doivent tous être retournés, dans leur ordre d'arrivée.
+        """
+        pygame.event.post(pygame.event.Event(MOUSEBUTTONUP, pos=(0, 0), button=1))
+        pygame.event.post(pygame.event.Event(KEYDOWN, key=K_RETURN, unicode="\r"))
+
+        types = [event.type for event in boucle.evenements() if event.type in (MOUSEBUTTONUP, KEYDOWN)]
+        self.assertEqual(types, [MOUSEBUTTONUP, KEYDOWN])
+
+    def test_attente(self, delai=100):
+        """ Méthode permettant de tester l'attente de evenements.
+            Sans événement, la fonction doit attendre le délai passé en paramètre puis retourner une liste vide.
+        """
+        debut = time.time()
+        self.assertEqual(boucle.evenements(delai), [])
+        self.assertTrue(time.time() - debut >= delai / 2000)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
+    pygame.quit()
@@ -8,15 +8,14 @@
 
     Les modules suivants sont utilisés dans ce module:
         - unittest: utilisé pour réaliser les tests unitaires de chaque méthode.
-        - pygame: utilisé pour les tests graphiques.
+        - subprocess, sys: utilisés pour vérifier que le modèle se charge sans pygame.
         - cases: utilisé pour tester les méthodes de ces différentes classes.
         - constantes: utilisé pour avoir acces aux constantes des tests unitaires
 """
 
 import unittest
-import pygame
-import pygame.freetype
-from pygame.locals import *
+import subprocess
+import sys
 import cases
 from constantes import *
 
@@ -35,28 +34,40 @@ class CaseTest(unittest.TestCase):
         self.indicatrice = cases.Indicatrice()
         self.case_noire = cases.CaseNoire()
 
-    def test_clicked(self):
-        """ Méthode permettant de tester le comportement de la méthode clicked.
-            Cette méthode initialise l'attribut rect de chacun des attributs.
-            Deux autres rect sont créés.
-            Pour chaque attribut le même test est effectué.
-            Un étant inclus dans ce Rect, la méthode clicked doit retourner True.
-            Une n'étant pas inclus dans ce Rect, la méthode clicked doit retourner False.
+    def test_etat(self):
+        """ Méthode permettant de tester le comportement de la méthode etat.
+            L'état d'une case doit changer avec sa valeur saisie ou ses erreurs, et celui d'une case noire être toujours vide.
         """
+        etat = self.case_vide.etat()
+        self.case_vide.valeur_saisie = 4
+        self.assertNotEqual(self.case_vide.etat(), etat)
 
-        self.case_vide.rect = pygame.Rect(10, 10, 10, 10)
-        self.indicatrice.rect = pygame.Rect(10, 10, 10, 10)
-        self.case_noire.rect = pygame.Rect(10, 10, 10, 10)
+        etat = self.indicatrice.etat()
+        self.indicatrice.erreur_bas = True
+        self.assertNotEqual(self.indicatrice.etat(), etat)
 
-        rect_in = (10, 10, 5, 5)
-        rect_out = (20, 20, 5, 5)
+        self.assertEqual(self.case_noire.etat(), ())
 
-        self.assertTrue(self.case_vide.clicked(rect_in))
-        self.assertFalse(self.case_vide.clicked(rect_out))
-        self.assertTrue(self.indicatrice.clicked(rect_in))
-        self.assertFalse(self.indicatrice.clicked(rect_out))
-        self.assertTrue(self.case_noire.clicked(rect_in))
-        self.assertFalse(self.case_noire.clicked(rect_out))
+    def test_copie(self):
+        """ Méthode permettant de tester la copie des cases vides et des indicatrices.
+            La copie doit être égale à l'originale, sans partager ses domaines.
+        """
+        self.case_vide.valeur_saisie = 3
+        copie = cases.CaseVide(self.case_vide)
+        self.assertEqual(copie, self.case_vide)
+        copie.domaine.discard(1)
+        self.assertNotEqual(copie, self.case_vide)
+
+        self.indicatrice.valeur_droite, self.indicatrice.domaine_droite = 3, [[1, 2]]
+        copie = cases.Indicatrice(self.indicatrice)
+        self.assertEqual(copie, self.indicatrice)
+        copie.domaine_droite[0].append(3)
+        self.assertEqual(self.indicatrice.domaine_droite, [[1, 2]])
+
+    def test_sans_pygame(self):
+        """ Méthode permettant de tester que le modèle des grilles, et les modules de calcul qui l'utilisent, se chargent sans importer pygame """
+        code = "import sys, cases, grille, resolveur, texte, serialisation, corpus; sys.exit('pygame' in sys.modules)"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code]).returncode, 0)
 
 
 class IndicatriceTest(unittest.TestCase):
@@ -68,35 +79,10 @@ class IndicatriceTest(unittest.TestCase):
         """
         self.indicatrice = cases.Indicatrice()
 
-    def test_get_rect_valeur(self):
-        """ Méthode permettant de tester le comportement de get_rect_valeur().
-            Cette méthode initialise le rect et lance get_rect_valeur avec en paramètre un décalage.
-            Elle verifie ensuite que le rect renvoyé par la méthode est cohérent.
-        """
-        self.indicatrice.rect = pygame.Rect(10, 10, 10, 10)
-        rect = self.indicatrice.get_rect_valeur((5, 5))
-        self.assertTrue(rect.top == 15 and rect.left == 15)
-        self.assertEqual((rect.width, rect.height), DIMENSION_SAISIE_INDICATRICE)
-
-    def test_clicked_saisie(self):
-        """ Méthode permettant de tester le comportement des méthodes clicked_droite et clicked_bas.
-            Cette méthode initialise les différents rect de la case indicatrice.
-            Elle créé deux rect devant se trouver respectivement et uniquement dans le rect_droite et le rect_bas.
-            Elle verifie que le rect_right se trouve bien dans le rect_droite de l'indicatrice, et uniquement dans ce rect.
-            Elle verifie que le rect_bottom se trouve bien dans le rect_bas de l'indicatrice, et uniquement dans ce rect.
-        """
-        self.indicatrice.rect = pygame.Rect(10, 10, 10, 10)
-
-        rect_right = (13, 10, 0, 0)
-        rect_bottom = (10, 13, 0, 0)
-
-        self.indicatrice.rect_bas = self.indicatrice.get_rect_valeur((0, 2))
-        self.indicatrice.rect_droite = self.indicatrice.get_rect_valeur((2, 0))
-
-        self.assertTrue(self.indicatrice.clicked_droite(rect_right))
-        self.assertFalse(self.indicatrice.clicked_droite(rect_bottom))
-        self.assertTrue(self.indicatrice.clicked_bas(rect_bottom))
-        self.assertFalse(self.indicatrice.clicked_bas(rect_right))
+    def test_str(self):
+        """ Méthode permettant de tester la conversion en chaine d'une indicatrice, sous la forme bas\\droite """
+        self.indicatrice.valeur_bas, self.indicatrice.valeur_droite = 12, 7
+        self.assertEqual(str(self.indicatrice), "12\\7")
 
 
 if __name__ == "__main__":
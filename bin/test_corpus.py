@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module corpus
+
+    Ce module est composé d'une unique classe CorpusTest, dont les méthodes effectuent les tests unitaires des méthodes des classes Corpus et VueCorpus.
+
+    Module utilisé:
+        - os: utilisé pour supprimer les fichiers générés par les tests
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille, cases: utilisés pour créer les grilles du corpus
+        - corpus: utilisé pour tester ses méthodes
+        - exceptions: utilisé pour tester la lecture d'un fichier illisible
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import unittest
+import grille
+import cases
+import corpus
+from exceptions import *
+from constantes import *
+
+CHEMIN_CORPUS_TEST = "TU_corpus.kkrc"
+
+
+class CorpusTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes des classes Corpus et VueCorpus"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille de chaque difficulté est générée, puis le corpus de test est créé avec ces grilles.
+            Certaines cases vides de la première grille sont remplies par le joueur.
+        """
+        self.grilles = []
+        for diff in ("facile", "moyen", "difficile"):
+            self.grilles.append(grille.Grille())
+            self.grilles[-1].generer_grille(diff)
+
+        compteur = 0
+        for (i, j) in self.grilles[0].keys():
+            if type(self.grilles[0][i, j]) is cases.CaseVide and compteur % 2 == 0:
+                self.grilles[0][i, j].valeur_saisie = compteur % 9 + 1
+            compteur += 1
+
+        if os.path.exists(CHEMIN_CORPUS_TEST):
+            os.remove(CHEMIN_CORPUS_TEST)
+        corpus.Corpus.ajouter(CHEMIN_CORPUS_TEST, self.grilles)
+        self.numpy = corpus.numpy
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le corpus de test """
+        corpus.numpy = self.numpy
+        os.remove(CHEMIN_CORPUS_TEST)
+
+    def corrompre(self, indice):
+        """ Remplace la solution d'une case vide de la grille d'indice passé en paramètre par celle de sa voisine de droite,
+            de façon à créer un doublon dans sa plage horizontale.
+        """
+        for (i, j), case in self.grilles[indice].items():
+            if type(case) is cases.CaseVide and type(self.grilles[indice]._grid.get((i + 1, j))) is cases.CaseVide:
+                case._solution_case = self.grilles[indice][i + 1, j]._solution_case
+                break
+
+        os.remove(CHEMIN_CORPUS_TEST)
+        corpus.Corpus.ajouter(CHEMIN_CORPUS_TEST, self.grilles)
+
+    def test_lecture(self):
+        """ Méthode permettant de tester le comportement de ajouter, __len__, __getitem__ et VueCorpus.grille.
+            Chaque grille lue doit être identique à la grille enregistrée, solutions et valeurs saisies comprises.
+            Les grilles ajoutées à un corpus existant doivent être placées à la fin.
+        """
+        self.assertEqual(corpus.Corpus.ajouter(CHEMIN_CORPUS_TEST, self.grilles[:1]), 1)
+
+        corpus_test = corpus.Corpus(CHEMIN_CORPUS_TEST)
+        self.assertEqual(len(corpus_test), len(self.grilles) + 1)
+        for indice, attendu in enumerate(self.grilles + self.grilles[:1]):
+            lue = corpus_test[indice].grille()
+            self.assertEqual(lue._grid, attendu._grid)
+            for (i, j), case in attendu.items():
+                if type(case) is cases.CaseVide:
+                    self.assertEqual(lue[i, j]._solution_case, case._solution_case)
+                    self.assertEqual(lue[i, j].valeur_saisie, case.valeur_saisie)
+
+        self.assertEqual(corpus_test[-1].grille()._grid, self.grilles[0]._grid)
+        self.assertRaises(IndexError, corpus_test.__getitem__, len(self.grilles) + 1)
+        self.assertEqual(len(list(corpus_test)), len(self.grilles) + 1)
+        corpus_test.fermer()
+
+    def test_format(self):
+        """ Méthode permettant de tester la lecture d'un fichier qui n'est pas un corpus, et l'ajout de grilles de dimensions différentes """
+        with open(CHEMIN_CORPUS_TEST, "wb") as fichier:
+            fichier.write(b"pas un corpus")
+        self.assertRaises(FormatSauvegardeException, corpus.Corpus, CHEMIN_CORPUS_TEST)
+
+        os.remove(CHEMIN_CORPUS_TEST)
+        corpus.Corpus.ajouter(CHEMIN_CORPUS_TEST, self.grilles)
+        self.assertRaises(FormatSauvegardeException, corpus.Corpus.ajouter, CHEMIN_CORPUS_TEST, self.grilles, NB_COLONNE_GRILLE + 1)
+
+    def test_valider(self):
+        """ Méthode permettant de tester le comportement de VueCorpus.valider.
+            Les grilles générées doivent être valides. Une grille contenant un doublon ne doit pas l'être.
+        """
+        self.corrompre(1)
+        corpus_test = corpus.Corpus(CHEMIN_CORPUS_TEST)
+        self.assertEqual([vue.valider() for vue in corpus_test], [True, False, True])
+        corpus_test.fermer()
+
+    def test_valider_lot(self):
+        """ Méthode permettant de tester le comportement de valider_lot, avec et sans numpy.
+            Les résultats doivent être identiques à ceux de VueCorpus.valider.
+        """
+        self.corrompre(2)
+        corpus_test = corpus.Corpus(CHEMIN_CORPUS_TEST)
+
+        corpus.numpy = None
+        self.assertEqual(corpus_test.valider_lot(), [True, True, False])
+        self.assertEqual(corpus_test.valider_lot(1), [True, False])
+
+        corpus.numpy = self.numpy
+        if corpus.numpy is not None:
+            self.assertEqual(corpus_test.valider_lot(), [True, True, False])
+            self.assertEqual(corpus_test.valider_lot(0, 2), [True, True])
+        corpus_test.fermer()
+
+    @unittest.skipIf(corpus.numpy is None, "numpy n'est pas installé")
+    def test_tableau(self):
+        """ Méthode permettant de tester le comportement de tableau.
+            Le tableau doit contenir, pour chaque case, le type et les valeurs lus par VueCorpus.case.
+        """
+        corpus_test = corpus.Corpus(CHEMIN_CORPUS_TEST)
+        tableau = corpus_test.tableau(1)
+        self.assertEqual(tableau.shape, (len(self.grilles) - 1, NB_LIGNE_GRILLE, NB_COLONNE_GRILLE, 2))
+
+        vue = corpus_test[1]
+        for (i, j) in self.grilles[1].keys():
+            self.assertEqual(vue.case(i, j), (tableau[0, j, i, 0] >> 6, tableau[0, j, i, 0] & 0x3F, tableau[0, j, i, 1]))
+        del tableau, vue
+        corpus_test.fermer()
+
+
+if __name__ == "__main__":
+    unittest.main()
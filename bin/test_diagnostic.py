@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module diagnostic
+
+    Ce module est composé d'une unique classe DiagnosticTest, dont les méthodes effectuent les tests unitaires du journal et du profilage.
+
+    Module utilisé:
+        - os, shutil, pstats: utilisés pour relire et supprimer les profils écrits par les tests
+        - logging: utilisé pour vérifier les niveaux du journal
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille, resolveur: utilisés pour exécuter les phases profilées
+        - diagnostic: utilisé pour tester ses fonctions
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import shutil
+import pstats
+import logging
+import unittest
+import grille
+import resolveur
+import diagnostic
+from constantes import *
+
+CHEMIN_DOSSIER_PROFILS_TEST = "TU_profils"
+
+
+class DiagnosticTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement du journal et du profilage"""
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, désactivant le profilage et supprimant les profils de test """
+        diagnostic.desactiver_profilage()
+        shutil.rmtree(CHEMIN_DOSSIER_PROFILS_TEST, ignore_errors=True)
+
+    def test_profiler_inactif(self):
+        """ Méthode permettant de tester qu'une fonction décorée, sans profilage, retourne son résultat et n'écrit aucun profil """
+        fonction = diagnostic.profiler(PHASE_RENDU)(lambda a, b=1: a + b)
+        self.assertFalse(diagnostic.profilage_actif())
+        self.assertEqual(fonction(1, b=2), 3)
+        self.assertEqual(diagnostic.desactiver_profilage(), [])
+        self.assertFalse(os.path.exists(CHEMIN_DOSSIER_PROFILS_TEST))
+
+    def test_profilage(self):
+        """ Méthode permettant de tester le profilage de la génération et de la résolution d'une grille.
+            Chaque phase doit produire un profil lisible par pstats, contenant sa fonction, et un fichier de piles agrégées.
+        """
+        diagnostic.activer_profilage(CHEMIN_DOSSIER_PROFILS_TEST, 0.0005)
+        self.assertTrue(diagnostic.profilage_actif())
+        grille_profilee = grille.Grille()
+        grille_profilee.generer_grille("facile")
+        resolveur.Resolveur(grille_profilee).calculate_solution("FAST")
+        chemins = diagnostic.desactiver_profilage()
+        self.assertFalse(diagnostic.profilage_actif())
+
+        for phase, fonction in ((PHASE_GENERATION, "generer_grille"), (PHASE_RESOLUTION, "calculate_solution")):
+            chemin = os.path.join(CHEMIN_DOSSIER_PROFILS_TEST, phase + EXTENSION_PROFIL)
+            self.assertIn(chemin, chemins)
+            self.assertIn(fonction, [nom for fichier, ligne, nom in pstats.Stats(chemin).stats])
+
+            with open(os.path.join(CHEMIN_DOSSIER_PROFILS_TEST, phase + EXTENSION_PILES_PROFIL), encoding="utf-8") as fichier:
+                for ligne in fichier:
+                    pile, nombre = ligne.rsplit(" ", 1)
+                    self.assertTrue(int(nombre) > 0 and ";" in pile)
+
+    def test_phases_imbriquees(self):
+        """ Méthode permettant de tester qu'une phase commencée pendant une autre est comptée dans son propre profil """
+        interne = diagnostic.profiler(PHASE_RENDU)(lambda: sum(range(10)))
+        externe = diagnostic.profiler(PHASE_GENERATION)(lambda: interne() + interne())
+
+        diagnostic.activer_profilage(CHEMIN_DOSSIER_PROFILS_TEST)
+        self.assertEqual(externe(), 90)
+        diagnostic.desactiver_profilage()
+
+        appels = {phase: pstats.Stats(os.path.join(CHEMIN_DOSSIER_PROFILS_TEST, phase + EXTENSION_PROFIL)).stats for phase in (PHASE_GENERATION, PHASE_RENDU)}
+        self.assertTrue(any("sum" in nom for fichier, ligne, nom in appels[PHASE_RENDU]))
+        self.assertFalse(any("sum" in nom for fichier, ligne, nom in appels[PHASE_GENERATION]))
+
+    def test_journal(self):
+        """ Méthode permettant de tester le journal de la résolution: les domaines sont journalisés au niveau DEBUG, et rien au niveau par défaut """
+        grille_journalisee = grille.Grille()
+        grille_journalisee.generer_grille("facile")
+
+        with self.assertNoLogs(diagnostic.journal, logging.INFO):
+            resolveur.Resolveur(grille.Grille(grid=grille_journalisee._grid)).distribuer_domaine()
+        with self.assertLogs(diagnostic.journal, logging.DEBUG) as journal:
+            resolveur.Resolveur(grille.Grille(grid=grille_journalisee._grid)).distribuer_domaine()
+        self.assertTrue(all("Domaine de l'indicatrice" in message for message in journal.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
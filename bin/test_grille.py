@@ -10,22 +10,19 @@
         - os: utilisé pour supprimer les fichiers générés par les tests unitaires des méthodes de sauvegarde/chargement.
         - random: utilisé pour les tests unitaires des méthodes de solveur
         - unittest: utilisé pour effectuer les tests unitaires
-        - pygame: utilisé pour les tests unitaires incluant des méthodes graphiques
         - grille: utilisé pour tester ses méthodes
         - exceptions: utilisé pour les méthodes de validation
         - constantes: utilisé dans chaque méthode
         - cases: utilisé pour tester les types de la grille
+        - modeles: utilisé pour tirer une structure de grille
 """
 import os
 import unittest
 import random
 
-import pygame
-import pygame.freetype
-from pygame.locals import *
-
 import grille
 import cases
+import modeles
 import exceptions
 from constantes import *
 
@@ -193,6 +190,25 @@ class GrilleTest(unittest.TestCase):
             j = 0
             i += 1
 
+    def test__placer_valeurs_modele(self, diff="facile"):
+        """ Méthode permettant de tester le comportement de placer_valeurs() sur une structure tirée de la bibliothèque de modèles.
+            Aucune case blanche ne doit devenir une indicatrice: les cases créées doivent toutes être des cases vides.
+            Leurs valeurs doivent être comprises entre 1 et 9 et n'apparaitre qu'une fois dans chaque plage.
+        """
+        structure = modeles.Modeles.partagee().tirer(diff)
+        self.assertIsNotNone(structure)
+        self.grille._appliquer_structure(structure)
+        cases_pleines = set(self.grille.keys())
+        self.grille._placer_valeurs()
+
+        for (i, j) in self.grille.keys():
+            if (i, j) not in cases_pleines:
+                self.assertEqual(type(self.grille[i, j]), cases.CaseVide)
+                valeur = self.grille[i, j]._solution_case
+                self.assertTrue(VALEUR_MIN <= valeur <= VALEUR_MAX)
+                self.assertFalse(valeur in self.grille.cases_to_solution(self.grille.ligne(i, j)))
+                self.assertFalse(valeur in self.grille.cases_to_solution(self.grille.colonne(i, j)))
+
     def test_choix_valeur(self):
         """ Méthode permettant de tester le comportement de choix_valeur().
             Ce test prend place suite à l'utilisation de _placer_valeur.
@@ -251,28 +267,6 @@ class GrilleTest(unittest.TestCase):
 
 ########################################################## Tests des méthodes de jeu d'une grille #######################################################################
 
-    def test_afficher_grille(self, diff="moyen"):
-        """ Méthode permettant de tester le comportement de afficher_grille.
-            Cette méthode verifie que les rect de chaque grille sont bien initialisé, et ont des valeurs cohérentes.
-        """
-
-        pygame.init()
-        pygame.freetype.init()
-        fenetre = pygame.display.set_mode(TAILLE_FENETRE_TEST)
-        self.grille.generer_grille(diff)
-        self.grille.afficher_grille(fenetre)
-        pygame.quit()
-
-        for (i, j) in self.grille.keys():
-            self.assertEqual(type(self.grille[i, j].rect), pygame.Rect)
-            self.assertTrue(self.grille[i, j].rect.top != 0)
-            self.assertTrue(self.grille[i, j].rect.left != 0)
-            self.assertTrue(self.grille[i, j].rect.width != 0)
-            self.assertTrue(self.grille[i, j].rect.height != 0)
-            if type(self.grille[i, j]) == cases.Indicatrice:
-                self.assertEqual(type(self.grille[i, j].rect_bas), pygame.Rect)
-                self.assertEqual(type(self.grille[i, j].rect_droite), pygame.Rect)
-
     def test_validate(self, diff="moyen"):
         """ Méthode permettant de tester le comportement de validate.
             Cette méthode verifie qu'une grille sans erreur ne lève aucune exception.
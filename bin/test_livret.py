@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module livret
+
+    Ce module est composé d'une unique classe LivretTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Livret.
+
+    Module utilisé:
+        - os: utilisé pour supprimer les fichiers générés par les tests
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour créer les grilles du livret
+        - livret: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import unittest
+import grille
+import livret
+from constantes import *
+
+CHEMIN_LIVRET_TEST = "TU_livret.pdf"
+
+
+class LivretTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Livret"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille de chaque difficulté est générée.
+        """
+        self.grilles = []
+        for diff in ("facile", "moyen", "difficile"):
+            self.grilles.append(grille.Grille())
+            self.grilles[-1].generer_grille(diff)
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le livret et les volumes de test """
+        for fichier in os.listdir("."):
+            if fichier.startswith("TU_livret") and fichier.endswith(EXTENSION_FICHIER_IMPRESSION):
+                os.remove(fichier)
+
+    def test_generer(self):
+        """ Méthode permettant de tester le comportement de generer.
+            Les grilles, fournies par un générateur, doivent occuper autant de pages que nécessaire, suivies des pages de solutions.
+            Aucune image ne doit être utilisée.
+        """
+        nombre = COLONNES_LIVRET * LIGNES_LIVRET + 1
+        livret_test = livret.Livret()
+        self.assertEqual(livret_test.generer((self.grilles[k % 3] for k in range(nombre)), CHEMIN_LIVRET_TEST), nombre)
+
+        self.assertEqual(livret_test.page_no(), 4)
+        self.assertEqual(livret_test.images, {})
+        with open(CHEMIN_LIVRET_TEST, "rb") as fichier:
+            self.assertTrue(fichier.read().startswith(b"%PDF"))
+
+    def test_sans_solution(self):
+        """ Méthode permettant de tester le comportement de generer sans pages de solutions, avec une disposition différente """
+        livret_test = livret.Livret(False, 1, 1)
+        self.assertEqual(livret_test.generer(self.grilles, CHEMIN_LIVRET_TEST), len(self.grilles))
+        self.assertEqual(livret_test.page_no(), len(self.grilles))
+
+    def test_generer_volumes(self):
+        """ Méthode permettant de tester le comportement de generer_volumes, dans le processus courant puis dans un groupe de processus.
+            Les volumes doivent être retournés dans l'ordre, et la progression doit compter toutes les grilles.
+        """
+        for processus in (1, 2):
+            progression = []
+            chemins = livret.Livret.generer_volumes((self.grilles[k % 3] for k in range(7)), CHEMIN_LIVRET_TEST,
+                                                    processus=processus, progression=progression.append, taille_volume=3)
+
+            self.assertEqual(chemins, [FORMAT_VOLUME_LIVRET.format("TU_livret", numero) for numero in (1, 2, 3)])
+            self.assertEqual(sorted(progression), progression)
+            self.assertEqual(progression[-1], 7)
+            for chemin in chemins:
+                with open(chemin, "rb") as fichier:
+                    self.assertTrue(fichier.read().startswith(b"%PDF"))
+                os.remove(chemin)
+
+    def test_volumes_unitaires(self):
+        """ Méthode permettant de tester la numérotation des volumes d'une grille chacun: le premier volume doit porter le numéro 1 """
+        chemins = livret.Livret.generer_volumes(self.grilles, CHEMIN_LIVRET_TEST, taille_volume=1)
+        self.assertEqual(chemins, [FORMAT_VOLUME_LIVRET.format("TU_livret", numero) for numero in (1, 2, 3)])
+
+    def test_emplacement(self):
+        """ Méthode permettant de tester le comportement de emplacement.
+            Les emplacements d'une page doivent être disjoints, et contenus dans la page sous le titre.
+        """
+        livret_test = livret.Livret()
+        emplacements = [livret_test.emplacement(indice) for indice in range(COLONNES_LIVRET * LIGNES_LIVRET)]
+
+        for (x, y, largeur, hauteur) in emplacements:
+            self.assertTrue(x >= MARGE_LIVRET and x + largeur <= livret_test.w - MARGE_LIVRET + 1e-6)
+            self.assertTrue(y >= MARGE_LIVRET + HAUTEUR_TITRE_LIVRET and y + hauteur <= livret_test.h - MARGE_LIVRET + 1e-6)
+
+        for k, (x, y, largeur, hauteur) in enumerate(emplacements):
+            for (autre_x, autre_y, autre_largeur, autre_hauteur) in emplacements[k + 1:]:
+                self.assertTrue(x + largeur <= autre_x or autre_x + autre_largeur <= x or y + hauteur <= autre_y or autre_y + autre_hauteur <= y)
+
+
+if __name__ == "__main__":
+    unittest.main()
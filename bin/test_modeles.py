@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module modeles
+
+    Ce module est composé d'une unique classe ModelesTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Modeles.
+
+    Module utilisé:
+        - os, tempfile: utilisés pour tester l'enregistrement de la bibliothèque
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour tester l'application d'un modèle à une grille
+        - cases: utilisé pour tester les types de la grille
+        - modeles: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import tempfile
+import unittest
+import grille
+import cases
+import modeles
+from constantes import *
+
+
+class ModelesTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Modeles"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une bibliothèque vide, associée à un fichier temporaire, est créée.
+        """
+        self.chemin = os.path.join(tempfile.mkdtemp(), "structures.txt")
+        self.modeles = modeles.Modeles(self.chemin)
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le fichier temporaire de la bibliothèque. """
+        if os.path.isfile(self.chemin):
+            os.remove(self.chemin)
+        os.rmdir(os.path.dirname(self.chemin))
+
+    def test_construire(self, diff="moyen"):
+        """ Méthode permettant de tester le comportement de construire.
+            Chaque modèle construit doit être valide et avoir au moins le nombre minimal de cases blanches de sa difficulté.
+        """
+        self.modeles.construire(diff, 5)
+        self.assertEqual(len(self.modeles), 5)
+        for structure in self.modeles._modeles[diff]:
+            self.assertTrue(self.modeles.valider(structure, modeles.Modeles.nb_cases_vides_min(diff)))
+
+    def test_transformer(self, diff="difficile"):
+        """ Méthode permettant de tester le comportement de transformer.
+            Chaque transformation d'un modèle valide doit rester valide, conserver le nombre de cases blanches,
+            et redonner le modèle initial lorsqu'elle est appliquée deux fois.
+        """
+        self.modeles.construire(diff, 3)
+        for structure in self.modeles._modeles[diff]:
+            for transformation in self.modeles.transformations():
+                transformee = self.modeles.transformer(structure, transformation)
+                self.assertTrue(self.modeles.valider(transformee))
+                self.assertEqual(transformee.count(CASE_MODELE_BLANCHE), structure.count(CASE_MODELE_BLANCHE))
+                self.assertEqual(self.modeles.transformer(transformee, transformation), structure)
+                self.assertEqual(self.modeles.forme_canonique(transformee), self.modeles.forme_canonique(structure))
+
+    def test_valider(self):
+        """ Méthode permettant de tester le comportement de valider.
+            Un modèle dont la première ligne est blanche, ou qui contient une case blanche isolée, ne doit pas être valide.
+        """
+        pleine = CASE_MODELE_PLEINE * NB_COLONNE_GRILLE
+        blanche = CASE_MODELE_PLEINE + CASE_MODELE_BLANCHE * (NB_COLONNE_GRILLE - 1)
+        isolee = CASE_MODELE_PLEINE + CASE_MODELE_BLANCHE + CASE_MODELE_PLEINE * (NB_COLONNE_GRILLE - 2)
+
+        self.assertTrue(self.modeles.valider(pleine + blanche * (NB_LIGNE_GRILLE - 1)))
+        self.assertFalse(self.modeles.valider(blanche * NB_LIGNE_GRILLE))
+        self.assertFalse(self.modeles.valider(pleine + blanche * (NB_LIGNE_GRILLE - 3) + pleine + isolee))
+        self.assertFalse(self.modeles.valider(pleine))
+
+    def test_sauvegarder_tirer(self, diff="facile"):
+        """ Méthode permettant de tester l'enregistrement et le tirage des modèles.
+            Une bibliothèque vide ne doit retourner aucun modèle.
+            Une fois enregistrée puis relue, la bibliothèque doit retourner un modèle valide.
+        """
+        self.assertIsNone(self.modeles.tirer(diff))
+
+        self.modeles.construire(diff, 2)
+        self.modeles.sauvegarder()
+
+        relue = modeles.Modeles(self.chemin)
+        structure = relue.tirer(diff)
+        self.assertTrue(relue.valider(structure, modeles.Modeles.nb_cases_vides_min(diff)))
+
+    def test_appliquer_structure(self, diff="mdft"):
+        """ Méthode permettant de tester l'application d'un modèle à une grille.
+            Les cases pleines du modèle doivent devenir des indicatrices ou des cases noires, et aucune indicatrice ne doit être bloquée.
+        """
+        self.modeles.construire(diff, 1)
+        structure = self.modeles.tirer(diff)
+        self.grille = grille.Grille()
+        self.grille._appliquer_structure(structure)
+
+        for (i, j) in self.grille.keys():
+            self.assertEqual(structure[j * NB_COLONNE_GRILLE + i], CASE_MODELE_PLEINE)
+            self.assertTrue(type(self.grille[i, j]) in (cases.Indicatrice, cases.CaseNoire))
+            self.assertFalse(self.grille.blocked(i, j))
+        self.assertEqual(len(self.grille.keys()), structure.count(CASE_MODELE_PLEINE))
+
+
+if __name__ == "__main__":
+    unittest.main()
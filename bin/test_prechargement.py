@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module prechargement
+
+    Ce module est composé d'une unique classe PrechargementTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Prechargement.
+
+    Module utilisé:
+        - time: utilisé pour laisser le thread de préchargement travailler
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour générer les grilles à vérifier
+        - cases: utilisé pour rendre une grille injouable
+        - prechargement: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import time
+import unittest
+import grille
+import cases
+import prechargement
+from constantes import *
+
+
+class PrechargementTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Prechargement"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Un préchargement sans réserve de grilles est créé.
+        """
+        self.prechargement = prechargement.Prechargement()
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, arrêtant le thread de préchargement. """
+        self.prechargement.arreter()
+
+    def test_verifier(self, diff="moyen"):
+        """ Méthode permettant de tester le comportement de verifier.
+            Une grille générée doit être vérifiée, sans que ses valeurs saisies ne soient modifiées.
+            Une fois qu'une somme d'indicatrice est faussée, la grille ne doit plus être vérifiée.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille(diff)
+        self.assertTrue(prechargement.Prechargement.verifier(self.grille))
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.CaseVide:
+                self.assertEqual(self.grille[i, j].valeur_saisie, -1)
+
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.Indicatrice and self.grille[i, j].valeur_droite:
+                self.grille[i, j].valeur_droite += 1
+                break
+        self.assertFalse(prechargement.Prechargement.verifier(self.grille))
+
+    def test_prendre(self):
+        """ Méthode permettant de tester le comportement de prendre.
+            Tant que le préchargement est suspendu, aucune grille ne doit être prête.
+            Une fois activé, une grille doit être préparée pour chaque difficulté, puis être retirée lorsqu'elle est prise.
+        """
+        self.prechargement.demarrer()
+        time.sleep(DELAI_ATTENTE_PRECHARGEMENT)
+        self.assertIsNone(self.prechargement.prendre("facile"))
+
+        self.prechargement.activer()
+        grille_prete = None
+        limite = time.time() + 10
+        while grille_prete is None and time.time() < limite:
+            grille_prete = self.prechargement.prendre("facile")
+            time.sleep(0.01)
+
+        self.assertEqual(type(grille_prete), grille.Grille)
+        self.assertTrue(grille_prete.solved)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module rendu
+
+    Ce module est composé d'une unique classe RenduTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Rendu.
+
+    Module utilisé:
+        - unittest: utilisé pour effectuer les tests unitaires
+        - pygame: utilisé pour créer la fenêtre de test
+        - grille, cases: utilisés pour tester le rendu d'une grille
+        - rendu: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import unittest
+import pygame
+import grille
+import cases
+import rendu
+from constantes import *
+
+
+class RenduTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Rendu"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Un rendu vide est créé, ainsi qu'une liste mémorisant les éléments dessinés.
+        """
+        self.fenetre = pygame.display.set_mode(TAILLE_FENETRE_TEST)
+        self.rendu = rendu.Rendu()
+        self.dessines = []
+
+    def dessiner(self, nom, rect):
+        """ Fonction de dessin utilisée par les éléments de test: mémorise le nom de l'élément et retourne sa zone. """
+        self.dessines.append(nom)
+        return self.fenetre.fill(COULEUR_POLICE, rect)
+
+    def declarer(self, signature_b="b", position_c=(100, 0)):
+        """ Déclare trois éléments: a et b se chevauchent, c est isolé. """
+        self.rendu.ajouter("a", "a", self.dessiner, "a", pygame.Rect((0, 0), (20, 20)))
+        self.rendu.ajouter("b", signature_b, self.dessiner, "b", pygame.Rect((10, 10), (20, 20)))
+        self.rendu.ajouter("c", "c", self.dessiner, "c", pygame.Rect(position_c, (20, 20)))
+
+    def test_mettre_a_jour(self):
+        """ Méthode permettant de tester le comportement de mettre_a_jour.
+            La première image doit dessiner tous les éléments, une image identique n'en dessiner aucun.
+            Un élément modifié doit être redessiné avec les éléments qu'il chevauche, mais pas les autres.
+        """
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, ["a", "b", "c"])
+
+        self.dessines = []
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, [])
+
+        self.declarer(signature_b="b2")
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, ["a", "b"])
+
+    def test_invalider(self):
+        """ Méthode permettant de tester le comportement de invalider.
+            Un élément invalidé doit être redessiné seul. Un rendu entièrement invalidé doit redessiner tous les éléments.
+        """
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+
+        self.dessines = []
+        self.rendu.invalider("c")
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, ["c"])
+
+        self.dessines = []
+        self.rendu.invalider()
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, ["a", "b", "c"])
+
+    def test_disparition(self):
+        """ Méthode permettant de tester l'effacement d'un élément qui n'est plus déclaré.
+            Sa zone doit être effacée, et l'élément qu'il chevauchait redessiné.
+        """
+        self.declarer()
+        self.rendu.mettre_a_jour(self.fenetre)
+
+        self.dessines = []
+        self.rendu.ajouter("a", "a", self.dessiner, "a", pygame.Rect((0, 0), (20, 20)))
+        self.rendu.ajouter("c", "c", self.dessiner, "c", pygame.Rect((100, 0), (20, 20)))
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(self.dessines, ["a"])
+        self.assertEqual(self.fenetre.get_at((25, 25)), pygame.Color(*COULEUR_FOND))
+
+    def test_ajouter_grille(self, diff="moyen"):
+        """ Méthode permettant de tester le rendu d'une grille.
+            Après une première image, seule une case dont la valeur saisie change, ou qui est remplacée, doit être redessinée.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille(diff)
+        self.rendu.ajouter_grille(self.fenetre, self.grille)
+        self.rendu.mettre_a_jour(self.fenetre)
+
+        modifiees = []
+        afficher_case = self.rendu._vue_grille.afficher_case
+
+        def compter_case(fenetre, grille, i, j):
+            modifiees.append((i, j))
+            return afficher_case(fenetre, grille, i, j)
+        self.rendu._vue_grille.afficher_case = compter_case
+
+        self.grille[0, 0] = cases.CaseNoire()
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.CaseVide:
+                self.grille[i, j].valeur_saisie = 5
+                break
+
+        self.rendu.ajouter_grille(self.fenetre, self.grille)
+        self.rendu.mettre_a_jour(self.fenetre)
+        self.assertEqual(sorted(modifiees), sorted([(0, 0), (i, j)]))
+
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
+    pygame.quit()
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module reserve
+
+    Ce module est composé d'une unique classe ReserveTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Reserve.
+
+    Module utilisé:
+        - tempfile, shutil: utilisés pour créer puis supprimer le dossier de la réserve des tests
+        - pickle: utilisé pour écrire un fichier de réserve dans l'ancien format
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour verifier le type des grilles piochées
+        - cases: utilisé pour tester les types de la grille
+        - reserve: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import tempfile
+import shutil
+import pickle
+import unittest
+import grille
+import cases
+import reserve
+from constantes import *
+
+
+class ReserveTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Reserve"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une réserve de deux grilles par difficulté est créée dans un dossier temporaire.
+        """
+        self.dossier = tempfile.mkdtemp()
+        self.reserve = reserve.Reserve(self.dossier, 2)
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le dossier temporaire de la réserve. """
+        shutil.rmtree(self.dossier)
+
+    def test_piocher(self, diff="moyen"):
+        """ Méthode permettant de tester le comportement de piocher.
+            Une réserve vide doit retourner None.
+            Une fois remplie, elle doit retourner une grille résolue et le nombre de grilles doit diminuer.
+        """
+        self.assertIsNone(self.reserve.piocher(diff))
+
+        self.assertTrue(self.reserve.remplir(diff))
+        self.assertTrue(self.reserve.remplir(diff))
+        self.assertFalse(self.reserve.remplir(diff))
+        self.assertEqual(self.reserve.nombre(diff), 2)
+
+        grille_piochee = self.reserve.piocher(diff)
+        self.assertEqual(type(grille_piochee), grille.Grille)
+        self.assertTrue(grille_piochee.solved)
+        self.assertEqual(self.reserve.nombre(diff), 1)
+        for (i, j) in grille_piochee.keys():
+            self.assertTrue(type(grille_piochee[i, j]) in (cases.CaseNoire, cases.CaseVide, cases.Indicatrice))
+
+    def test_obtenir(self, diff="facile"):
+        """ Méthode permettant de tester le comportement de obtenir.
+            Sur une réserve vide, une grille doit tout de même être générée.
+        """
+        grille_obtenue = self.reserve.obtenir(diff)
+        self.assertTrue(grille_obtenue.solved)
+        self.assertEqual(len(grille_obtenue.keys()), NB_LIGNE_GRILLE * NB_COLONNE_GRILLE)
+
+    def test_persistance(self, diff="difficile"):
+        """ Méthode permettant de tester que les grilles de la réserve sont conservées sur le disque.
+            Les threads de remplissage sont lancés puis arrêtés. Une nouvelle réserve, créée sur le même dossier, doit retrouver les grilles générées.
+        """
+        self.reserve.remplir(diff)
+        self.reserve.demarrer()
+        self.reserve.arreter()
+
+        nombre = self.reserve.nombre(diff)
+        self.assertTrue(nombre >= 1)
+        self.assertEqual(reserve.Reserve(self.dossier, 2).nombre(diff), nombre)
+
+        # Les grilles rechargées doivent conserver leur solution
+        originale = grille.Grille(grid=self.reserve._grilles[diff][0])
+        rechargee = reserve.Reserve(self.dossier, 2).piocher(diff)
+        self.assertEqual([case._solution_case for (i, j), case in sorted(originale.items()) if type(case) is cases.CaseVide],
+                         [case._solution_case for (i, j), case in sorted(rechargee.items()) if type(case) is cases.CaseVide])
+
+    def test_fichier_illisible(self, diff="facile"):
+        """ Méthode permettant de tester le chargement de fichiers de réserve illisibles.
+            Un fichier écrit par pickle dans l'ancien format, ou un fichier tronqué, doit donner une réserve vide sans lever d'exception.
+        """
+        with open(self.reserve._chemin(diff), "wb") as fichier:
+            pickle.dump([{(0, 0): cases.CaseNoire()}], fichier)
+        self.assertEqual(reserve.Reserve(self.dossier, 2).nombre(diff), 0)
+
+        self.reserve.remplir(diff)
+        self.reserve._sauvegarder(diff)
+        with open(self.reserve._chemin(diff), "rb") as fichier:
+            donnees = fichier.read()
+        with open(self.reserve._chemin(diff), "wb") as fichier:
+            fichier.write(donnees[:-1])
+        self.assertEqual(reserve.Reserve(self.dossier, 2).nombre(diff), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
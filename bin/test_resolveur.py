@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module resolveur
+
+    Ce module est composé d'une unique classe ResolveurTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Resolveur.
+
+    Module utilisé:
+        - queue: utilisé pour recevoir les messages publiés par le calcul
+        - threading: utilisé pour l'événement d'arrêt et le calcul en arrière-plan
+        - unittest: utilisé pour effectuer les tests unitaires
+        - io: utilisé pour lire une grille sans solution
+        - grille, cases, texte: utilisés pour créer les grilles à résoudre
+        - resolveur: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import io
+import queue
+import threading
+import unittest
+import grille
+import cases
+import resolveur
+import texte
+from constantes import *
+
+
+class ResolveurTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Resolveur"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille est générée, puis toutes ses cases vides sauf trois sont remplies avec leur solution.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille("facile")
+        self.progression = queue.Queue()
+        self.arret = threading.Event()
+
+        vides = [(i, j) for (i, j) in self.grille.keys() if type(self.grille[i, j]) is cases.CaseVide]
+        for (i, j) in vides[3:]:
+            self.grille[i, j].valeur_saisie = self.grille[i, j]._solution_case
+
+    def messages(self):
+        """ Retourne la liste des messages publiés par le calcul """
+        resultat = []
+        while not self.progression.empty():
+            resultat.append(self.progression.get())
+        return resultat
+
+    def test_echantillonner(self):
+        """ Méthode permettant de tester le comportement de echantillonner.
+            La publication par le temps est désactivée, et une publication est demandée tous les 10 noeuds.
+            Pour 100 noeuds explorés, l'avancement ne doit être publié que 10 fois.
+            Sans file de progression, les noeuds doivent être comptés sans rien publier.
+        """
+        calcul = resolveur.Resolveur(self.grille, self.progression, self.arret, 0, 10)
+        for noeud in range(100):
+            calcul.echantillonner()
+
+        messages = self.messages()
+        self.assertEqual([nature for nature, contenu in messages], [CALCUL_PROGRESSION] * 10)
+        self.assertEqual([contenu["noeuds"] for nature, contenu in messages], list(range(10, 101, 10)))
+
+        calcul = resolveur.Resolveur(self.grille)
+        for noeud in range(100):
+            calcul.echantillonner()
+        self.assertEqual(calcul.noeuds, 100)
+
+    def test_resoudre(self):
+        """ Méthode permettant de tester le comportement de resoudre, exécuté dans un thread.
+            Le calcul doit publier son avancement, puis une grille résolue.
+        """
+        calcul = resolveur.Resolveur(self.grille, self.progression, self.arret)
+        thread = threading.Thread(target=calcul.resoudre, args=("MEDIUM",))
+        thread.start()
+        thread.join()
+
+        messages = self.messages()
+        self.assertEqual(messages[0][0], CALCUL_PROGRESSION)
+        self.assertEqual(messages[-1][0], CALCUL_RESULTAT)
+        self.assertTrue(messages[-1][1].victoire())
+
+    def test_calculate_solution(self):
+        """ Méthode permettant de tester le retour de calculate_solution en mode SLOW.
+            La méthode doit retourner True pour la grille générée, et False pour une grille sans solution.
+        """
+        self.assertTrue(resolveur.Resolveur(self.grille).calculate_solution("SLOW"))
+        self.assertTrue(self.grille.victoire())
+
+        sans_solution = next(texte.lire(io.StringIO("1\\1 5\n0 0\n")))
+        self.assertFalse(resolveur.Resolveur(sans_solution).calculate_solution("SLOW"))
+
+    def test_abandon(self):
+        """ Méthode permettant de tester l'arrêt du calcul.
+            Lorsque l'arrêt est demandé, le calcul doit remonter sa recherche sans exception et publier son abandon.
+        """
+        self.arret.set()
+        calcul = resolveur.Resolveur(self.grille, self.progression, self.arret)
+        calcul.resoudre("FAST")
+        self.assertEqual(self.messages()[-1], (CALCUL_ABANDON, None))
+
+    def test_compter_solutions(self):
+        """ Méthode permettant de tester le comportement de compter_solutions.
+            La solution de la grille générée doit être comptée, dans la limite demandée, sans modifier la grille.
+            Si l'arrêt est demandé, aucune solution ne doit être comptée.
+        """
+        valeurs = {(i, j): case.valeur_saisie for (i, j), case in self.grille.items() if type(case) is cases.CaseVide}
+        calcul = resolveur.Resolveur(self.grille, self.progression, self.arret)
+        self.assertTrue(calcul.compter_solutions(1000) >= 1)
+        self.assertEqual(calcul.compter_solutions(1), 1)
+        self.assertEqual(valeurs, {(i, j): case.valeur_saisie for (i, j), case in self.grille.items() if type(case) is cases.CaseVide})
+
+        self.arret.set()
+        self.assertEqual(calcul.compter_solutions(), 0)
+        self.assertTrue(calcul.arrete())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module ressources
+
+    Ce module est composé d'une unique classe RessourcesTest, dont les méthodes effectuent les tests unitaires des fonctions du module ressources.
+
+    Module utilisé:
+        - unittest: utilisé pour effectuer les tests unitaires
+        - pygame: utilisé pour créer la fenêtre nécessaire à la conversion des images
+        - ressources: utilisé pour tester ses fonctions
+        - constantes: utilisé dans chaque méthode
+"""
+
+import unittest
+import pygame
+import ressources
+from constantes import *
+
+
+class RessourcesTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module ressources"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Les ressources déjà chargées sont oubliées.
+        """
+        ressources.vider()
+
+    def test_image(self):
+        """ Méthode permettant de tester le comportement de image.
+            Deux appels avec le même chemin doivent retourner la même surface, sans relire le fichier.
+            Une image transparente et une image opaque d'un même fichier doivent être distinctes.
+        """
+        image = ressources.image(CHEMIN_IMAGE_BOUTON)
+        self.assertEqual(type(image), pygame.Surface)
+        self.assertIs(ressources.image(CHEMIN_IMAGE_BOUTON), image)
+        self.assertIsNot(ressources.image(CHEMIN_IMAGE_BOUTON, True), image)
+
+    def test_police(self):
+        """ Méthode permettant de tester le comportement de police.
+            Deux appels avec la même taille doivent retourner la même police, deux tailles différentes deux polices distinctes.
+        """
+        police = ressources.police(TAILLE_POLICE_BOUTON)
+        self.assertIs(ressources.police(TAILLE_POLICE_BOUTON), police)
+        self.assertIsNot(ressources.police(TAILLE_POLICE_SAISIE), police)
+
+    def test_texte(self):
+        """ Méthode permettant de tester le comportement de texte.
+            Un même texte rendu deux fois doit retourner la même surface, une couleur différente une autre surface.
+            Au-delà de TAILLE_CACHE_TEXTES textes, le moins récemment utilisé doit être oublié.
+        """
+        police = ressources.police(TAILLE_POLICE_CASEVIDE)
+        surface = ressources.texte(police, "7", COULEUR_POLICE)
+        self.assertIs(ressources.texte(police, "7", COULEUR_POLICE), surface)
+        self.assertIsNot(ressources.texte(police, "7", COULEUR_ERREUR), surface)
+
+        for indice in range(TAILLE_CACHE_TEXTES):
+            ressources.texte(police, "texte" + str(indice), COULEUR_POLICE)
+        self.assertEqual(len(ressources._textes), TAILLE_CACHE_TEXTES)
+        self.assertIsNot(ressources.texte(police, "7", COULEUR_POLICE), surface)
+
+    def test_precharger(self):
+        """ Méthode permettant de tester le comportement de precharger et vider.
+            Une fois préchargées, toutes les ressources du jeu doivent être en cache, puis être oubliées par vider.
+        """
+        ressources.precharger()
+        self.assertEqual(len(ressources._images), len(ressources.IMAGES_JEU))
+        self.assertEqual(len(ressources._polices), len(set(ressources.POLICES_JEU)))
+        self.assertTrue(len(ressources._textes) > 0)
+
+        ressources.vider()
+        self.assertEqual(len(ressources._images), 0)
+        self.assertEqual(len(ressources._polices), 0)
+        self.assertEqual(len(ressources._textes), 0)
+
+    def test_precharger_en_arriere_plan(self):
+        """ Méthode permettant de tester le préchargement en arrière-plan.
+            Une ressource demandée pendant le préchargement doit être celle qui reste en cache.
+        """
+        ressources.vider()
+        fil = ressources.precharger_en_arriere_plan()
+        image = ressources.image(CHEMIN_IMAGE_BOUTON, True)
+        fil.join()
+        self.assertIs(ressources.image(CHEMIN_IMAGE_BOUTON, True), image)
+        self.assertEqual(len(ressources._images), len(ressources.IMAGES_JEU))
+        ressources.vider()
+
+
+if __name__ == "__main__":
+    pygame.init()
+    fenetre = pygame.display.set_mode(TAILLE_FENETRE)
+    unittest.main()
+    pygame.quit()
@@ -8,6 +8,7 @@
 
     Module utilisé:
         - os: permet un traitement sur les fichiers créés (suppression)
+        - tempfile, shutil: utilisés pour créer puis supprimer la bibliothèque des tests, distincte de celle du joueur
         - pygame: tests unitaires des méthodes de jeu
         - unittest: utilisé pour effectuer les tests unitaires
         - grille: utilisé pour tester les méthodes de sauvegarde
@@ -17,6 +18,8 @@
         - constantes: utilisé dans differentes méthodes.
 """
 import os
+import tempfile
+import shutil
 import pygame
 import pygame.freetype
 from pygame.locals import *
@@ -32,9 +35,17 @@ class SauvegardeChargementTest(unittest.TestCase):
     def setUp(self):
         """ Méthode appellée avant chaque test, permettant d'initialiser le test.
             Un unique attribut sauvegarde est créé, dont la fenetre est initialisé à (0,0) et la grille à une grille Vide.
+            La bibliothèque utilisée est créée dans un dossier temporaire.
         """
-        self.sauvegarde = sauvegarde.Sauvegarde((0, 0), grille.Grille())
-        self.chargement = sauvegarde.Chargement((0, 0))
+        self.dossier = tempfile.mkdtemp()
+        chemin_bibliotheque = os.path.join(self.dossier, "bibliotheque.db")
+        self.sauvegarde = sauvegarde.Sauvegarde((0, 0), grille.Grille(), chemin_bibliotheque)
+        self.chargement = sauvegarde.Chargement((0, 0), chemin_bibliotheque)
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, fermant la bibliothèque du chargement et supprimant son dossier temporaire. """
+        self.chargement._bibliotheque.fermer()
+        shutil.rmtree(self.dossier)
 
     def test_valider(self, chemin_fichier="test", faux_chemin="incorrect"):
         """ Méthode permettant de tester le comportement des méthodes valider des classes Sauvegarde et Chargement.
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module serialisation
+
+    Ce module est composé d'une unique classe SerialisationTest, dont les méthodes effectuent les tests unitaires des fonctions du module serialisation.
+
+    Module utilisé:
+        - os: utilisé pour supprimer les fichiers générés par les tests
+        - pickle: utilisé pour écrire une sauvegarde dans l'ancien format
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille, cases: utilisés pour créer les grilles à sauvegarder
+        - serialisation: utilisé pour tester ses fonctions
+        - exceptions: utilisé pour tester la lecture d'un fichier illisible
+        - constantes: utilisé dans chaque méthode
+"""
+
+import os
+import pickle
+import unittest
+import grille
+import cases
+import serialisation
+from exceptions import *
+from constantes import *
+
+
+class SerialisationTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module serialisation"""
+
+    def setUp(self, diff="moyen"):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille est générée, et certaines de ses cases vides sont remplies par le joueur.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille(diff)
+
+        compteur = 0
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.CaseVide and compteur % 2 == 0:
+                self.grille[i, j].valeur_saisie = compteur % 9 + 1
+            compteur += 1
+
+    def assertGrillesEgales(self, grid, attendu):
+        """ Vérifie que deux dictionnaires de cases contiennent les mêmes cases, solutions et valeurs saisies comprises """
+        self.assertEqual(grid, attendu)
+        for (i, j), case in attendu.items():
+            if type(case) is cases.CaseVide:
+                self.assertEqual(grid[i, j]._solution_case, case._solution_case)
+
+    def test_encoder_decoder(self):
+        """ Méthode permettant de tester le comportement de encoder et decoder.
+            Une grille encodée puis décodée doit être identique à la grille d'origine.
+            Le contenu doit commencer par l'en-tête et la version, et ne pas dépasser trois octets par case.
+        """
+        donnees = serialisation.encoder(self.grille._grid)
+        self.assertTrue(donnees.startswith(ENTETE_SAUVEGARDE + bytes((VERSION_SAUVEGARDE,))))
+        self.assertTrue(len(donnees) <= len(ENTETE_SAUVEGARDE) + 3 + 3 * NB_LIGNE_GRILLE * NB_COLONNE_GRILLE)
+        self.assertGrillesEgales(serialisation.decoder(donnees), self.grille._grid)
+
+        self.assertEqual(serialisation.decoder(serialisation.encoder({})), {})
+
+    def test_decoder_illisible(self):
+        """ Méthode permettant de tester le comportement de decoder sur un contenu illisible.
+            Un contenu tronqué, une version inconnue, un contenu quelconque ou une ancienne sauvegarde pickle doivent lever FormatSauvegardeException:
+            seuls charger et migrer lisent l'ancien format.
+        """
+        donnees = serialisation.encoder(self.grille._grid)
+
+        for illisible in (donnees[:-1], ENTETE_SAUVEGARDE + bytes((VERSION_SAUVEGARDE + 1,)) + donnees[len(ENTETE_SAUVEGARDE) + 1:], b"rawr",
+                          pickle.dumps(self.grille._grid)):
+            with self.assertRaises(FormatSauvegardeException):
+                serialisation.decoder(illisible)
+
+    def test_migrer(self, nom_fichier="TU_migration"):
+        """ Méthode permettant de tester la lecture et la migration d'une sauvegarde de l'ancien format.
+            Une grille sauvegardée par pickle doit être chargée à l'identique, puis réécrite dans le format actuel par migrer.
+            Une seconde migration ne doit pas réécrire le fichier.
+        """
+        with open(nom_fichier, "wb") as fichier:
+            pickle.Pickler(fichier).dump(self.grille._grid)
+
+        self.assertGrillesEgales(serialisation.charger(nom_fichier), self.grille._grid)
+
+        self.assertTrue(serialisation.migrer(nom_fichier))
+        with open(nom_fichier, "rb") as fichier:
+            self.assertTrue(fichier.read().startswith(ENTETE_SAUVEGARDE))
+        self.assertGrillesEgales(serialisation.charger(nom_fichier), self.grille._grid)
+
+        self.assertFalse(serialisation.migrer(nom_fichier))
+        os.remove(nom_fichier)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module service
+
+    Ce module est composé d'une unique classe ServiceTest, dont les méthodes effectuent les tests unitaires des points d'accès du service.
+
+    Module utilisé:
+        - json, urllib.request, urllib.error: utilisés pour envoyer les requêtes au service
+        - http.client: utilisé pour envoyer des requêtes dont l'en-tête Content-Length est incorrect
+        - threading: utilisé pour exécuter le service pendant les tests
+        - unittest: utilisé pour effectuer les tests unitaires
+        - service: utilisé pour tester ses points d'accès
+        - constantes: utilisé dans chaque méthode
+"""
+
+import json
+import http.client
+import threading
+import unittest
+import urllib.request
+import urllib.error
+import service
+from constantes import *
+
+
+class ServiceTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des points d'accès de la classe Service"""
+
+    @classmethod
+    def setUpClass(cls):
+        """ Méthode appellée avant les tests, lançant le service sur un port libre avec un seul processus """
+        cls.service = service.Service(0, 1)
+        threading.Thread(target=cls.service.serve_forever, daemon=True).start()
+        cls.adresse = "http://{}:{}/".format(*cls.service.server_address)
+
+    @classmethod
+    def tearDownClass(cls):
+        """ Méthode appellée après les tests, arrêtant le service """
+        cls.service.shutdown()
+        cls.service.fermer()
+
+    def requete(self, point, parametres=None):
+        """ Envoie une requête au point d'accès passé en paramètre, en POST si des paramètres sont donnés, et retourne le code et l'objet JSON de la réponse """
+        corps = json.dumps(parametres).encode("utf-8") if parametres is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(self.adresse + point, corps)) as reponse:
+                return reponse.status, json.loads(reponse.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_generer_resoudre(self):
+        """ Méthode permettant de tester les points d'accès generate, solve et validate.
+            La grille résolue doit être valide et complète, contrairement à la grille générée.
+        """
+        statut, generee = self.requete("generate", {"difficulte": "facile"})
+        self.assertEqual(statut, 200)
+
+        statut, resolue = self.requete("solve", {"grille": generee["grille"], "mode": "FAST", "delai": DELAI_MAX_SERVICE})
+        self.assertEqual(statut, 200)
+        self.assertEqual(self.requete("validate", {"grille": resolue["grille"]})[1]["complete"], True)
+
+        statut, validation = self.requete("validate", {"grille": generee["grille"]})
+        self.assertEqual((statut, validation["valide"], validation["complete"]), (200, True, False))
+
+    def test_compter(self):
+        """ Méthode permettant de tester le point d'accès count_solutions.
+            La solution d'une grille entièrement déterminée doit être unique. Sans durée allouée, le comptage doit être incomplet.
+        """
+        grille_texte = "Noire\t3\\0\t4\\0\n0\\3\t-1\t-1\n0\\4\t-1\t-1\n"
+        statut, reponse = self.requete("count_solutions", {"grille": grille_texte})
+        self.assertEqual((statut, reponse["solutions"], reponse["complet"], reponse["unique"]), (200, 1, True, True))
+
+        statut, reponse = self.requete("count_solutions", {"grille": grille_texte, "delai": 0})
+        self.assertEqual((statut, reponse["complet"]), (200, False))
+
+    def test_erreurs(self):
+        """ Méthode permettant de tester les réponses aux requêtes incorrectes: point d'accès inconnu, paramètre manquant ou invalide, grille illisible """
+        self.assertEqual(self.requete("inconnu", {})[0], 404)
+        self.assertEqual(self.requete("solve", {})[0], 400)
+        self.assertEqual(self.requete("solve", {"grille": "X \\3", "mode": "RAPIDE"})[0], 400)
+        self.assertEqual(self.requete("count_solutions", {"grille": "X \\3", "limite": 0})[0], 400)
+        self.assertEqual(self.requete("validate", {"grille": "X a\\3"})[0], 400)
+        self.assertEqual(self.requete("generate", {"difficulte": "impossible"})[0], 400)
+
+    def test_longueur_incorrecte(self):
+        """ Méthode permettant de tester le refus des requêtes dont la longueur annoncée est illisible ou négative """
+        for longueur in ("abc", "-1"):
+            connexion = http.client.HTTPConnection(*self.service.server_address, timeout=DELAI_MAX_SERVICE)
+            try:
+                connexion.putrequest("POST", "/validate")
+                connexion.putheader("Content-Length", longueur)
+                connexion.endheaders()
+                reponse = connexion.getresponse()
+                self.assertEqual(reponse.status, 400)
+                self.assertIn("erreur", json.loads(reponse.read()))
+            finally:
+                connexion.close()
+
+    def test_grille_incoherente(self):
+        """ Méthode permettant de tester les réponses aux grilles lisibles mais incohérentes ou sans solution.
+            Une indicatrice sans plage doit être refusée, et une grille sans solution doit l'être dans chacun des modes.
+        """
+        self.assertEqual(self.requete("solve", {"grille": "1\\2 3\n"})[0], 400)
+        self.assertEqual(self.requete("count_solutions", {"grille": "1\\2 3\n"})[0], 400)
+        for mode in service.MODES_SERVICE:
+            self.assertEqual(self.requete("solve", {"grille": "1\\1 5\n0 0\n", "mode": mode})[0], 422)
+
+    def test_nombres_non_finis(self):
+        """ Méthode permettant de tester le refus des durées et des limites non finies, qui ne laisseraient jamais le calcul s'arrêter """
+        grille_texte = "Noire\t3\\0\t4\\0\n0\\3\t-1\t-1\n0\\4\t-1\t-1\n"
+        for delai in ("nan", "inf", "-inf"):
+            self.assertEqual(self.requete("solve", {"grille": grille_texte, "delai": delai})[0], 400)
+        for limite in ("nan", "inf"):
+            self.assertEqual(self.requete("count_solutions", {"grille": grille_texte, "limite": limite})[0], 400)
+
+    def test_erreur_interne(self):
+        """ Méthode permettant de tester qu'une exception levée par un calcul est retournée avec le code 500 et comptée dans les mesures """
+        points = dict(service._POINTS)
+        service._POINTS["validate"] = (_calcul_errone, service._parametres_valider)
+        try:
+            statut, reponse = self.requete("validate", {"grille": "X \\3"})
+        finally:
+            service._POINTS.clear()
+            service._POINTS.update(points)
+        self.assertEqual(statut, 500)
+        self.assertIn("erreur", reponse)
+        self.assertTrue(self.requete("metrics")[1]["points"]["validate"]["erreurs"] >= 1)
+
+    def test_occupe(self):
+        """ Méthode permettant de tester le refus des requêtes lorsque toutes les places sont occupées """
+        for k in range(REQUETES_SIMULTANEES_SERVICE):
+            self.service._places.acquire()
+        try:
+            self.assertEqual(self.requete("validate", {"grille": "X \\3"})[0], 503)
+        finally:
+            for k in range(REQUETES_SIMULTANEES_SERVICE):
+                self.service._places.release()
+
+    def test_metriques(self):
+        """ Méthode permettant de tester le point d'accès metrics: chaque requête doit être comptée avec sa durée """
+        self.requete("validate", {"grille": "X \\3"})
+        self.requete("validate", {"grille": "X a\\3"})
+        statut, metriques = self.requete("metrics")
+        self.assertEqual(statut, 200)
+
+        mesure = metriques["points"]["validate"]
+        self.assertTrue(mesure["requetes"] >= 2 and mesure["erreurs"] >= 1)
+        self.assertTrue(0 <= mesure["p50_ms"] <= mesure["p95_ms"] <= mesure["max_ms"])
+
+
+def _calcul_errone(grille_texte):
+    """ Calcul exécuté par le groupe de processus, levant une exception imprévue """
+    raise KeyError(grille_texte)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,11 @@
         - constantes: utilisé dans chaque méthode
         - cases: utilisé pour tester les types de la grille
         - solveur: utilisé pour tester ses méthodes
+        - queue: utilisé pour simuler les messages publiés par le calcul
         - exceptions: permet de tester qu'une grille sans solution lève bien l'exception attendu
 """
 
+import queue
 import pygame
 import pygame.freetype
 from pygame.locals import *
@@ -52,6 +54,30 @@ class SolveurTest(unittest.TestCase):
         self.solveur.change_message()
         self.assertTrue(self.solveur.message != message)
 
+    def test_lire_progression(self):
+        """ Méthode permettant de tester le comportement de lire_progression.
+            Un instantané publié doit être appliqué à la grille affichée et au texte d'avancement, sans terminer le calcul.
+            La grille résolue publiée doit remplacer celle de l'écran. Un abandon publié doit lever AbandonException.
+        """
+        self.solveur._grille = grille.Grille()
+        self.solveur._grille.generer_grille_vide()
+        progression = queue.Queue()
+
+        progression.put((CALCUL_PROGRESSION, {"valeurs": {(1, 1): 5}, "message": MESSAGE_CALCUL, "noeuds": 42, "noeuds_par_seconde": 10, "profondeur": 3}))
+        self.assertFalse(self.solveur.lire_progression(progression))
+        self.assertEqual(self.solveur._grille[1, 1].valeur_saisie, 5)
+        self.assertEqual(self.solveur.message, MESSAGE_CALCUL)
+        self.assertTrue("42" in self.solveur.progression)
+
+        resolue = grille.Grille()
+        progression.put((CALCUL_RESULTAT, resolue))
+        self.assertTrue(self.solveur.lire_progression(progression))
+        self.assertIs(self.solveur._grille, resolue)
+
+        progression.put((CALCUL_ABANDON, None))
+        with self.assertRaises(AbandonException):
+            self.solveur.lire_progression(progression)
+
     def test_correction_grille(self):
         """ Méthode permettant de tester le comportement de correction_grille.
             Une grille vide est générée, on verifie que toutes ses cases sont bien des cases vides.
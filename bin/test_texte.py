@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module texte
+
+    Ce module est composé d'une unique classe TexteTest, dont les méthodes effectuent les tests unitaires des fonctions du module texte.
+
+    Module utilisé:
+        - io, os: utilisés pour lire et écrire les grilles en mémoire ou dans un fichier
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille, cases: utilisés pour créer les grilles à exporter
+        - texte: utilisé pour tester ses fonctions
+        - exceptions: utilisé pour tester la lecture d'une grille illisible
+        - constantes: utilisé dans chaque méthode
+"""
+
+import io
+import os
+import unittest
+import grille
+import cases
+import texte
+from exceptions import *
+from constantes import *
+
+CHEMIN_TEXTE_TEST = "TU_texte.txt"
+
+
+class TexteTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des fonctions du module texte"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille de chaque difficulté est générée, et certaines cases vides de la première sont remplies par le joueur.
+        """
+        self.grilles = []
+        for diff in ("facile", "moyen", "difficile"):
+            self.grilles.append(grille.Grille())
+            self.grilles[-1].generer_grille(diff)
+
+        compteur = 0
+        for (i, j) in self.grilles[0].keys():
+            if type(self.grilles[0][i, j]) is cases.CaseVide and compteur % 2 == 0:
+                self.grilles[0][i, j].valeur_saisie = compteur % 9 + 1
+            compteur += 1
+
+    def tearDown(self):
+        """ Méthode appellée après chaque test, supprimant le fichier de test """
+        if os.path.exists(CHEMIN_TEXTE_TEST):
+            os.remove(CHEMIN_TEXTE_TEST)
+
+    def assertStructureEgale(self, lue, attendue):
+        """ Vérifie que deux grilles ont les mêmes dimensions, et les mêmes cases noires et indicatrices aux mêmes positions """
+        self.assertEqual((lue.nb_colonne, lue.nb_ligne), (attendue.nb_colonne, attendue.nb_ligne))
+        self.assertEqual(set(lue.keys()), set(attendue.keys()))
+        for (i, j), case in attendue.items():
+            self.assertIs(type(lue[i, j]), type(case))
+            if type(case) is cases.Indicatrice:
+                self.assertEqual(lue[i, j], case)
+
+    def test_saisie(self):
+        """ Méthode permettant de tester l'écriture puis la lecture des valeurs saisies.
+            Les grilles lues doivent avoir la structure et les valeurs saisies des grilles écrites.
+        """
+        flux = io.StringIO()
+        self.assertEqual(texte.ecrire(flux, self.grilles), len(self.grilles))
+        flux.seek(0)
+
+        lues = list(texte.lire(flux))
+        self.assertEqual(len(lues), len(self.grilles))
+        for lue, attendue in zip(lues, self.grilles):
+            self.assertStructureEgale(lue, attendue)
+            for (i, j), case in attendue.items():
+                if type(case) is cases.CaseVide:
+                    self.assertEqual(lue[i, j].valeur_saisie, case.valeur_saisie)
+
+    def test_solution(self):
+        """ Méthode permettant de tester l'écriture puis la lecture des solutions, dans un fichier.
+            Les grilles lues doivent être égales aux grilles écrites, sans valeur saisie.
+        """
+        self.assertEqual(texte.sauvegarder(iter(self.grilles), CHEMIN_TEXTE_TEST, CONTENU_SOLUTION), len(self.grilles))
+
+        for lue, attendue in zip(texte.charger(CHEMIN_TEXTE_TEST, CONTENU_SOLUTION), self.grilles):
+            for case in attendue.values():
+                if type(case) is cases.CaseVide:
+                    case.valeur_saisie = -1
+            self.assertStructureEgale(lue, attendue)
+            self.assertEqual(lue, attendue)
+
+    def test_grille_str(self):
+        """ Méthode permettant de tester la lecture du texte produit par Grille.__str__, et l'écriture du même texte """
+        lue = next(texte.lire(io.StringIO(str(self.grilles[0]))))
+        self.assertStructureEgale(lue, self.grilles[0])
+        self.assertEqual([ligne.split() for ligne in texte.lignes(lue)], [ligne.split() for ligne in str(self.grilles[0]).splitlines()])
+
+    def test_notations(self):
+        """ Méthode permettant de tester la lecture des notations acceptées: sommes vides, cases noires et vides alternatives,
+            espaces multiples et lignes vides entre les grilles.
+        """
+        flux = io.StringIO("\n#  \\16  12\\\n\\7  .  3\n\n\n\nX 0\\4\nNoire _\n")
+        lues = list(texte.lire(flux))
+        self.assertEqual(len(lues), 2)
+
+        self.assertEqual((lues[0].nb_colonne, lues[0].nb_ligne), (3, 2))
+        self.assertIs(type(lues[0][0, 0]), cases.CaseNoire)
+        self.assertEqual((lues[0][1, 0].valeur_bas, lues[0][1, 0].valeur_droite), (0, 16))
+        self.assertEqual((lues[0][2, 0].valeur_bas, lues[0][2, 0].valeur_droite), (12, 0))
+        self.assertEqual(lues[0][1, 1].valeur_saisie, -1)
+        self.assertEqual(lues[0][2, 1].valeur_saisie, 3)
+
+        self.assertIs(type(lues[1][0, 1]), cases.CaseNoire)
+        self.assertIs(type(lues[1][1, 1]), cases.CaseVide)
+
+    def test_erreur(self):
+        """ Méthode permettant de tester la lecture de grilles illisibles: case inconnue et lignes de longueurs différentes.
+            Les grilles précédant l'erreur doivent être lues.
+        """
+        lecture = texte.lire(io.StringIO("X \\3\n\\4 1\n\nX 12\n"))
+        self.assertIs(type(next(lecture)), grille.Grille)
+        self.assertRaises(FormatTexteException, next, lecture)
+
+        self.assertRaises(FormatTexteException, list, texte.lire(io.StringIO("X \\3\nX\n")))
+        self.assertRaises(FormatTexteException, list, texte.lire(io.StringIO("X a\\3\n")))
+
+
+if __name__ == "__main__":
+    unittest.main()
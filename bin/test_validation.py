@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module validation
+
+    Ce module est composé d'une unique classe ValidationTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe Validation.
+
+    Module utilisé:
+        - random: utilisé pour tirer les saisies du joueur
+        - unittest: utilisé pour effectuer les tests unitaires
+        - grille: utilisé pour générer les grilles validées
+        - cases: utilisé pour reconnaître les cases vides
+        - validation: utilisé pour tester ses méthodes
+        - exceptions: utilisé pour comparer la validation incrémentale à la méthode validate
+"""
+import random
+import unittest
+
+import grille
+import cases
+import validation
+import exceptions
+
+
+class ValidationTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe Validation"""
+
+    def setUp(self):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille de difficulté moyenne est générée, et la liste des indices de ses cases vides est conservée.
+        """
+        self.grille = grille.Grille()
+        self.grille.generer_grille("moyen")
+        self.cases_vides = [indices for indices, case in self.grille.items() if type(case) is cases.CaseVide]
+
+    def erreur_complete(self):
+        """ Retourne le type de l'exception levée par la méthode validate de la grille, ou None """
+        try:
+            self.grille.validate()
+        except (exceptions.ExceptionMixte, exceptions.DoublonException, exceptions.SommeIncorrecteException) as erreur:
+            return type(erreur)
+        return None
+
+    def test_verifier_case(self):
+        """ Méthode permettant de tester le comportement de verifier_case.
+            Après chaque saisie aléatoire, l'erreur et les erreurs des cases doivent être celles calculées par la méthode validate sur toute la grille.
+        """
+        random.seed(0)
+        verification = validation.Validation(self.grille)
+        self.assertIsNone(verification.erreur)
+
+        for _ in range(200):
+            (i, j) = random.choice(self.cases_vides)
+            self.grille[i, j].valeur_saisie = random.choice([-1] + list(range(1, 10)))
+            erreur = verification.verifier_case(i, j)
+            etats = {indices: case.etat() for indices, case in self.grille.items()}
+
+            self.assertEqual(type(erreur) if erreur is not None else None, self.erreur_complete())
+            self.assertEqual(etats, {indices: case.etat() for indices, case in self.grille.items()})
+
+    def test_terminee(self):
+        """ Méthode permettant de tester le comportement de terminee.
+            Une grille remplie case par case avec sa solution n'est terminée qu'à la dernière saisie.
+            Une valeur fausse puis effacée rend la grille non terminée, et la réinitialisation est prise en compte par verifier_grille.
+        """
+        verification = validation.Validation(self.grille)
+        for indices in self.cases_vides:
+            self.assertFalse(verification.terminee())
+            self.grille[indices].valeur_saisie = self.grille[indices]._solution_case
+            verification.verifier_case(*indices)
+        self.assertTrue(verification.terminee())
+
+        indices = self.cases_vides[0]
+        self.grille[indices].valeur_saisie = -1
+        verification.verifier_case(*indices)
+        self.assertFalse(verification.terminee())
+
+        self.grille.solve()
+        verification.verifier_grille()
+        self.assertTrue(verification.terminee())
+        self.grille.reinitialiser()
+        verification.verifier_grille()
+        self.assertFalse(verification.terminee())
+        self.assertIsNone(verification.erreur)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# -*- encoding:utf-8 -*
+
+
+""" Module effectuant les tests unitaire du module vue_grille
+
+    Ce module est composé d'une unique classe VueGrilleTest, dont les méthodes effectuent les tests unitaires des méthodes de la classe VueGrille.
+
+    Module utilisé:
+        - unittest: utilisé pour effectuer les tests unitaires
+        - pygame: utilisé pour créer la fenêtre de test et comparer les affichages
+        - grille, cases: utilisés pour créer les grilles à afficher
+        - vue_grille: utilisé pour tester ses méthodes
+        - constantes: utilisé dans chaque méthode
+"""
+
+import unittest
+import pygame
+import grille
+import cases
+import vue_grille
+from constantes import *
+
+
+class VueGrilleTest(unittest.TestCase):
+    """Classe permettant de tester les fonctionnement des méthodes de la classe VueGrille"""
+
+    def setUp(self, diff="moyen"):
+        """ Méthode appellée avant chaque test, permettant d'initialiser le test.
+            Une grille est générée, puis certaines de ses cases sont remplies ou marquées en erreur.
+        """
+        self.fenetre = pygame.display.set_mode(TAILLE_FENETRE)
+        self.vue = vue_grille.VueGrille()
+        self.grille = grille.Grille()
+        self.grille.generer_grille(diff)
+
+        compteur = 0
+        for (i, j) in self.grille.keys():
+            case = self.grille[i, j]
+            if type(case) is cases.CaseVide:
+                case.valeur_saisie = compteur % 9 + 1
+                case.erreur = compteur % 3 == 0
+            elif type(case) is cases.Indicatrice:
+                case.erreur_droite = case.valeur_droite != 0 and compteur % 2 == 0
+                case.erreur_bas = case.valeur_bas != 0 and compteur % 2 == 1
+            compteur += 1
+
+    def capture(self):
+        """ Retourne le contenu de la fenêtre de test """
+        return pygame.image.tostring(self.fenetre, "RGB")
+
+    def test_afficher(self):
+        """ Méthode permettant de tester le comportement de afficher et afficher_case.
+            L'affichage en couches, de la grille entière ou case par case, doit être identique au dessin direct de la grille.
+        """
+        self.fenetre.fill(COULEUR_FOND)
+        vue_grille.VueGrille.dessiner(self.fenetre, self.grille)
+        attendu = self.capture()
+
+        self.fenetre.fill(COULEUR_FOND)
+        self.vue.afficher(self.fenetre, self.grille)
+        self.assertEqual(self.capture(), attendu)
+
+        self.fenetre.fill(COULEUR_FOND)
+        for (i, j) in self.grille.keys():
+            self.vue.afficher_case(self.fenetre, self.grille, i, j)
+        self.assertEqual(self.capture(), attendu)
+
+    def test_preparer(self):
+        """ Méthode permettant de tester le comportement de preparer.
+            La couche statique ne doit pas être redessinée lorsque seules les valeurs saisies changent.
+            Elle doit l'être lorsqu'une case est remplacée.
+        """
+        self.vue.preparer(self.grille)
+        couche = self.vue._couche
+
+        for (i, j) in self.grille.keys():
+            if type(self.grille[i, j]) is cases.CaseVide:
+                self.grille[i, j].valeur_saisie = -1
+        self.vue.preparer(self.grille)
+        self.assertIs(self.vue._couche, couche)
+
+        self.grille[1, 1] = cases.CaseNoire()
+        self.vue.preparer(self.grille)
+        self.assertIsNot(self.vue._couche, couche)
+
+    def test_rect(self):
+        """ Méthode permettant de tester le comportement de rect et rect_valeur.
+            Le rect d'une case doit commencer à sa position, et les zones de saisie être décalées de leur constante à l'intérieur de la case.
+        """
+        rect = vue_grille.VueGrille.rect(2, 3)
+        self.assertEqual((rect.topleft, rect.size), (vue_grille.VueGrille.position(2, 3), (COTE_IMAGE_CASE, COTE_IMAGE_CASE)))
+
+        for zone, decalage in ((SAISIE_DROITE, DECALAGE_INDICATRICE_VALDROITE), (SAISIE_BAS, DECALAGE_INDICATRICE_VALBAS)):
+            zone_saisie = vue_grille.VueGrille.rect_valeur(2, 3, zone)
+            self.assertEqual(zone_saisie.topleft, (rect.left + decalage[0], rect.top + decalage[1]))
+            self.assertEqual(zone_saisie.size, DIMENSION_SAISIE_INDICATRICE)
+
+    def test_case_pointee(self):
+        """ Méthode permettant de tester le comportement de case_pointee et zone_indicatrice.
+            Pour chaque point de la grille, la case et la zone calculées doivent être celles dont le rect contient le point.
+            Un point hors de la grille ne doit correspondre à aucune case.
+        """
+        for x in range(POSITION_GRILLE[0], POSITION_GRILLE[0] + self.grille.nb_colonne * COTE_IMAGE_CASE):
+            for y in range(POSITION_GRILLE[1], POSITION_GRILLE[1] + self.grille.nb_ligne * COTE_IMAGE_CASE):
+                case = vue_grille.VueGrille.case_pointee(self.grille, (x, y))
+                self.assertTrue(vue_grille.VueGrille.rect(*case).collidepoint(x, y))
+
+                if type(self.grille[case]) is cases.Indicatrice:
+                    zone = vue_grille.VueGrille.zone_indicatrice((x, y), *case)
+                    self.assertEqual(zone == SAISIE_DROITE, vue_grille.VueGrille.rect_valeur(*case, SAISIE_DROITE).collidepoint(x, y))
+                    self.assertEqual(zone == SAISIE_BAS, vue_grille.VueGrille.rect_valeur(*case, SAISIE_BAS).collidepoint(x, y))
+
+        self.assertIsNone(vue_grille.VueGrille.case_pointee(self.grille, (0, 0)))
+        self.assertIsNone(vue_grille.VueGrille.case_pointee(self.grille, (POSITION_GRILLE[0] + self.grille.nb_colonne * COTE_IMAGE_CASE, POSITION_GRILLE[1])))
+
+
+if __name__ == "__main__":
+    pygame.init()
+    unittest.main()
+    pygame.quit()
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module d'import et d'export des grilles au format texte.
+    Ce format est celui de Grille.__str__, utilisé par d'autres outils de Kakuro:
+    chaque ligne de texte contient les cases d'une ligne de la grille, séparées par des tabulations ou des espaces,
+    et les grilles d'un même fichier sont séparées par une ou plusieurs lignes vides.
+
+    Une case est écrite:
+        - pour une case noire: CASE_NOIRE_TEXTE. Les jetons de JETONS_CASE_NOIRE_TEXTE sont aussi acceptés en lecture.
+        - pour une indicatrice: bas\\droite. Une somme vide est lue comme nulle, par exemple \\16 ou 12\\.
+        - pour une case vide: sa valeur saisie ou sa solution, selon le contenu choisi, ou CASE_VIDE_TEXTE en l'absence de valeur.
+          Les jetons de JETONS_CASE_VIDE_TEXTE sont aussi acceptés en lecture.
+
+    La lecture et l'écriture se font au fil de l'eau: une seule grille est en mémoire à la fois,
+    ce qui permet de traiter des fichiers contenant un grand nombre de grilles.
+
+    Contient les fonctions suivantes:
+        - lire, ecrire
+        - charger, sauvegarder
+        - lignes
+
+    Modules importés:
+        - cases: utilisé pour créer les cases des grilles lues
+        - grille: utilisé pour créer les grilles lues
+        - exceptions: utilisé pour signaler une grille illisible
+        - constantes: utilisé par toutes les fonctions
+"""
+
+import cases
+import grille
+from exceptions import *
+from constantes import *
+
+
+def lire(flux, contenu=CONTENU_SAISIE):
+    """ Générateur parcourant les grilles du flux de texte passé en paramètre.
+        Les valeurs des cases vides sont lues comme valeurs saisies ou comme solutions, selon le contenu passé en paramètre.
+        Lève FormatTexteException, en indiquant le numéro de la ligne, si une case est illisible ou si les lignes d'une grille n'ont pas la même longueur.
+    """
+    rangees = []
+    for numero, ligne in enumerate(flux, 1):
+        jetons = ligne.split()
+        if jetons:
+            if rangees and len(jetons) != len(rangees[0]):
+                raise FormatTexteException(MESSAGE_ERREUR_FORMAT_TEXTE.format(numero))
+            rangees.append([_lire_case(jeton, contenu, numero) for jeton in jetons])
+        elif rangees:
+            yield _creer_grille(rangees)
+            rangees = []
+
+    if rangees:
+        yield _creer_grille(rangees)
+
+
+def ecrire(flux, grilles, contenu=CONTENU_SAISIE):
+    """ Écrit dans le flux de texte passé en paramètre les grilles de l'itérable donné, au fur et à mesure de leur parcours.
+        Les cases vides contiennent leur valeur saisie ou leur solution, selon le contenu passé en paramètre.
+        Retourne le nombre de grilles écrites.
+    """
+    nombre = 0
+    for grille_texte in grilles:
+        if nombre > 0:
+            flux.write("\n")
+        for ligne in lignes(grille_texte, contenu):
+            flux.write(ligne + "\n")
+        nombre += 1
+    return nombre
+
+
+def charger(chemin_fichier, contenu=CONTENU_SAISIE):
+    """ Générateur parcourant les grilles du fichier texte dont le chemin est passé en paramètre """
+    with open(chemin_fichier, "r", encoding="utf-8") as fichier:
+        yield from lire(fichier, contenu)
+
+
+def sauvegarder(grilles, chemin_fichier, contenu=CONTENU_SAISIE):
+    """ Écrit les grilles de l'itérable passé en paramètre dans le fichier texte dont le chemin est donné.
+        Retourne le nombre de grilles écrites.
+    """
+    with open(chemin_fichier, "w", encoding="utf-8") as fichier:
+        return ecrire(fichier, grilles, contenu)
+
+
+def lignes(grille_texte, contenu=CONTENU_SAISIE):
+    """ Générateur parcourant les lignes de texte, sans fin de ligne, de la grille passée en paramètre.
+        Une case absente du dictionnaire de la grille est écrite comme une case noire.
+    """
+    for j in range(grille_texte.nb_ligne):
+        yield SEPARATEUR_TEXTE.join(_ecrire_case(grille_texte._grid.get((i, j)), contenu) for i in range(grille_texte.nb_colonne))
+
+
+def _ecrire_case(case, contenu):
+    """ Retourne le jeton de la case passée en paramètre """
+    if type(case) is cases.Indicatrice:
+        return str(case.valeur_bas) + SEPARATEUR_INDICATRICE_TEXTE + str(case.valeur_droite)
+    if type(case) is cases.CaseVide:
+        valeur = case._solution_case if contenu == CONTENU_SOLUTION else case.valeur_saisie
+        return str(valeur) if VALEUR_MIN <= valeur <= VALEUR_MAX else CASE_VIDE_TEXTE
+    return CASE_NOIRE_TEXTE
+
+
+def _lire_case(jeton, contenu, numero):
+    """ Retourne la case correspondant au jeton passé en paramètre, lu à la ligne de numéro donné """
+    if SEPARATEUR_INDICATRICE_TEXTE in jeton:
+        bas, droite = jeton.split(SEPARATEUR_INDICATRICE_TEXTE, 1)
+        if not (bas.isdecimal() or bas == "") or not (droite.isdecimal() or droite == ""):
+            raise FormatTexteException(MESSAGE_ERREUR_FORMAT_TEXTE.format(numero))
+        case = cases.Indicatrice()
+        case.valeur_bas = int(bas or 0)
+        case.valeur_droite = int(droite or 0)
+        return case
+
+    if jeton.lower() in JETONS_CASE_NOIRE_TEXTE:
+        return cases.CaseNoire()
+
+    if jeton in JETONS_CASE_VIDE_TEXTE:
+        return cases.CaseVide(-1)
+
+    if len(jeton) == 1 and jeton.isdecimal():
+        if contenu == CONTENU_SOLUTION:
+            return cases.CaseVide(int(jeton))
+        case = cases.CaseVide(-1)
+        case.valeur_saisie = int(jeton)
+        return case
+
+    raise FormatTexteException(MESSAGE_ERREUR_FORMAT_TEXTE.format(numero))
+
+
+def _creer_grille(rangees):
+    """ Retourne la grille dont les cases, ligne par ligne, sont passées en paramètre """
+    resultat = grille.Grille()
+    resultat.nb_ligne, resultat.nb_colonne = len(rangees), len(rangees[0])
+    for j, rangee in enumerate(rangees):
+        for i, case in enumerate(rangee):
+            resultat[i, j] = case
+    return resultat
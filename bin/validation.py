@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant la validation incrémentale d'une grille en cours de jeu.
+
+    La méthode validate de la grille parcourt toutes ses cases et lève une exception à chaque appel.
+    La classe Validation conserve au contraire l'état des erreurs de la grille: après la saisie d'une valeur,
+    seules les plages contenant la case modifiée sont vérifiées à nouveau.
+    Le nombre de cases remplies est tenu à jour, ce qui permet de savoir en temps constant si la grille est terminée,
+    et l'erreur à afficher est conservée jusqu'à la saisie suivante.
+
+    Ce module contient une unique classe Validation.
+
+    Modules importés:
+        - cases: utilisé pour reconnaître le type des cases de la grille
+        - exceptions: utilisé pour décrire l'erreur courante de la grille
+"""
+
+import cases
+from exceptions import *
+
+
+class Validation:
+    """ Classe conservant l'état des erreurs d'une grille jouée.
+        Cette classe possède 6 attributs:
+            - grille: la grille validée
+            - erreur: l'exception décrivant l'erreur courante de la grille (DoublonException, SommeIncorrecteException ou ExceptionMixte), ou None
+            - _nb_cases: le nombre de cases vides de la grille
+            - _remplies: l'ensemble des indices des cases vides dont la valeur est saisie
+            - _doublons: l'ensemble des indices des cases vides dont la valeur est un doublon
+            - _sommes_fausses: l'ensemble des indices des indicatrices dont une somme est incorrecte
+    """
+
+    def __init__(self, grille):
+        """ Initialise la validation de la grille passée en paramètre par une vérification complète """
+        self.grille = grille
+        self.erreur = None
+        self._nb_cases = 0
+        self._remplies = set()
+        self._doublons = set()
+        self._sommes_fausses = set()
+        self.verifier_grille()
+
+    def verifier_grille(self):
+        """ Vérifie l'ensemble de la grille, comme la méthode validate, sans lever d'exception.
+            Cette méthode est appelée à la création de la validation, et lorsque toutes les valeurs de la grille ont changé (réinitialisation).
+        """
+        self._nb_cases = 0
+        self._remplies.clear()
+        self._doublons.clear()
+        self._sommes_fausses.clear()
+
+        for (i, j), case in self.grille.items():
+            if type(case) is cases.CaseVide:
+                self._nb_cases += 1
+                if case.valeur_saisie != -1:
+                    self._remplies.add((i, j))
+                self._verifier_doublon(i, j)
+
+            elif type(case) is cases.Indicatrice:
+                self._verifier_somme(i, j)
+
+        self.erreur = self._calculer_erreur()
+
+    def verifier_case(self, i, j):
+        """ Met à jour l'état des erreurs après la saisie de la case vide (i, j).
+            Seules les cases des plages ligne et colonne de la case, ainsi que les deux indicatrices de ces plages, sont vérifiées.
+            Retourne l'erreur courante de la grille, ou None.
+        """
+        if self.grille[i, j].valeur_saisie != -1:
+            self._remplies.add((i, j))
+        else:
+            self._remplies.discard((i, j))
+
+        # Le doublon d'une case dépend de ses deux plages: seules les cases partageant une plage avec la case modifiée peuvent changer
+        self._verifier_doublon(i, j)
+        for (x, y) in self.grille.ligneIndices(i, j):
+            self._verifier_doublon(x, y)
+        for (x, y) in self.grille.colonneIndices(i, j):
+            self._verifier_doublon(x, y)
+
+        for indices in self._indicatrices(i, j):
+            self._verifier_somme(*indices)
+
+        self.erreur = self._calculer_erreur()
+        return self.erreur
+
+    def terminee(self):
+        """ Retourne True si la grille est entièrement remplie et sans erreur, en temps constant """
+        return self.erreur is None and len(self._remplies) == self._nb_cases
+
+    def _verifier_doublon(self, i, j):
+        """ Met à jour l'erreur de la case vide (i, j) et l'ensemble des doublons """
+        case = self.grille[i, j]
+        case.erreur = self.grille.has_doublon(i, j)
+        if case.erreur:
+            self._doublons.add((i, j))
+        else:
+            self._doublons.discard((i, j))
+
+    def _verifier_somme(self, i, j):
+        """ Met à jour les erreurs de l'indicatrice (i, j) et l'ensemble des sommes fausses """
+        indicatrice = self.grille[i, j]
+        indicatrice.erreur_bas, indicatrice.erreur_droite = False, False
+        if self.grille.has_fausse_somme(i, j):
+            self._sommes_fausses.add((i, j))
+        else:
+            self._sommes_fausses.discard((i, j))
+
+    def _indicatrices(self, i, j):
+        """ Retourne la liste des indices des indicatrices des plages ligne et colonne de la case vide (i, j).
+            Le début de chaque plage est recherché vers la gauche et vers le haut.
+        """
+        indicatrices = []
+        for (pas_i, pas_j) in ((-1, 0), (0, -1)):
+            x, y = i + pas_i, j + pas_j
+            while (x, y) in self.grille.keys() and type(self.grille[x, y]) is cases.CaseVide:
+                x, y = x + pas_i, y + pas_j
+            if (x, y) in self.grille.keys() and type(self.grille[x, y]) is cases.Indicatrice:
+                indicatrices.append((x, y))
+        return indicatrices
+
+    def _calculer_erreur(self):
+        """ Retourne l'exception décrivant l'erreur courante de la grille, ou None si elle n'en a pas """
+        if self._doublons and self._sommes_fausses:
+            return ExceptionMixte()
+        elif self._doublons:
+            return DoublonException()
+        elif self._sommes_fausses:
+            return SommeIncorrecteException()
+        return None
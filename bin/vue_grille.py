@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+# -*- encoding: utf-8 -*
+
+""" Module contenant l'affichage en couches d'une grille.
+
+    Pendant une partie, les cases noires, les images des cases et les sommes des indicatrices ne changent pas.
+    Elles forment la couche statique de la grille, dessinée une seule fois dans une surface hors écran, et redessinée uniquement lorsque la structure de la grille change.
+    Les éléments dynamiques (valeurs saisies, sommes en erreur) sont ensuite dessinés par-dessus la couche, en un seul appel à Surface.blits.
+
+    Les cases et la grille ne dépendant pas de pygame, leur géométrie à l'écran (rect des cases et des zones de saisie des indicatrices),
+    leur dessin direct et leur saisie au clavier sont aussi réalisés par cette classe.
+
+    Contient la classe suivante:
+        - VueGrille
+
+    Modules importés:
+        - pygame: utilisé pour la surface de la couche statique, les rect des cases et la saisie
+        - cases: utilisé pour distinguer les types de cases
+        - boucle: utilisé pour attendre les événements lors d'une saisie
+        - ressources: utilisé pour obtenir les images, les polices et les textes rendus
+        - constantes: utilisé dans toutes les méthodes
+"""
+
+import pygame
+from pygame.locals import *
+import cases
+import boucle
+import ressources
+from constantes import *
+
+
+class VueGrille:
+    """ Classe modélisant l'affichage d'une grille en deux couches.
+        Cette classe possède 2 attributs:
+            - _couche: la surface contenant la couche statique de la grille, ou None si elle n'a pas encore été dessinée
+            - _structure: la signature de la structure de grille ayant servi à dessiner la couche
+    """
+
+    def __init__(self):
+        """ Initialise une vue sans couche statique. Celle-ci sera dessinée lors du premier affichage. """
+        self._couche = None
+        self._structure = None
+
+    @staticmethod
+    def position(i, j):
+        """ Retourne la position dans la fenêtre du coin haut gauche de la case (i, j) """
+        return (POSITION_GRILLE[0] + i * COTE_IMAGE_CASE, POSITION_GRILLE[1] + j * COTE_IMAGE_CASE)
+
+    @staticmethod
+    def rect(i, j):
+        """ Retourne le rect de la case (i, j) dans la fenêtre """
+        return pygame.Rect(VueGrille.position(i, j), (COTE_IMAGE_CASE, COTE_IMAGE_CASE))
+
+    @staticmethod
+    def rect_valeur(i, j, zone):
+        """ Retourne le rect de la zone de saisie (SAISIE_DROITE ou SAISIE_BAS) de l'indicatrice (i, j) dans la fenêtre.
+            La zone est décalée du coin haut gauche de la case selon DECALAGE_INDICATRICE_VALDROITE ou DECALAGE_INDICATRICE_VALBAS.
+        """
+        decalage = DECALAGE_INDICATRICE_VALDROITE if zone == SAISIE_DROITE else DECALAGE_INDICATRICE_VALBAS
+        return pygame.Rect(VueGrille.rect(i, j).move(decalage).topleft, DIMENSION_SAISIE_INDICATRICE)
+
+    @staticmethod
+    def case_pointee(grille, position):
+        """ Retourne les coordonnées (i, j) de la case de la grille située sous la position passée en paramètre, ou None.
+            Le calcul se fait directement à partir de POSITION_GRILLE et COTE_IMAGE_CASE, sans parcourir la grille.
+        """
+        x, y = position[0] - POSITION_GRILLE[0], position[1] - POSITION_GRILLE[1]
+        if x < 0 or y < 0:
+            return None
+        i, j = x // COTE_IMAGE_CASE, y // COTE_IMAGE_CASE
+        if i < grille.nb_colonne and j < grille.nb_ligne:
+            return (i, j)
+        return None
+
+    @staticmethod
+    def zone_indicatrice(position, i, j):
+        """ Retourne la zone de saisie d'indicatrice (SAISIE_DROITE ou SAISIE_BAS) de la case (i, j) située sous la position, ou None. """
+        x, y = position[0] - POSITION_GRILLE[0] - i * COTE_IMAGE_CASE, position[1] - POSITION_GRILLE[1] - j * COTE_IMAGE_CASE
+        for zone, (decalage_x, decalage_y) in ((SAISIE_DROITE, DECALAGE_INDICATRICE_VALDROITE), (SAISIE_BAS, DECALAGE_INDICATRICE_VALBAS)):
+            if 0 <= x - decalage_x < DIMENSION_SAISIE_INDICATRICE[0] and 0 <= y - decalage_y < DIMENSION_SAISIE_INDICATRICE[1]:
+                return zone
+        return None
+
+    @staticmethod
+    def structure(grille):
+        """ Retourne la signature de la structure de la grille: le type, l'identité et les sommes de chacune de ses cases.
+            Une case remplacée change donc la structure, ce qui redessine la couche.
+        """
+        signature = []
+        for (i, j), case in grille.items():
+            if type(case) is cases.Indicatrice:
+                signature.append((i, j, id(case), case.valeur_droite, case.valeur_bas))
+            else:
+                signature.append((i, j, id(case)))
+        return tuple(signature)
+
+    def preparer(self, grille):
+        """ Dessine la couche statique de la grille si sa structure a changé depuis le dernier affichage """
+        structure = VueGrille.structure(grille)
+        if structure == self._structure:
+            return
+        self._structure = structure
+
+        self._couche = pygame.Surface((grille.nb_colonne * COTE_IMAGE_CASE, grille.nb_ligne * COTE_IMAGE_CASE)).convert()
+        font_indicatrice = ressources.police(TAILLE_POLICE_INDICATRICE)
+
+        for (i, j), case in grille.items():
+            locale = (i * COTE_IMAGE_CASE, j * COTE_IMAGE_CASE)
+
+            if type(case) is cases.Indicatrice:
+                self._couche.blit(ressources.image(CHEMIN_IMAGE_INDICATRICE), locale)
+                for valeur, zone in ((case.valeur_droite, SAISIE_DROITE), (case.valeur_bas, SAISIE_BAS)):
+                    self._couche.blit(ressources.texte(font_indicatrice, str(valeur), COULEUR_POLICE), VueGrille.rect_valeur(i, j, zone).move(-POSITION_GRILLE[0], -POSITION_GRILLE[1]))
+            elif type(case) is cases.CaseVide:
+                self._couche.blit(ressources.image(CHEMIN_IMAGE_CASEVIDE), locale)
+            else:
+                self._couche.blit(ressources.image(CHEMIN_IMAGE_CASENOIRE), locale)
+
+    def superpositions(self, case, i, j):
+        """ Retourne la liste des éléments dynamiques de la case, sous la forme attendue par Surface.blits.
+            Pour une case vide, il s'agit de sa valeur saisie. Pour une indicatrice, de ses sommes en erreur, dessinées en rouge sur un morceau d'image d'indicatrice.
+        """
+        if type(case) is cases.CaseVide:
+            if case.valeur_saisie == -1:
+                return []
+            couleur = COULEUR_ERREUR if case.erreur else COULEUR_POLICE
+            valeur = ressources.texte(ressources.police(TAILLE_POLICE_CASEVIDE), str(case.valeur_saisie), couleur)
+            return [(valeur, VueGrille.rect(i, j).move(DECALAGE_SAISIE_CASE_VIDE))]
+
+        elif type(case) is cases.Indicatrice:
+            font_indicatrice = ressources.police(TAILLE_POLICE_INDICATRICE)
+            img_indicatrice = ressources.image(CHEMIN_IMAGE_INDICATRICE)
+            resultat = []
+            for erreur, valeur, zone, decalage in ((case.erreur_droite, case.valeur_droite, SAISIE_DROITE, DECALAGE_INDICATRICE_VALDROITE),
+                                                   (case.erreur_bas, case.valeur_bas, SAISIE_BAS, DECALAGE_INDICATRICE_VALBAS)):
+                if erreur:
+                    rect = VueGrille.rect_valeur(i, j, zone)
+                    # Le morceau d'image masque la somme de la couche statique, qui peut déborder de la zone de saisie
+                    masque = pygame.Rect(decalage, DIMENSION_SAISIE_INDICATRICE).union(pygame.Rect(decalage, ressources.texte(font_indicatrice, str(valeur), COULEUR_POLICE).get_size()))
+                    resultat.append((img_indicatrice, rect, masque))
+                    resultat.append((ressources.texte(font_indicatrice, str(valeur), COULEUR_ERREUR), rect))
+            return resultat
+
+        return []
+
+    def afficher(self, fenetre, grille):
+        """ Affiche la grille entière: la couche statique, puis l'ensemble des éléments dynamiques en un seul appel à blits.
+            Retourne le rect de la zone dessinée.
+        """
+        self.preparer(grille)
+        rect = fenetre.blit(self._couche, POSITION_GRILLE)
+        fenetre.blits([element for (i, j), case in grille.items() for element in self.superpositions(case, i, j)], False)
+        return rect
+
+    def afficher_case(self, fenetre, grille, i, j):
+        """ Affiche la seule case (i, j): sa partie de la couche statique, puis ses éléments dynamiques.
+            La couche doit avoir été préparée pour la structure actuelle de la grille. Retourne le rect de la case.
+        """
+        rect = VueGrille.rect(i, j)
+        fenetre.blit(self._couche, rect, rect.move(-POSITION_GRILLE[0], -POSITION_GRILLE[1]))
+        fenetre.blits(self.superpositions(grille[i, j], i, j), False)
+        return rect
+
+    @staticmethod
+    def dessiner(fenetre, grille):
+        """ Dessine directement chacune des cases de la grille, sans couche statique.
+            Les images des cases sont affichées à partir de POSITION_GRILLE, puis les sommes des indicatrices et les valeurs saisies,
+            dans la couleur d'erreur lorsque la case ou la plage est en erreur.
+        """
+        for (i, j), case in grille.items():
+            rect = VueGrille.rect(i, j)
+            if type(case) is cases.Indicatrice:
+                fenetre.blit(ressources.image(CHEMIN_IMAGE_INDICATRICE), rect)
+                font_indicatrice = ressources.police(TAILLE_POLICE_INDICATRICE)
+                for erreur, valeur, zone in ((case.erreur_droite, case.valeur_droite, SAISIE_DROITE), (case.erreur_bas, case.valeur_bas, SAISIE_BAS)):
+                    couleur = COULEUR_ERREUR if erreur else COULEUR_POLICE
+                    fenetre.blit(ressources.texte(font_indicatrice, str(valeur), couleur), VueGrille.rect_valeur(i, j, zone))
+            elif type(case) is cases.CaseVide:
+                fenetre.blit(ressources.image(CHEMIN_IMAGE_CASEVIDE), rect)
+                if case.valeur_saisie != -1:
+                    couleur = COULEUR_ERREUR if case.erreur else COULEUR_POLICE
+                    fenetre.blit(ressources.texte(ressources.police(TAILLE_POLICE_CASEVIDE), str(case.valeur_saisie), couleur), rect.move(DECALAGE_SAISIE_CASE_VIDE))
+            else:
+                fenetre.blit(ressources.image(CHEMIN_IMAGE_CASENOIRE), rect)
+
+    @staticmethod
+    def saisir_valeur(fenetre, grille, i, j):
+        """ Propose une zone de saisie dans la case vide (i, j) de la grille, et initialise sa valeur_saisie.
+            L'utilisateur peut entrer des valeurs numériques entre 1 et 9.
+            Un clic, ou la pression de la touche entrée permettent de quitter la saisie.
+            La pression de la touche backspace permet d'effacer la saisie.
+        """
+        case, rect = grille[i, j], VueGrille.rect(i, j)
+        font_saisie = ressources.police(TAILLE_POLICE_CASEVIDE)
+
+        # Montre a l'utilisateur qu'il a cliqué une case
+        fenetre.fill(COULEUR_FOND_CASE, rect)
+        pygame.display.flip()
+
+        while True:
+            for event in boucle.evenements():
+
+                # Sortie du jeu
+                if event.type == QUIT:
+                    pygame.quit()
+
+                # Sortie de la saisie
+                elif event.type == MOUSEBUTTONUP:
+                    return
+
+                # Saisie et validation
+                elif event.type == KEYDOWN:
+                    if event.unicode.isnumeric() and event.unicode != "0":
+                        case.valeur_saisie = int(event.unicode)
+                    elif event.key == K_BACKSPACE:
+                        case.valeur_saisie = -1
+                    elif event.key == K_RETURN:
+                        return
+
+                fenetre.fill(COULEUR_FOND_CASE, rect)
+                # Affichage de la valeur dans la case
+                if case.valeur_saisie != -1:
+                    fenetre.blit(ressources.texte(font_saisie, str(case.valeur_saisie), COULEUR_POLICE), rect.move(DECALAGE_SAISIE_CASE_VIDE))
+                pygame.display.flip()
+
+    @staticmethod
+    def saisir_indicatrice(fenetre, i, j, zone):
+        """ Propose une saisie au clavier dans la zone (SAISIE_DROITE ou SAISIE_BAS) de l'indicatrice (i, j).
+            Retourne la valeur saisie, d'au plus deux chiffres, ou -1 si la saisie est vide.
+            Un clic, ou la pression de la touche entrée permettent de quitter la saisie.
+        """
+        rect = VueGrille.rect_valeur(i, j, zone)
+        font_saisie = ressources.police(TAILLE_POLICE_INDICATRICE)
+
+        valeur = ""
+        continuer = True
+        while continuer:
+            for event in boucle.evenements():
+
+                if event.type == QUIT:
+                    pygame.quit()
+                elif event.type == MOUSEBUTTONUP:
+                    continuer = False
+
+                elif event.type == KEYDOWN:
+
+                    if event.unicode.isnumeric() and len(valeur) < 2:
+                        valeur += event.unicode
+                    elif event.key == K_BACKSPACE:
+                        valeur = valeur[:-1]
+                    elif event.key == K_RETURN:
+                        continuer = False
+
+                fenetre.fill(COULEUR_FOND_CASE, rect)
+                fenetre.blit(ressources.texte(font_saisie, valeur, COULEUR_SAISIE_INDICATRICE), rect)
+                pygame.display.flip()
+
+        if valeur != "":
+            return int(valeur)
+        else:
+            return -1